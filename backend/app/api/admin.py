@@ -1,6 +1,5 @@
 """Admin API endpoints for managing users, bookmarks, widgets, sections, and habits."""
 
-import json
 import time
 import uuid
 from datetime import datetime
@@ -8,7 +7,7 @@ from typing import Generic, List, Optional, TypeVar
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from pydantic import BaseModel, Field
-from sqlalchemy import func, select, text
+from sqlalchemy import delete, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import require_admin
@@ -27,8 +26,10 @@ from app.models.preference import Preference, PreferenceResponse, PreferenceUpda
 from app.models.section import Section, SectionCreate, SectionResponse, SectionUpdate
 from app.models.user import User, UserResponse, UserRole, UserUpdate
 from app.models.widget import Widget, WidgetResponse, WidgetUpdate
+from app.services.cache import cache_service, widget_list_cache_key
 from app.services.database import get_db
 from app.services.rate_limit import limiter
+from app.services.section_service import invalidate_sections_cache
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -37,6 +38,21 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 DEFAULT_PAGE_SIZE = 50
 MAX_PAGE_SIZE = 100
 
+# Columns needed to serialize a widget, selected without constructing ORM instances
+_SELECT_WIDGET_COLUMNS = select(
+    Widget.widget_id,
+    Widget.widget_type,
+    Widget.enabled,
+    Widget.position_row,
+    Widget.position_col,
+    Widget.position_width,
+    Widget.position_height,
+    Widget.refresh_interval,
+    Widget.config,
+    Widget.created,
+    Widget.updated,
+)
+
 T = TypeVar("T")
 
 
@@ -273,6 +289,7 @@ async def delete_user(
 
     await db.delete(user)
     await db.commit()
+    invalidate_sections_cache(user_id)
 
     logger.info(
         "Admin deleted user",
@@ -535,14 +552,13 @@ async def list_all_widgets(
     total_pages = (total + page_size - 1) // page_size if total > 0 else 1
 
     # Get paginated results
-    query = select(Widget).order_by(Widget.created.desc())
+    query = _SELECT_WIDGET_COLUMNS.order_by(Widget.created.desc())
     if user_id is not None:
         query = query.where(Widget.user_id == user_id)
     query = query.offset(offset).limit(page_size)
     result = await db.execute(query)
-    widgets = result.scalars().all()
 
-    items = [widget.to_dict() for widget in widgets]
+    items = [Widget.serialize(row) for row in result]
 
     return PaginatedResponse(
         items=items,
@@ -572,8 +588,10 @@ async def delete_widget(
     Returns:
         Success message
     """
-    result = await db.execute(select(Widget).where(Widget.widget_id == widget_id))
-    widget = result.scalar_one_or_none()
+    result = await db.execute(
+        delete(Widget).where(Widget.widget_id == widget_id).returning(Widget.user_id)
+    )
+    widget = result.one_or_none()
 
     if not widget:
         raise HTTPException(
@@ -581,8 +599,8 @@ async def delete_widget(
             detail="Widget not found",
         )
 
-    await db.delete(widget)
     await db.commit()
+    await cache_service.delete(widget_list_cache_key(widget.user_id))
 
     logger.info(
         "Admin deleted widget",
@@ -639,10 +657,11 @@ async def update_widget(
     if widget_update.refresh_interval is not None:
         widget.refresh_interval = widget_update.refresh_interval
     if widget_update.config is not None:
-        widget.config = json.dumps(widget_update.config)
+        widget.config = widget_update.config
 
     await db.commit()
     await db.refresh(widget)
+    await cache_service.delete(widget_list_cache_key(widget.user_id))
 
     logger.info(
         "Admin updated widget",
@@ -978,6 +997,7 @@ async def create_section(
     db.add(section)
     await db.commit()
     await db.refresh(section)
+    invalidate_sections_cache(section.user_id)
 
     logger.info(
         "Admin created section",
@@ -1043,6 +1063,7 @@ async def update_section(
 
     await db.commit()
     await db.refresh(section)
+    invalidate_sections_cache(section.user_id)
 
     logger.info(
         "Admin updated section",
@@ -1086,24 +1107,27 @@ async def delete_section(
     Returns:
         Success message
     """
-    result = await db.execute(select(Section).where(Section.id == section_id))
-    section = result.scalar_one_or_none()
+    # Single DELETE ... RETURNING round-trip instead of SELECT + DELETE
+    result = await db.execute(
+        delete(Section).where(Section.id == section_id).returning(Section.user_id)
+    )
+    section_user_id = result.scalar_one_or_none()
 
-    if not section:
+    if section_user_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Section not found",
         )
 
-    await db.delete(section)
     await db.commit()
+    invalidate_sections_cache(section_user_id)
 
     logger.info(
         "Admin deleted section",
         extra={
             "admin_id": current_user.id,
             "section_id": section_id,
-            "section_user_id": section.user_id,
+            "section_user_id": section_user_id,
         },
     )
 
@@ -1629,15 +1653,22 @@ class SystemStatusResponse(BaseModel):
     timestamp: str = Field(description="Status check timestamp")
 
 
+class DatabasePoolStatusResponse(BaseModel):
+    """Database connection pool status."""
+
+    pool_class: str = Field(description="Connection pool implementation")
+    status: str = Field(description="Pool status summary")
+
+
 # Store startup time for uptime calculation
 _startup_time: Optional[float] = None
 
 
 def get_startup_time() -> float:
-    """Get the application startup time."""
+    """Get the application startup time, as a time.monotonic() timestamp."""
     global _startup_time
     if _startup_time is None:
-        _startup_time = time.time()
+        _startup_time = time.monotonic()
     return _startup_time
 
 
@@ -1682,18 +1713,18 @@ async def get_system_status(
     )
 
     # Check database status
-    db_start = time.time()
+    db_start = time.perf_counter_ns()
     try:
         # Execute a simple query to test database connectivity
         await db.execute(text("SELECT 1"))
-        db_response_time = (time.time() - db_start) * 1000
+        db_response_time = (time.perf_counter_ns() - db_start) / 1_000_000
         database_status = ServiceStatus(
             status="healthy",
             message="Database connection is active",
             response_time_ms=round(db_response_time, 2),
         )
     except Exception as e:
-        db_response_time = (time.time() - db_start) * 1000
+        db_response_time = (time.perf_counter_ns() - db_start) / 1_000_000
         logger.error(
             "Database health check failed",
             extra={"error_type": type(e).__name__, "error": str(e)},
@@ -1705,19 +1736,19 @@ async def get_system_status(
         )
 
     # Check Redis status using the public health_check method
-    redis_start = time.time()
+    redis_start = time.perf_counter_ns()
     try:
         from app.services.cache import cache_service
 
         health_result = await cache_service.health_check()
-        redis_response_time = (time.time() - redis_start) * 1000
+        redis_response_time = (time.perf_counter_ns() - redis_start) / 1_000_000
         redis_status = ServiceStatus(
             status=health_result["status"],
             message=health_result["message"],
             response_time_ms=round(redis_response_time, 2) if health_result["connected"] else None,
         )
     except Exception as e:
-        redis_response_time = (time.time() - redis_start) * 1000
+        redis_response_time = (time.perf_counter_ns() - redis_start) / 1_000_000
         logger.warning(
             "Redis health check failed",
             extra={"error_type": type(e).__name__, "error": str(e)},
@@ -1729,7 +1760,7 @@ async def get_system_status(
         )
 
     # Calculate uptime
-    uptime_seconds = time.time() - get_startup_time()
+    uptime_seconds = time.monotonic() - get_startup_time()
 
     return SystemStatusResponse(
         backend=backend_status,
@@ -1739,3 +1770,29 @@ async def get_system_status(
         version=settings.APP_VERSION,
         timestamp=datetime.utcnow().isoformat(),
     )
+
+
+@router.get("/db-pool", response_model=DatabasePoolStatusResponse)
+@limiter.limit("30/minute")
+async def get_database_pool_status(
+    request: Request,
+    current_user: User = Depends(require_admin),
+):
+    """Get database connection pool status (admin only).
+
+    Args:
+        request: HTTP request
+        current_user: Current authenticated admin user
+
+    Returns:
+        Connection pool class and status summary
+    """
+    from app.services.database import engine
+
+    pool = engine.pool
+    logger.info(
+        "Admin checking database pool status",
+        extra={"admin_id": current_user.id, "pool_class": type(pool).__name__},
+    )
+
+    return DatabasePoolStatusResponse(pool_class=type(pool).__name__, status=pool.status())
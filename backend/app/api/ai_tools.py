@@ -68,7 +68,7 @@ async def process_ai_tool_async(
                 update_data = NoteUpdate(content=ai_response)
                 await note_service.update_note(subnote_id, update_data, user_id)
                 await db.commit()
-                logger.info(f"Successfully processed AI tool for subnote {subnote_id}")
+                logger.info("Successfully processed AI tool for subnote %s", subnote_id)
             except Exception as e:
                 await db.rollback()
                 logger.error(f"Error updating subnote {subnote_id}: {str(e)}")
@@ -154,7 +154,7 @@ async def create_tool(
     """Create a new AI tool."""
     service = AIToolService(db)
     tool = await service.create_tool(tool_data, current_user.id)
-    logger.info(f"User {current_user.id} created AI tool {tool.id}")
+    logger.info("User %s created AI tool %s", current_user.id, tool.id)
     return tool
 
 
@@ -172,7 +172,7 @@ async def update_tool(
     tool = await service.update_tool(tool_id, tool_data, current_user.id)
     if not tool:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found")
-    logger.info(f"User {current_user.id} updated AI tool {tool_id}")
+    logger.info("User %s updated AI tool %s", current_user.id, tool_id)
     return tool
 
 
@@ -189,7 +189,7 @@ async def delete_tool(
     success = await service.delete_tool(tool_id, current_user.id)
     if not success:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tool not found")
-    logger.info(f"User {current_user.id} deleted AI tool {tool_id}")
+    logger.info("User %s deleted AI tool %s", current_user.id, tool_id)
     return None
 
 
@@ -263,7 +263,11 @@ The AI is analyzing your note. This may take a few minutes. Refresh the page to
     )
 
     logger.info(
-        f"User {current_user.id} initiated AI tool {tool.id} on note {note.id}, created subnote {subnote.id}"
+        "User %s initiated AI tool %s on note %s, created subnote %s",
+        current_user.id,
+        tool.id,
+        note.id,
+        subnote.id,
     )
 
     return {
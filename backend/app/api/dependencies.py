@@ -78,6 +78,10 @@ async def get_current_user(
             status_code=status.HTTP_403_FORBIDDEN, detail="User account is inactive"
         )
 
+    # End the read transaction so the pooled connection is not held while the endpoint
+    # awaits external I/O. The session stays usable and the user stays attached.
+    await db.commit()
+
     return user
 
 
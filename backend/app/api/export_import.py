@@ -18,9 +18,11 @@ from app.models.preference import Preference
 from app.models.section import Section
 from app.models.user import User
 from app.models.widget import Widget
+from app.services.cache import cache_service, widget_list_cache_key
 from app.services.database import get_db
 from app.services.export_import_service import ExportImportService
 from app.services.rate_limit import limiter
+from app.services.section_service import invalidate_sections_cache
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -374,7 +376,7 @@ async def _import_user_data(db: AsyncSession, user_id: int, data: dict) -> dict:
             position_width=position.get("width", 1) if isinstance(position, dict) else 1,
             position_height=position.get("height", 1) if isinstance(position, dict) else 1,
             refresh_interval=widget_data.get("refresh_interval", 300),
-            config=json.dumps(config) if isinstance(config, dict) else "{}",
+            config=config if isinstance(config, dict) else {},
         )
         db.add(widget)
         imported_widgets += 1
@@ -446,6 +448,8 @@ async def _import_user_data(db: AsyncSession, user_id: int, data: dict) -> dict:
                 imported_habit_completions += 1
 
     await db.commit()
+    invalidate_sections_cache(user_id)
+    await cache_service.delete(widget_list_cache_key(user_id))
 
     return {
         "imported_bookmarks": imported_bookmarks,
@@ -100,7 +100,8 @@ async def create_habit(
         await db.refresh(habit)
 
         logger.info(
-            f"Created habit: {habit_id}",
+            "Created habit: %s",
+            habit_id,
             extra={"user_id": current_user.id, "habit_id": habit_id},
         )
 
@@ -203,7 +204,8 @@ async def update_habit(
         await db.refresh(habit)
 
         logger.info(
-            f"Updated habit: {habit_id}",
+            "Updated habit: %s",
+            habit_id,
             extra={"user_id": current_user.id, "habit_id": habit_id},
         )
 
@@ -252,7 +254,8 @@ async def delete_habit(
         await db.commit()
 
         logger.info(
-            f"Deleted habit: {habit_id}",
+            "Deleted habit: %s",
+            habit_id,
             extra={"user_id": current_user.id, "habit_id": habit_id},
         )
     except HTTPException:
@@ -276,7 +279,7 @@ async def _clear_habit_widget_cache(
         user_id: User ID for logging
     """
     # Find all widgets in the registry
-    for widget_id, widget in registry._widget_instances.items():
+    for widget_id, widget in registry.get_all_widgets().items():
         # Check if this is a habit_tracking widget using this habit
         if (
             widget.widget_type == "habit_tracking"
@@ -351,7 +354,9 @@ async def toggle_habit_completion(
             await db.refresh(existing_completion)
 
             logger.info(
-                f"Updated habit completion: {completion_data.habit_id} on {completion_date}",
+                "Updated habit completion: %s on %s",
+                completion_data.habit_id,
+                completion_date,
                 extra={
                     "user_id": current_user.id,
                     "habit_id": completion_data.habit_id,
@@ -385,7 +390,9 @@ async def toggle_habit_completion(
             await db.refresh(new_completion)
 
             logger.info(
-                f"Created habit completion: {completion_data.habit_id} on {completion_date}",
+                "Created habit completion: %s on %s",
+                completion_data.habit_id,
+                completion_date,
                 extra={
                     "user_id": current_user.id,
                     "habit_id": completion_data.habit_id,
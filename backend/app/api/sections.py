@@ -1,40 +1,86 @@
 """API endpoints for widget sections."""
 
+import logging
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import require_auth
 from app.logging_config import get_logger
-from app.models.section import SectionCreate, SectionOrderUpdate, SectionResponse, SectionUpdate
+from app.models.section import (
+    Section,
+    SectionCreate,
+    SectionOrderUpdate,
+    SectionResponse,
+    SectionUpdate,
+)
 from app.models.user import User
 from app.services.database import get_db
-from app.services.rate_limit import limiter
-from app.services.section_service import SectionService, initialize_default_sections
+from app.services.rate_limit import token_bucket_limit
+from app.services.section_service import SectionService, get_cached_sections, set_cached_sections
+from app.utils.etag import ETAG_CACHE_CONTROL, compute_etag, is_not_modified
 
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/sections", tags=["sections"])
 
 
-@router.get("/", response_model=List[SectionResponse])
-@limiter.limit("100/minute")
+def _to_response(section: Section) -> SectionResponse:
+    """Build a section response without re-validating trusted database values."""
+    return SectionResponse.model_construct(**section.to_dict())
+
+
+def _not_modified(etag: str) -> Response:
+    """Build a body-less 304 response for a matching If-None-Match."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL})
+
+
+@router.get(
+    "/",
+    response_model=List[SectionResponse],
+    dependencies=[Depends(token_bucket_limit("100/minute"))],
+)
 async def get_sections(
-    request: Request, db: AsyncSession = Depends(get_db), current_user: User = Depends(require_auth)
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_auth),
 ):
     """Get all sections for the current user ordered by position."""
-    logger.debug("Listing all sections", extra={"user_id": current_user.id})
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("Listing all sections", extra={"user_id": current_user.id})
+
+    cached = get_cached_sections(current_user.id)
+    if cached is not None:
+        section_dicts, etag = cached
+        if debug_enabled:
+            logger.debug(
+                "Sections cache hit",
+                extra={"count": len(section_dicts), "user_id": current_user.id},
+            )
+    else:
+        service = SectionService(db)
+        section_dicts = await service.list_section_dicts(user_id=current_user.id)
+        etag = set_cached_sections(current_user.id, section_dicts)
 
-    service = SectionService(db)
-    sections = await service.list_sections(user_id=current_user.id)
+        logger.info(
+            "Sections retrieved", extra={"count": len(section_dicts), "user_id": current_user.id}
+        )
 
-    logger.info("Sections retrieved", extra={"count": len(sections), "user_id": current_user.id})
+    if is_not_modified(request, etag):
+        return _not_modified(etag)
 
-    return [SectionResponse(**section.to_dict()) for section in sections]
+    # Section dicts are serialized from trusted database values, so skip response_model
+    # validation by returning the response directly
+    return ORJSONResponse(
+        section_dicts, headers={"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+    )
 
 
-@router.post("/", response_model=SectionResponse)
-@limiter.limit("20/minute")
+@router.post(
+    "/", response_model=SectionResponse, dependencies=[Depends(token_bucket_limit("20/minute"))]
+)
 async def create_section(
     request: Request, section_data: SectionCreate, db: AsyncSession = Depends(get_db)
 ):
@@ -59,11 +105,14 @@ async def create_section(
         extra={"section_id": section.id, "section_name": section.name, "operation": "create"},
     )
 
-    return SectionResponse(**section.to_dict())
+    return _to_response(section)
 
 
-@router.put("/reorder", response_model=List[SectionResponse])
-@limiter.limit("20/minute")
+@router.put(
+    "/reorder",
+    response_model=List[SectionResponse],
+    dependencies=[Depends(token_bucket_limit("20/minute"))],
+)
 async def reorder_sections(
     request: Request,
     order_data: SectionOrderUpdate,
@@ -73,59 +122,50 @@ async def reorder_sections(
     """Update the order of multiple sections for the current user."""
     logger.info(
         "Reordering sections",
-        extra={"section_count": len(order_data.sections), "user_id": current_user.id, "operation": "update"},
+        extra={
+            "section_count": len(order_data.sections),
+            "user_id": current_user.id,
+            "operation": "update",
+        },
     )
 
-    # Validate input
-    if not order_data.sections:
-        logger.warning("Sections reorder failed - empty list provided")
-        raise HTTPException(status_code=400, detail="Sections list cannot be empty")
-
-    # Validate each section in the list
-    for section_order in order_data.sections:
-        if "name" not in section_order or "position" not in section_order:
-            logger.warning(
-                "Sections reorder validation failed - missing required fields",
-                extra={"section_order": section_order},
-            )
-            raise HTTPException(
-                status_code=400, detail="Each section must have 'name' and 'position' fields"
-            )
-        if not isinstance(section_order["position"], int) or section_order["position"] < 0:
-            logger.warning(
-                "Sections reorder validation failed - invalid position",
-                extra={"position": section_order.get("position")},
-            )
-            raise HTTPException(status_code=400, detail="Position must be a non-negative integer")
-
     service = SectionService(db)
 
     # Verify all sections exist before updating (for the current user)
-    all_sections = await service.list_sections(user_id=current_user.id)
-    section_names = {section.name for section in all_sections}
-
-    for section_order in order_data.sections:
-        section_name = section_order["name"]
-        if section_name not in section_names:
-            logger.warning("Section not found for reorder", extra={"section_name": section_name})
-            raise HTTPException(status_code=404, detail=f"Section '{section_name}' not found")
+    names = [section_order.name for section_order in order_data.sections]
+    missing = set(names) - await service.existing_names(names, user_id=current_user.id)
+    if missing:
+        missing_names = ", ".join(sorted(missing))
+        logger.warning("Sections not found for reorder", extra={"section_names": missing_names})
+        raise HTTPException(status_code=404, detail=f"Sections not found: {missing_names}")
 
     # Update positions
     updated_sections = await service.reorder_sections(order_data.sections, user_id=current_user.id)
 
     logger.info(
         "Sections reordered successfully",
-        extra={"section_count": len(updated_sections), "user_id": current_user.id, "operation": "update"},
+        extra={
+            "section_count": len(updated_sections),
+            "user_id": current_user.id,
+            "operation": "update",
+        },
     )
 
-    return [SectionResponse(**section.to_dict()) for section in updated_sections]
+    return [_to_response(section) for section in updated_sections]
 
 
-@router.get("/{section_id}", response_model=SectionResponse)
-@limiter.limit("100/minute")
-async def get_section(request: Request, section_id: int, db: AsyncSession = Depends(get_db)):
+@router.get(
+    "/{section_id}",
+    response_model=SectionResponse,
+    dependencies=[Depends(token_bucket_limit("100/minute"))],
+)
+async def get_section(
+    request: Request, response: Response, section_id: int, db: AsyncSession = Depends(get_db)
+):
     """Get a specific section by ID."""
-    logger.debug("Getting section", extra={"section_id": section_id})
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("Getting section", extra={"section_id": section_id})
 
     service = SectionService(db)
     section = await service.get_section(section_id)
@@ -134,15 +174,26 @@ async def get_section(request: Request, section_id: int, db: AsyncSession = Depe
         logger.warning("Section not found", extra={"section_id": section_id})
         raise HTTPException(status_code=404, detail="Section not found")
 
-    logger.debug(
-        "Section retrieved", extra={"section_id": section_id, "section_name": section.name}
-    )
+    if debug_enabled:
+        logger.debug(
+            "Section retrieved", extra={"section_id": section_id, "section_name": section.name}
+        )
+
+    section_dict = section.to_dict()
+    etag = compute_etag(section_dict)
+    if is_not_modified(request, etag):
+        return _not_modified(etag)
 
-    return SectionResponse(**section.to_dict())
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = ETAG_CACHE_CONTROL
+    return SectionResponse.model_construct(**section_dict)
 
 
-@router.put("/{section_id}", response_model=SectionResponse)
-@limiter.limit("20/minute")
+@router.put(
+    "/{section_id}",
+    response_model=SectionResponse,
+    dependencies=[Depends(token_bucket_limit("20/minute"))],
+)
 async def update_section(
     request: Request,
     section_id: int,
@@ -164,11 +215,10 @@ async def update_section(
         extra={"section_id": section_id, "section_name": section.name, "operation": "update"},
     )
 
-    return SectionResponse(**section.to_dict())
+    return _to_response(section)
 
 
-@router.delete("/{section_id}")
-@limiter.limit("20/minute")
+@router.delete("/{section_id}", dependencies=[Depends(token_bucket_limit("20/minute"))])
 async def delete_section(request: Request, section_id: int, db: AsyncSession = Depends(get_db)):
     """Delete a section."""
     logger.info("Deleting section", extra={"section_id": section_id, "operation": "delete"})
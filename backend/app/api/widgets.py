@@ -1,54 +1,132 @@
 """Widget API endpoints."""
 
-import json
+import asyncio
+import logging
+import time
 import uuid
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import ValidationError
-from sqlalchemy import delete, func, select, text
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import require_auth
-from app.logging_config import get_logger
+from app.constants import (
+    WIDGET_LIST_CACHE_TTL,
+    WIDGET_LIST_STALE_TTL,
+    WIDGET_RELOAD_OFFLOAD_THRESHOLD,
+    WIDGET_RELOAD_YIELD_PER,
+)
+from app.logging_config import get_logger, log_event
 from app.models.user import User
 from app.models.widget import Widget, WidgetCreate, WidgetResponse, WidgetUpdate
 from app.models.widget_configs import validate_widget_config
-from app.services.cache import CacheService, get_cache_service
+from app.services.cache import CacheService, get_cache_service, widget_list_cache_key
 from app.services.database import get_db
 from app.services.rate_limit import limiter
+from app.services.single_flight import widget_data_flight
 from app.services.widget_registry import WidgetRegistry, get_widget_registry
+from app.utils.etag import ETAG_CACHE_CONTROL, compute_etag, compute_etag_bytes, is_not_modified
 from app.utils.logging import sanitize_log_dict
+from app.widgets.base_widget import BaseWidget
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+# Columns needed to serialize a widget, selected without constructing ORM instances
+_SELECT_WIDGET_COLUMNS_BY_USER = select(
+    Widget.widget_id,
+    Widget.widget_type,
+    Widget.enabled,
+    Widget.position_row,
+    Widget.position_col,
+    Widget.position_width,
+    Widget.position_height,
+    Widget.refresh_interval,
+    Widget.config,
+    Widget.created,
+    Widget.updated,
+).where(Widget.user_id == bindparam("user_id"))
+
+# Columns needed to build registry widget instances
+_SELECT_INSTANCE_COLUMNS = select(
+    Widget.widget_id,
+    Widget.widget_type,
+    Widget.user_id,
+    Widget.enabled,
+    Widget.position_row,
+    Widget.position_col,
+    Widget.position_width,
+    Widget.position_height,
+    Widget.refresh_interval,
+    Widget.config,
+)
+
 
 @router.get("/", response_model=List[WidgetResponse])
 @limiter.limit("100/minute")
 async def list_widgets(
-    request: Request, db: AsyncSession = Depends(get_db), current_user: User = Depends(require_auth)
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    cache: CacheService = Depends(get_cache_service),
+    current_user: User = Depends(require_auth),
 ):
     """
     List all widget configurations from database.
 
+    Responses are cached in Redis per user. A cached list is served while fresh and
+    kept as a stale fallback for when the database query fails.
+
     Args:
         db: Database session
+        cache: Cache service instance
 
     Returns:
         List of widget configurations
     """
     logger.debug("Listing all widget configurations", extra={"user_id": current_user.id})
 
-    result = await db.execute(select(Widget).where(Widget.user_id == current_user.id))
-    widgets = result.scalars().all()
+    cache_key = widget_list_cache_key(current_user.id)
+    cached = await cache.get(cache_key)
+    if cached and time.time() - cached["ts"] < WIDGET_LIST_CACHE_TTL:
+        logger.debug(
+            "Widget list cache hit", extra={"user_id": current_user.id, "cache_key": cache_key}
+        )
+        return _conditional_response(request, cached["json"].encode(), cached["etag"])
+
+    try:
+        result = await db.execute(_SELECT_WIDGET_COLUMNS_BY_USER, {"user_id": current_user.id})
+        rows = result.all()
+    except SQLAlchemyError as e:
+        if not cached:
+            raise
+        logger.warning(
+            "Serving stale widget list after database error",
+            extra={"user_id": current_user.id, "error_type": type(e).__name__},
+        )
+        return _conditional_response(request, cached["json"].encode(), cached["etag"])
+
+    # Rows are serialized from trusted database values, so skip response_model validation
+    # and encode the JSON body once; it is cached encoded so hits skip decoding and
+    # re-encoding the list
+    body = orjson.dumps([Widget.serialize(row) for row in rows])
+    etag = compute_etag_bytes(body)
+    await cache.set(
+        cache_key,
+        {"ts": time.time(), "json": body.decode(), "etag": etag},
+        ttl=WIDGET_LIST_STALE_TTL,
+    )
 
     logger.info(
-        "Widget configurations retrieved", extra={"count": len(widgets), "user_id": current_user.id}
+        "Widget configurations retrieved", extra={"count": len(rows), "user_id": current_user.id}
     )
 
-    return [WidgetResponse(**widget.to_dict()) for widget in widgets]
+    return _conditional_response(request, body, etag)
 
 
 @router.get("/types")
@@ -120,6 +198,62 @@ async def get_widget_config(
     }
 
 
+def _conditional_response(request: Request, body: Any, etag: Optional[str] = None) -> Response:
+    """
+    Build a JSON response carrying an ETag, or a 304 if the client's copy is current.
+
+    Args:
+        request: Incoming HTTP request
+        body: JSON-serializable response payload, or an already encoded JSON body
+        etag: Precomputed ETag of body, computed here if not given
+
+    Returns:
+        304 Not Modified response or JSON response with ETag headers
+    """
+    if etag is None:
+        etag = compute_etag(body)
+    headers = {"ETag": etag, "Cache-Control": ETAG_CACHE_CONTROL}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    if isinstance(body, bytes):
+        return Response(body, media_type="application/json", headers=headers)
+    return ORJSONResponse(body, headers=headers)
+
+
+async def _fetch_and_cache_widget_data(widget: BaseWidget, cache: CacheService) -> dict:
+    """
+    Fetch widget data from its source and cache it if the fetch succeeded.
+
+    Args:
+        widget: Widget instance
+        cache: Cache service instance
+
+    Returns:
+        Widget data
+    """
+    data = await widget.get_data()
+
+    # Cache the result if no error
+    if not data.get("error"):
+        await cache.set(widget.get_cache_key(), data, ttl=widget.refresh_interval)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Widget data cached",
+                extra={
+                    "widget_id": widget.widget_id,
+                    "cache_key": widget.get_cache_key(),
+                    "ttl": widget.refresh_interval,
+                },
+            )
+    else:
+        logger.warning(
+            "Widget data fetch returned error",
+            extra={"widget_id": widget.widget_id, "error": data.get("error")},
+        )
+
+    return data
+
+
 @router.get("/{widget_id}/data")
 @limiter.limit("60/minute")
 async def get_widget_data(
@@ -144,14 +278,15 @@ async def get_widget_data(
     Returns:
         Widget data
     """
-    logger.debug(
-        "Getting widget data",
-        extra={
-            "widget_id": widget_id,
-            "force_refresh": force_refresh,
-            "user_id": current_user.id,
-        },
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Getting widget data",
+            extra={
+                "widget_id": widget_id,
+                "force_refresh": force_refresh,
+                "user_id": current_user.id,
+            },
+        )
 
     widget = registry.get_widget(widget_id)
 
@@ -166,37 +301,15 @@ async def get_widget_data(
     if not force_refresh:
         cached_data = await cache.get(widget.get_cache_key())
         if cached_data:
-            logger.debug(
-                "Widget data cache hit",
-                extra={"widget_id": widget_id, "cache_key": widget.get_cache_key()},
-            )
-            return cached_data
+            log_event(widget_id=widget_id, widget_type=widget.widget_type, cache_hit=True)
+            return _conditional_response(request, cached_data)
 
-    # Fetch fresh data
-    logger.info(
-        "Fetching fresh widget data",
-        extra={"widget_id": widget_id, "widget_type": widget.widget_type},
+    # Fetch fresh data, sharing the fetch with concurrent requests for this widget
+    log_event(widget_id=widget_id, widget_type=widget.widget_type, cache_hit=False)
+    data = await widget_data_flight.do(
+        widget.get_cache_key(), lambda: _fetch_and_cache_widget_data(widget, cache)
     )
-    data = await widget.get_data()
-
-    # Cache the result if no error
-    if not data.get("error"):
-        await cache.set(widget.get_cache_key(), data, ttl=widget.refresh_interval)
-        logger.debug(
-            "Widget data cached",
-            extra={
-                "widget_id": widget_id,
-                "cache_key": widget.get_cache_key(),
-                "ttl": widget.refresh_interval,
-            },
-        )
-    else:
-        logger.warning(
-            "Widget data fetch returned error",
-            extra={"widget_id": widget_id, "error": data.get("error")},
-        )
-
-    return data
+    return _conditional_response(request, data)
 
 
 @router.post("/{widget_id}/refresh")
@@ -234,19 +347,13 @@ async def refresh_widget(
         )
         raise HTTPException(status_code=404, detail=f"Widget {widget_id} not found")
 
-    # Clear cache
-    await cache.delete(widget.get_cache_key())
-    logger.debug(
-        "Widget cache cleared", extra={"widget_id": widget_id, "cache_key": widget.get_cache_key()}
+    # Fetch fresh data, sharing the fetch with concurrent requests for this widget. The
+    # cached entry is not deleted first: a successful fetch overwrites it (and resets its
+    # TTL), and a failed one leaves the last good data in place for readers.
+    data = await widget_data_flight.do(
+        widget.get_cache_key(), lambda: _fetch_and_cache_widget_data(widget, cache)
     )
 
-    # Fetch fresh data
-    data = await widget.get_data()
-
-    # Cache the result if no error
-    if not data.get("error"):
-        await cache.set(widget.get_cache_key(), data, ttl=widget.refresh_interval)
-
     logger.info(
         "Widget refreshed successfully",
         extra={
@@ -266,6 +373,7 @@ async def create_widget(
     widget_data: WidgetCreate,
     db: AsyncSession = Depends(get_db),
     registry: WidgetRegistry = Depends(get_widget_registry),
+    cache: CacheService = Depends(get_cache_service),
     current_user: User = Depends(require_auth),
 ):
     """
@@ -275,18 +383,16 @@ async def create_widget(
         widget_data: Widget creation data
         db: Database session
         registry: Widget registry instance
+        cache: Cache service instance
 
     Returns:
         Created widget configuration
     """
-    logger.info(
-        "Creating new widget",
-        extra={
-            "widget_type": widget_data.type,
-            "enabled": widget_data.enabled,
-            "user_id": current_user.id,
-            "creating_habit": widget_data.create_habit is not None,
-        },
+    log_event(
+        widget_type=widget_data.type,
+        enabled=widget_data.enabled,
+        user_id=current_user.id,
+        creating_habit=widget_data.create_habit is not None,
     )
 
     # If creating a habit with the widget, create the habit first
@@ -296,14 +402,6 @@ async def create_widget(
         # Generate habit ID
         habit_id = str(uuid.uuid4())
 
-        logger.info(
-            "Creating new habit for widget",
-            extra={
-                "habit_name": widget_data.create_habit.name,
-                "user_id": current_user.id,
-            },
-        )
-
         # Create the habit
         new_habit = Habit(
             user_id=current_user.id,
@@ -320,16 +418,13 @@ async def create_widget(
         # Set the habit_id in the widget config
         widget_data.config["habit_id"] = habit_id
 
-        logger.info(
-            "Habit created successfully for widget",
-            extra={"habit_id": habit_id, "user_id": current_user.id},
-        )
+        log_event(habit_id=habit_id)
 
     # Generate a unique widget ID
     widget_id = str(uuid.uuid4())
 
     # Validate widget type
-    if widget_data.type not in registry.list_widget_types():
+    if not registry.has_widget_type(widget_data.type):
         logger.warning(
             "Invalid widget type",
             extra={
@@ -343,14 +438,15 @@ async def create_widget(
     # Validate widget configuration
     try:
         validated_config = validate_widget_config(widget_data.type, widget_data.config)
-        logger.debug(
-            "Widget configuration validated successfully",
-            extra={
-                "widget_type": widget_data.type,
-                "user_id": current_user.id,
-                "config_keys": list(validated_config.keys()),
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Widget configuration validated successfully",
+                extra={
+                    "widget_type": widget_data.type,
+                    "user_id": current_user.id,
+                    "config_keys": list(validated_config.keys()),
+                },
+            )
     except ValidationError as e:
         logger.warning(
             "Widget configuration validation failed",
@@ -374,48 +470,64 @@ async def create_widget(
         )
         raise HTTPException(status_code=400, detail=str(e))
 
-    # Create widget in database
-    widget = Widget(
-        user_id=current_user.id,
-        widget_id=widget_id,
-        widget_type=widget_data.type,
-        enabled=widget_data.enabled,
-        position_row=widget_data.position.row,
-        position_col=widget_data.position.col,
-        position_width=widget_data.position.width,
-        position_height=widget_data.position.height,
-        refresh_interval=widget_data.refresh_interval,
-        config=json.dumps(validated_config),
+    # Create widget in database with a single INSERT ... RETURNING round-trip instead of
+    # add + commit + refresh
+    result = await db.execute(
+        insert(Widget)
+        .values(
+            user_id=current_user.id,
+            widget_id=widget_id,
+            widget_type=widget_data.type,
+            enabled=widget_data.enabled,
+            position_row=widget_data.position.row,
+            position_col=widget_data.position.col,
+            position_width=widget_data.position.width,
+            position_height=widget_data.position.height,
+            refresh_interval=widget_data.refresh_interval,
+            config=validated_config,
+        )
+        .returning(Widget)
     )
-
-    db.add(widget)
+    widget = result.scalar_one()
     await db.commit()
-    await db.refresh(widget)
 
     # Create widget instance in registry
-    config = validated_config.copy()
-    config["enabled"] = widget_data.enabled
-    config["refresh_interval"] = widget_data.refresh_interval
-    config["user_id"] = current_user.id  # Add user_id for widgets that need it
-    config["position"] = {
-        "row": widget_data.position.row,
-        "col": widget_data.position.col,
-        "width": widget_data.position.width,
-        "height": widget_data.position.height,
+    config = {
+        **validated_config,
+        "enabled": widget_data.enabled,
+        "refresh_interval": widget_data.refresh_interval,
+        "user_id": current_user.id,  # Add user_id for widgets that need it
+        "position": widget_data.position.model_dump(),
     }
     registry.create_widget(widget_id, widget_data.type, config)
+    await cache.delete(widget_list_cache_key(current_user.id))
 
-    logger.info(
-        "Widget created successfully",
-        extra={
-            "widget_id": widget_id,
-            "widget_type": widget_data.type,
-            "enabled": widget_data.enabled,
-            "user_id": current_user.id,
-        },
-    )
+    log_event(widget_id=widget_id, widget_event="created")
+
+    # Serialized from the row just written, so skip response_model validation
+    return ORJSONResponse(widget.to_dict(), status_code=201)
 
-    return WidgetResponse(**widget.to_dict())
+
+def _pre_write_stale_keys(
+    stale_keys: List[str], widget: Optional[BaseWidget], user_id: int
+) -> List[str]:
+    """
+    Select the cache keys a widget write may invalidate before its row is matched.
+
+    The registry is shared by all users, so another user's widget data key is only
+    invalidated once the owner-scoped write has matched a row.
+
+    Args:
+        stale_keys: List cache key, followed by the widget's data cache key if known
+        widget: Registry instance of the widget, if any
+        user_id: ID of the user making the write
+
+    Returns:
+        Cache keys safe to delete before the write
+    """
+    if widget is not None and widget.config.get("user_id") == user_id:
+        return stale_keys
+    return stale_keys[:1]
 
 
 @router.put("/{widget_id}", response_model=WidgetResponse)
@@ -442,59 +554,59 @@ async def update_widget(
     Returns:
         Updated widget configuration
     """
-    logger.info("Updating widget", extra={"widget_id": widget_id, "user_id": current_user.id})
+    log_event(widget_id=widget_id, user_id=current_user.id)
 
-    # Find widget
-    result = await db.execute(
-        select(Widget).where(Widget.widget_id == widget_id, Widget.user_id == current_user.id)
-    )
-    widget = result.scalar_one_or_none()
-
-    if not widget:
-        logger.warning(
-            "Widget not found for update",
-            extra={"widget_id": widget_id, "user_id": current_user.id},
-        )
-        raise HTTPException(status_code=404, detail=f"Widget '{widget_id}' not found")
-
-    # Update fields
-    if widget_data.type is not None:
-        if widget_data.type not in registry.list_widget_types():
-            raise HTTPException(status_code=400, detail=f"Invalid widget type '{widget_data.type}'")
-        widget.widget_type = widget_data.type
+    # Collect fields to update
+    values: Dict[str, Any] = {}
+    widget_type = widget_data.type
+    if widget_type is not None:
+        if not registry.has_widget_type(widget_type):
+            raise HTTPException(status_code=400, detail=f"Invalid widget type '{widget_type}'")
+        values["widget_type"] = widget_type
 
     if widget_data.enabled is not None:
-        widget.enabled = widget_data.enabled
+        values["enabled"] = widget_data.enabled
 
     if widget_data.position is not None:
-        widget.position_row = widget_data.position.row
-        widget.position_col = widget_data.position.col
-        widget.position_width = widget_data.position.width
-        widget.position_height = widget_data.position.height
+        values["position_row"] = widget_data.position.row
+        values["position_col"] = widget_data.position.col
+        values["position_width"] = widget_data.position.width
+        values["position_height"] = widget_data.position.height
 
     if widget_data.refresh_interval is not None:
-        widget.refresh_interval = widget_data.refresh_interval
+        values["refresh_interval"] = widget_data.refresh_interval
+
+    widget = None
+    if (widget_data.config is not None and widget_type is None) or not values:
+        # The stored type is needed to validate a config-only update
+        result = await db.execute(
+            select(Widget).where(Widget.widget_id == widget_id, Widget.user_id == current_user.id)
+        )
+        widget = result.scalar_one_or_none()
+        if widget:
+            widget_type = widget.widget_type
 
-    if widget_data.config is not None:
+    if widget_data.config is not None and widget_type is not None:
         # Validate widget configuration
         try:
-            validated_config = validate_widget_config(widget.widget_type, widget_data.config)
-            widget.config = json.dumps(validated_config)
-            logger.debug(
-                "Widget configuration validated successfully during update",
-                extra={
-                    "widget_id": widget_id,
-                    "widget_type": widget.widget_type,
-                    "user_id": current_user.id,
-                    "config_keys": list(validated_config.keys()),
-                },
-            )
+            validated_config = validate_widget_config(widget_type, widget_data.config)
+            values["config"] = validated_config
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Widget configuration validated successfully during update",
+                    extra={
+                        "widget_id": widget_id,
+                        "widget_type": widget_type,
+                        "user_id": current_user.id,
+                        "config_keys": list(validated_config.keys()),
+                    },
+                )
         except ValidationError as e:
             logger.warning(
                 "Widget configuration validation failed during update",
                 extra={
                     "widget_id": widget_id,
-                    "widget_type": widget.widget_type,
+                    "widget_type": widget_type,
                     "validation_errors": str(e),
                     "user_id": current_user.id,
                     "config_preview": sanitize_log_dict(widget_data.config, max_length=30),
@@ -506,7 +618,7 @@ async def update_widget(
                 "Widget configuration validation failed during update",
                 extra={
                     "widget_id": widget_id,
-                    "widget_type": widget.widget_type,
+                    "widget_type": widget_type,
                     "error": str(e),
                     "user_id": current_user.id,
                     "config_preview": sanitize_log_dict(widget_data.config, max_length=30),
@@ -514,40 +626,63 @@ async def update_widget(
             )
             raise HTTPException(status_code=400, detail=str(e))
 
+    # Data cached under the previous configuration's key becomes stale
+    old_widget = registry.get_widget(widget_id)
+    stale_keys = [widget_list_cache_key(current_user.id)]
+    if old_widget:
+        stale_keys.append(old_widget.get_cache_key())
+
+    if values:
+        # Invalidate before writing as well, so readers stop getting the old data as soon
+        # as the update starts; the delete after commit drops anything re-cached meanwhile
+        await cache.delete_many(_pre_write_stale_keys(stale_keys, old_widget, current_user.id))
+
+        # Single UPDATE ... RETURNING round-trip instead of SELECT + UPDATE + refresh
+        result = await db.execute(
+            update(Widget)
+            .where(Widget.widget_id == widget_id, Widget.user_id == current_user.id)
+            .values(**values)
+            .returning(Widget)
+            .execution_options(populate_existing=True)
+        )
+        widget = result.scalar_one_or_none()
+
+    if not widget:
+        logger.warning(
+            "Widget not found for update",
+            extra={"widget_id": widget_id, "user_id": current_user.id},
+        )
+        raise HTTPException(status_code=404, detail=f"Widget '{widget_id}' not found")
+
     await db.commit()
-    await db.refresh(widget)
 
     # Update widget instance in registry
     widget_dict = widget.to_dict()
-    config = widget_dict["config"].copy()
-    config["enabled"] = widget_dict["enabled"]
-    config["refresh_interval"] = widget_dict["refresh_interval"]
-    config["position"] = widget_dict["position"]
-    config["user_id"] = current_user.id  # Add user_id for widgets that need it
+    config = {
+        **widget_dict["config"],
+        "enabled": widget_dict["enabled"],
+        "refresh_interval": widget_dict["refresh_interval"],
+        "position": widget_dict["position"],
+        "user_id": current_user.id,  # Add user_id for widgets that need it
+    }
     registry.create_widget(widget_id, widget_dict["type"], config)
 
-    # Clear cache for this widget
-    old_widget = registry.get_widget(widget_id)
-    if old_widget:
-        await cache.delete(old_widget.get_cache_key())
+    # Clear the list cache and this widget's data cache again in one round-trip. This must
+    # not overlap the commit: a concurrent reader could re-cache pre-commit rows in between.
+    await cache.delete_many(stale_keys)
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(
             "Widget cache cleared after update",
-            extra={"widget_id": widget_id, "cache_key": old_widget.get_cache_key()},
+            extra={"widget_id": widget_id, "cache_keys": stale_keys},
         )
 
-    logger.info(
-        "Widget updated successfully",
-        extra={
-            "widget_id": widget_id,
-            "widget_type": widget_dict["type"],
-            "user_id": current_user.id,
-        },
-    )
+    log_event(widget_type=widget_dict["type"], widget_event="updated")
 
-    return WidgetResponse(**widget.to_dict())
+    # Serialized from the row just written, so skip response_model validation
+    return ORJSONResponse(widget_dict)
 
 
-@router.delete("/{widget_id}", status_code=204)
+@router.delete("/{widget_id}", status_code=204, response_class=Response)
 @limiter.limit("20/minute")
 async def delete_widget(
     request: Request,
@@ -556,7 +691,7 @@ async def delete_widget(
     registry: WidgetRegistry = Depends(get_widget_registry),
     cache: CacheService = Depends(get_cache_service),
     current_user: User = Depends(require_auth),
-):
+) -> Response:
     """
     Delete a widget.
 
@@ -569,13 +704,24 @@ async def delete_widget(
     Returns:
         No content (204)
     """
-    logger.info("Deleting widget", extra={"widget_id": widget_id, "user_id": current_user.id})
+    log_event(widget_id=widget_id, user_id=current_user.id)
+
+    stale_keys = [widget_list_cache_key(current_user.id)]
+    widget_instance = registry.get_widget(widget_id)
+    if widget_instance:
+        stale_keys.append(widget_instance.get_cache_key())
+
+    # Invalidate before deleting as well, so readers stop getting the widget as soon as
+    # the delete starts; the delete after commit drops anything re-cached meanwhile
+    await cache.delete_many(_pre_write_stale_keys(stale_keys, widget_instance, current_user.id))
 
-    # Find widget
+    # Single DELETE ... RETURNING round-trip instead of loading the row first
     result = await db.execute(
-        select(Widget).where(Widget.widget_id == widget_id, Widget.user_id == current_user.id)
+        delete(Widget)
+        .where(Widget.widget_id == widget_id, Widget.user_id == current_user.id)
+        .returning(Widget.widget_type, Widget.config)
     )
-    widget = result.scalar_one_or_none()
+    widget = result.one_or_none()
 
     if not widget:
         logger.warning(
@@ -584,36 +730,26 @@ async def delete_widget(
         )
         raise HTTPException(status_code=404, detail=f"Widget '{widget_id}' not found")
 
-    # Clear cache
-    widget_instance = registry.get_widget(widget_id)
-    if widget_instance:
-        await cache.delete(widget_instance.get_cache_key())
-
     # Remove from registry
-    if widget_id in registry._widget_instances:
-        del registry._widget_instances[widget_id]
+    registry.evict(widget_id)
 
     # If this is a habit_tracking widget, check if we should delete the habit
     if widget.widget_type == "habit_tracking":
         try:
-            config = json.loads(widget.config)
-            habit_id_to_check = config.get("habit_id")
+            habit_id_to_check = widget.config.get("habit_id")
 
             if habit_id_to_check:
                 # Use a single database query with JSON extraction to check if any other widget
                 # uses the same habit. This avoids the N+1 query problem where we would fetch
-                # all widgets and then iterate through them in Python.
-                #
-                # Note: This uses SQLite's json_extract function. If migrating to PostgreSQL,
-                # replace with: config::jsonb->>'habit_id' = :habit_id
-                # or use SQLAlchemy's JSON type casting for database portability.
+                # all widgets and then iterate through them in Python. The JSON path renders as
+                # json_extract on SQLite and ->> on PostgreSQL.
                 result = await db.execute(
                     select(func.count()).select_from(Widget).where(
                         Widget.user_id == current_user.id,
                         Widget.widget_type == "habit_tracking",
                         Widget.widget_id != widget_id,
-                        text("json_extract(config, '$.habit_id') = :habit_id")
-                    ).params(habit_id=habit_id_to_check)
+                        Widget.config["habit_id"].as_string() == habit_id_to_check,
+                    )
                 )
                 other_widgets_count = result.scalar() or 0
 
@@ -636,33 +772,24 @@ async def delete_widget(
                         )
                     )
 
-                    logger.info(
-                        "Deleted orphaned habit with widget",
-                        extra={
-                            "habit_id": habit_id_to_check,
-                            "widget_id": widget_id,
-                            "user_id": current_user.id,
-                        },
-                    )
-        except (json.JSONDecodeError, KeyError) as e:
+                    log_event(deleted_habit_id=habit_id_to_check)
+        except (AttributeError, KeyError) as e:
             # If we can't parse the config, just continue with widget deletion
             logger.warning(
                 "Could not check for orphaned habit during widget deletion",
                 extra={"widget_id": widget_id, "error": str(e), "user_id": current_user.id},
             )
 
-    # Delete from database
-    await db.delete(widget)
     await db.commit()
 
-    logger.info(
-        "Widget deleted successfully",
-        extra={
-            "widget_id": widget_id,
-            "widget_type": widget.widget_type,
-            "user_id": current_user.id,
-        },
-    )
+    # Clear the list cache and this widget's data cache again in one round-trip. This must
+    # not overlap the commit: a concurrent reader could re-cache pre-commit rows in between.
+    await cache.delete_many(stale_keys)
+
+    log_event(widget_type=widget.widget_type, widget_event="deleted")
+
+    # Bare response, so FastAPI skips serializing a None return value
+    return Response(status_code=204)
 
 
 @router.post("/reload-config")
@@ -671,6 +798,7 @@ async def reload_widget_config(
     request: Request,
     registry: WidgetRegistry = Depends(get_widget_registry),
     db: AsyncSession = Depends(get_db),
+    cache: CacheService = Depends(get_cache_service),
     current_user: User = Depends(require_auth),
 ):
     """
@@ -679,37 +807,46 @@ async def reload_widget_config(
     Args:
         registry: Widget registry instance
         db: Database session
+        cache: Cache service instance
 
     Returns:
         Status message
     """
     logger.info("Reloading widget configuration from database", extra={"user_id": current_user.id})
 
-    # Clear existing instances
-    registry._widget_instances.clear()
-
-    # Load all widgets from database for current user
-    result = await db.execute(
-        select(Widget).where(Widget.enabled.is_(True), Widget.user_id == current_user.id)
+    # Clear the current user's instances and the widget data cached under their configs.
+    # The registry is shared by all users, so other users' instances and keys are kept
+    user_widgets = [
+        widget
+        for widget in registry.get_all_widgets().values()
+        if widget.config.get("user_id") == current_user.id
+    ]
+    for widget in user_widgets:
+        registry.evict(widget.widget_id)
+    await cache.delete_many([widget.get_cache_key() for widget in user_widgets])
+
+    # Stream all enabled widgets of the current user in batches, selecting only the
+    # columns needed to build instances
+    result = await db.stream(
+        _SELECT_INSTANCE_COLUMNS.where(
+            Widget.enabled.is_(True), Widget.user_id == current_user.id
+        ).execution_options(yield_per=WIDGET_RELOAD_YIELD_PER)
     )
-    widgets = result.scalars().all()
+    rows = [row async for row in result]
 
-    for widget in widgets:
-        widget_dict = widget.to_dict()
-        config = widget_dict["config"].copy()
-        config["enabled"] = widget_dict["enabled"]
-        config["refresh_interval"] = widget_dict["refresh_interval"]
-        config["position"] = widget_dict["position"]
-        config["user_id"] = current_user.id  # Add user_id for widgets that need it
-        registry.create_widget(widget_dict["id"], widget_dict["type"], config)
+    # Build instances off the event loop for large sets
+    if len(rows) > WIDGET_RELOAD_OFFLOAD_THRESHOLD:
+        await asyncio.to_thread(registry.bulk_load, rows)
+    else:
+        registry.bulk_load(rows)
 
     logger.info(
         "Widget configuration reloaded from database",
-        extra={"widget_count": len(widgets), "user_id": current_user.id},
+        extra={"widget_count": len(rows), "user_id": current_user.id},
     )
 
     return {
         "status": "success",
         "message": "Widget configuration reloaded from database",
-        "widget_count": len(widgets),
+        "widget_count": len(rows),
     }
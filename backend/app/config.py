@@ -2,8 +2,9 @@
 
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
@@ -27,8 +28,24 @@ class Settings(BaseSettings):
     SQLALCHEMY_ENGINE_LOG_LEVEL: str = "WARNING"
     APSCHEDULER_LOG_LEVEL: str = "INFO"
 
+    # Milliseconds to wait for further log records before writing buffered lines to
+    # stdout; trades log latency for fewer write syscalls (0 disables the wait)
+    LOG_FLUSH_INTERVAL_MS: int = 0
+
+    # Comma-separated request paths without a request summary log record; a trailing "*"
+    # matches every path with that prefix, e.g. "/health,/static/*"
+    REQUEST_LOG_SKIP_PATHS: str = "/health"
+
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:////data/home.db"
+    # Per-connection prepared statement cache size (set to 0 behind pgbouncer
+    # in transaction pooling mode)
+    DATABASE_STATEMENT_CACHE_SIZE: int = 500
+    # Connection pool sizing (ignored for in-memory SQLite)
+    DATABASE_POOL_SIZE: int = 20
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: int = 30  # seconds
+    DATABASE_POOL_RECYCLE: int = 1800  # seconds
 
     # Redis
     REDIS_URL: str = "redis://redis:6379"
@@ -55,6 +72,10 @@ class Settings(BaseSettings):
     # CORS Configuration - declared as field but populated manually in model_post_init
     # init=False tells Pydantic not to try to initialize this from environment variables
     CORS_ORIGINS: list[str] = Field(default=[], init=False)
+    # Optional regex for further allowed origins, matched in full against the Origin header,
+    # e.g. r"https://(home\.example\.com|localhost:\d+)"; it must not match arbitrary hosts,
+    # since credentials are allowed
+    CORS_ORIGIN_REGEX: Optional[str] = None
 
     def model_post_init(self, __context) -> None:
         """Initialize CORS_ORIGINS after model creation.
@@ -89,6 +110,21 @@ class Settings(BaseSettings):
                 "http://localhost:8080",  # Frontend container
             ]
 
+    @field_validator("CORS_ORIGIN_REGEX")
+    @classmethod
+    def validate_cors_origin_regex(cls, value: Optional[str]) -> Optional[str]:
+        """Treat a blank CORS_ORIGIN_REGEX, as in the .env examples, as unset.
+
+        Args:
+            value: CORS_ORIGIN_REGEX value loaded from the environment.
+
+        Returns:
+            The regex, or None when it is missing or blank.
+        """
+        if value is None or not value.strip():
+            return None
+        return value.strip()
+
     @field_validator("SECRET_KEY")
     @classmethod
     def validate_secret_key(cls, value: str) -> str:
@@ -145,8 +181,43 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, parsing the environment only on the first call.
+
+    Usable as a FastAPI dependency so endpoints and tests can override settings.
+
+    Returns:
+        Application settings
+    """
+    return Settings()
+
+
+if TYPE_CHECKING:
+    # Global settings instance, resolved lazily by __getattr__ below
+    settings: Settings
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve the global ``settings`` instance on first access.
+
+    Importing this module (e.g. for Settings or the path helpers) therefore does not
+    parse and validate the environment; ``from app.config import settings`` does.
+
+    Args:
+        name: Module attribute name
+
+    Returns:
+        The cached application settings
+
+    Raises:
+        AttributeError: If the attribute is not ``settings``
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_data_dir() -> Path:
@@ -32,8 +32,32 @@ ERROR_INVALID_REQUEST = "Invalid request parameters"
 
 # Cache Keys
 CACHE_KEY_PREFIX_WIDGET = "widget:"
+# Versioned: bump when the cached widget list entry format changes
+CACHE_KEY_PREFIX_WIDGET_LIST = "widgets:list:v2:"
+
+# Process-local (L1) cache in front of Redis for widget data, kept coherent across
+# workers by publishing invalidated keys on a Redis channel
+WIDGET_DATA_LOCAL_CACHE_TTL = 30  # seconds
+WIDGET_DATA_LOCAL_CACHE_MAX_SIZE = 512  # entries
+CACHE_INVALIDATION_CHANNEL = "cache:invalidations"
+# Keys requested per SCAN call when deleting by pattern
+CACHE_SCAN_COUNT = 500
+
+# Widget list response cache (served fresh for TTL, kept as stale fallback for STALE_TTL)
+WIDGET_LIST_CACHE_TTL = 30  # seconds
+WIDGET_LIST_STALE_TTL = 3600  # seconds
+
+# Widget config reload: rows fetched per batch, and the widget count above which
+# registry instances are built in a worker thread
+WIDGET_RELOAD_YIELD_PER = 200
+WIDGET_RELOAD_OFFLOAD_THRESHOLD = 50
+
+# Process-local section list cache
+SECTIONS_CACHE_TTL = 30  # seconds
+SECTIONS_CACHE_MAX_SIZE = 10_000  # users
 
 # Rate Limits
+RATE_LIMIT_STRATEGY = "sliding-window-counter"  # limits library strategy for the shared limiter
 RATE_LIMIT_FAVICON_PROXY = "20/minute"
 RATE_LIMIT_WIDGET_DATA = "60/minute"
 RATE_LIMIT_WIDGET_REFRESH = "10/minute"
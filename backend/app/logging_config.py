@@ -5,12 +5,51 @@ tools like Promtail/Loki. All logs include contextual information and are
 formatted as JSON for easy parsing and filtering.
 """
 
+import atexit
+import copy
+import io
 import logging
+import operator
+import queue
 import sys
-from typing import Any, Dict
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, TextIO
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
+# Fields accumulated by log_event() during a request, emitted by the request
+# logging middleware as part of a single summary record
+_request_log_fields: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "request_log_fields", default=None
+)
+
+
+# Log record attributes copied into every JSON record, as (field, attribute) pairs
+_RECORD_FIELDS = (
+    ("level", "levelname"),
+    ("logger", "name"),
+    ("module", "module"),
+    ("function", "funcName"),
+    ("line", "lineno"),
+    ("process_id", "process"),
+    ("thread_id", "thread"),
+)
+_RECORD_FIELD_NAMES = tuple(field for field, _ in _RECORD_FIELDS)
+_get_record_fields = operator.attrgetter(*(attr for _, attr in _RECORD_FIELDS))
+
+# Level name -> number, e.g. {"INFO": 20}
+_LOG_LEVELS = logging.getLevelNamesMapping()
+
+
+# Background thread that formats and writes records enqueued by the root logger
+_log_listener: Optional["_BatchingQueueListener"] = None
+
+# Size of the stdout buffer that coalesces bursts of log lines into one write
+_LOG_BUFFER_SIZE = 64 * 1024
+
 
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter with additional context fields."""
@@ -25,36 +64,200 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
             record: Python logging record
             message_dict: Dictionary of message fields
         """
-        super().add_fields(log_record, record, message_dict)
-
-        # Add standard fields
-        log_record["timestamp"] = self.formatTime(record, self.datefmt)
-        log_record["level"] = record.levelname
-        log_record["logger"] = record.name
-        log_record["module"] = record.module
-        log_record["function"] = record.funcName
-        log_record["line"] = record.lineno
+        if self.rename_fields or self.timestamp:
+            super().add_fields(log_record, record, message_dict)
+        else:
+            # Same fields as the base implementation, with the extras copied by a single
+            # comprehension instead of a per-attribute hasattr/startswith loop
+            record_fields = record.__dict__
+            for field in self._required_fields:
+                log_record[field] = record_fields.get(field)
+            log_record.update(self.static_fields)
+            log_record.update(message_dict)
+            skip_fields = self._skip_fields
+            log_record.update(
+                {
+                    key: value
+                    for key, value in record_fields.items()
+                    if key not in skip_fields and not key.startswith("_")
+                }
+            )
 
-        # Add process/thread info for debugging
-        log_record["process_id"] = record.process
-        log_record["thread_id"] = record.thread
+        # Add standard fields; the timestamp is rendered by orjson as RFC 3339 UTC with
+        # microseconds, which time.strftime (used by formatTime) cannot produce
+        log_record["timestamp"] = datetime.fromtimestamp(record.created, tz=timezone.utc)
+        # Level, logger, source location and process/thread info in one C-level lookup
+        log_record.update(zip(_RECORD_FIELD_NAMES, _get_record_fields(record)))
 
-        # Include exception info if present
+        # Include exception info if present, reusing the traceback format() already rendered
         if record.exc_info:
-            log_record["exception"] = self.formatException(record.exc_info)
+            log_record["exception"] = message_dict.get("exc_info") or self.formatException(
+                record.exc_info
+            )
+
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        """Serialize a log record with orjson, falling back to the stdlib encoder.
+
+        Args:
+            log_record: Dictionary of log fields
+
+        Returns:
+            JSON string
+        """
+        try:
+            return orjson.dumps(
+                log_record, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+            ).decode()
+        except TypeError:
+            # e.g. integers outside the 64-bit range
+            return super().jsonify_log_record(log_record)
+
+
+class _RecordQueueHandler(QueueHandler):
+    """Queue handler that hands records to the listener unformatted.
+
+    The stock QueueHandler formats the record with a plain Formatter before enqueueing
+    and drops exc_info, which would fold tracebacks into the JSON "message" field.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments now, leaving formatting to the listener.
+
+        Args:
+            record: Python logging record
+
+        Returns:
+            Copy of the record with its message resolved
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class _BatchingStreamHandler(logging.StreamHandler):
+    """Stream handler that leaves flushing to its caller.
+
+    StreamHandler flushes after every record, i.e. one write syscall per log line.
+    Records written by this handler stay in the stream's buffer until flush() is
+    called, which _BatchingQueueListener does once the queue runs empty.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Format a record and write it to the stream without flushing.
+
+        Args:
+            record: Python logging record
+        """
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchingQueueListener(QueueListener):
+    """Queue listener that flushes its handlers only when it has caught up.
+
+    A burst of records is written out with a single flush. With a flush interval, the
+    listener waits up to that long for further records before flushing, so a steady
+    trickle of records is also coalesced into fewer writes; otherwise a lone record is
+    flushed as soon as it has been handled.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.SimpleQueue,
+        *handlers: logging.Handler,
+        respect_handler_level: bool = False,
+        flush_interval: float = 0.0,
+    ):
+        """
+        Initialize the listener.
+
+        Args:
+            log_queue: Queue the records are read from
+            *handlers: Handlers the records are passed to
+            respect_handler_level: Whether to skip handlers below the record's level
+            flush_interval: Seconds to wait for more records before flushing
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+        self._unflushed = False
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Get the next record, flushing the handlers if none arrives in time.
+
+        Args:
+            block: Whether to wait for a record
+
+        Returns:
+            The next record, or the stop sentinel
+        """
+        if self._unflushed:
+            try:
+                return self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                self._flush_handlers()
+        return self.queue.get(block)
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Handle a record, flushing the handlers if no more records are waiting.
+
+        Args:
+            record: Python logging record
+        """
+        super().handle(record)
+        if self.queue.empty():
+            if self.flush_interval > 0:
+                self._unflushed = True
+            else:
+                self._flush_handlers()
+
+    def _flush_handlers(self) -> None:
+        """Flush all handlers."""
+        self._unflushed = False
+        for handler in self.handlers:
+            handler.flush()
+
+
+def _buffered_stdout() -> TextIO:
+    """Open a block-buffered text stream over stdout's file descriptor.
+
+    sys.stdout itself may be unbuffered (PYTHONUNBUFFERED) or line buffered. If stdout
+    has no file descriptor (e.g. it is replaced in tests), it is used as is.
+
+    Returns:
+        Text stream writing to stdout
+    """
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return sys.stdout
+    raw = io.FileIO(fd, "w", closefd=False)
+    return io.TextIOWrapper(
+        io.BufferedWriter(raw, buffer_size=_LOG_BUFFER_SIZE),
+        encoding=sys.stdout.encoding or "utf-8",
+        errors="backslashreplace",
+    )
 
 
 def setup_logging(
+    *,
     log_level: str = "INFO",
     uvicorn_access_log_level: str = "WARNING",
     uvicorn_error_log_level: str = "INFO",
     sqlalchemy_engine_log_level: str = "WARNING",
     apscheduler_log_level: str = "INFO",
+    log_flush_interval_ms: int = 0,
 ) -> None:
     """Configure structured logging for the application.
 
     Sets up JSON-formatted logging to stdout, suitable for container
     environments where logs are collected by external tools like Promtail.
+    Loggers only enqueue records; a background listener thread formats them and
+    writes to stdout, so request handlers never block on log I/O.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -62,41 +265,57 @@ def setup_logging(
         uvicorn_error_log_level: Log level for uvicorn.error logger
         sqlalchemy_engine_log_level: Log level for sqlalchemy.engine logger
         apscheduler_log_level: Log level for apscheduler logger
+        log_flush_interval_ms: Milliseconds to wait for further records before writing
+            buffered log lines to stdout (0 writes as soon as the queue is empty)
     """
+    global _log_listener
+
     # Convert string log level to logging constant
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    numeric_level = _LOG_LEVELS.get(log_level.upper(), logging.INFO)
 
     # Create JSON formatter
-    formatter = CustomJsonFormatter(
-        "%(timestamp)s %(level)s %(logger)s %(message)s", datefmt="%Y-%m-%dT%H:%M:%S.%fZ"
-    )
+    formatter = CustomJsonFormatter("%(timestamp)s %(level)s %(logger)s %(message)s")
 
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
-    # Remove any existing handlers
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    # Close and remove any existing handlers, then drain the listener they fed
+    for handler in root_logger.handlers:
+        handler.close()
+    root_logger.handlers.clear()
+    stop_logging()
 
-    # Add stdout handler with JSON formatting
-    handler = logging.StreamHandler(sys.stdout)
+    # Write JSON to buffered stdout from a listener thread, fed by a queue handler on the
+    # root logger
+    stream_handler = _BatchingStreamHandler(_buffered_stdout())
+    stream_handler.setLevel(numeric_level)
+    stream_handler.setFormatter(formatter)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = _BatchingQueueListener(
+        log_queue,
+        stream_handler,
+        respect_handler_level=True,
+        flush_interval=max(log_flush_interval_ms, 0) / 1000,
+    )
+    _log_listener.start()
+
+    handler = _RecordQueueHandler(log_queue)
     handler.setLevel(numeric_level)
-    handler.setFormatter(formatter)
     root_logger.addHandler(handler)
 
     # Set levels for noisy third-party libraries (configurable via env vars)
     logging.getLogger("uvicorn.access").setLevel(
-        getattr(logging, uvicorn_access_log_level.upper(), logging.WARNING)
+        _LOG_LEVELS.get(uvicorn_access_log_level.upper(), logging.WARNING)
     )
     logging.getLogger("uvicorn.error").setLevel(
-        getattr(logging, uvicorn_error_log_level.upper(), logging.INFO)
+        _LOG_LEVELS.get(uvicorn_error_log_level.upper(), logging.INFO)
     )
     logging.getLogger("sqlalchemy.engine").setLevel(
-        getattr(logging, sqlalchemy_engine_log_level.upper(), logging.WARNING)
+        _LOG_LEVELS.get(sqlalchemy_engine_log_level.upper(), logging.WARNING)
     )
     logging.getLogger("apscheduler").setLevel(
-        getattr(logging, apscheduler_log_level.upper(), logging.INFO)
+        _LOG_LEVELS.get(apscheduler_log_level.upper(), logging.INFO)
     )
 
     # Log configuration completion
@@ -106,6 +325,79 @@ def setup_logging(
     )
 
 
+def stop_logging() -> None:
+    """Write out all enqueued log records and stop the listener thread.
+
+    The root logger's queue handler is replaced by a stream handler writing to the same
+    stream, so records logged afterwards (e.g. by a later lifespan in the same process)
+    are written directly instead of being enqueued with no listener to read them.
+
+    Called on application shutdown and at interpreter exit; safe to call repeatedly.
+    """
+    global _log_listener
+
+    if _log_listener is not None:
+        _log_listener.stop()
+        # Records handled just before the stop sentinel may not have been flushed yet
+        _log_listener._flush_handlers()
+
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            if not isinstance(handler, _RecordQueueHandler):
+                continue
+            root_logger.removeHandler(handler)
+            for listener_handler in _log_listener.handlers:
+                # A plain StreamHandler flushes every record, as nothing batches them now
+                direct_handler = logging.StreamHandler(listener_handler.stream)
+                direct_handler.setLevel(listener_handler.level)
+                direct_handler.setFormatter(listener_handler.formatter)
+                root_logger.addHandler(direct_handler)
+        _log_listener = None
+
+
+atexit.register(stop_logging)
+
+
+def start_request_log(**fields: Any) -> Token:
+    """Start accumulating log fields for the current request.
+
+    Args:
+        **fields: Initial log fields, e.g. the request method and path
+
+    Returns:
+        Token to pass to finish_request_log()
+    """
+    return _request_log_fields.set(fields)
+
+
+def finish_request_log(token: Token) -> Dict[str, Any]:
+    """Stop accumulating log fields for the current request.
+
+    Args:
+        token: Token returned by start_request_log()
+
+    Returns:
+        Initial fields and those recorded with log_event() during the request; the
+        caller owns the dict and may add to it
+    """
+    fields = _request_log_fields.get() or {}
+    _request_log_fields.reset(token)
+    return fields
+
+
+def log_event(**fields: Any) -> None:
+    """Record fields for the current request's summary log record.
+
+    Outside a request the fields are dropped.
+
+    Args:
+        **fields: Log fields to add
+    """
+    request_fields = _request_log_fields.get()
+    if request_fields is not None:
+        request_fields.update(fields)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance with the given name.
 
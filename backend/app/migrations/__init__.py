@@ -1 +1,197 @@
 """Database migrations."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.migrations.add_clicks_to_bookmarks import run_migration as run_clicks_migration
+from app.migrations.add_model_to_ai_tools import run_migration as run_model_migration
+from app.migrations.add_performance_indexes import run_migration as run_indexes_migration
+from app.migrations.add_role_to_users import run_migration as run_role_migration
+from app.migrations.add_tree_structure_to_notes import run_migration as run_tree_structure_migration
+from app.migrations.add_user_id_to_tables import run_migration as run_user_id_migration
+from app.migrations.convert_widget_config_to_json import (
+    run_migration as run_widget_config_migration,
+)
+from app.migrations.create_ai_tools_table import run_migration as run_ai_tools_migration
+from app.migrations.create_habits_tables import run_migration as run_habits_migration
+from app.migrations.create_notes_table import run_migration as run_notes_migration
+from app.migrations.create_preferences_table import run_migration as run_preferences_migration
+from app.migrations.create_users_table import run_migration as run_users_migration
+
+logger = logging.getLogger(__name__)
+
+# Column names per table
+Schema = Dict[str, Set[str]]
+
+Migration = Callable[[AsyncConnection, Schema], Awaitable[None]]
+
+# Startup migrations grouped into phases. Each phase only depends on earlier phases, and
+# the migrations within a phase alter disjoint tables:
+#   - users and preferences exist before user_id is added to them, and users before role
+#   - notes and ai_tools exist before their columns are added
+#   - the indexes need habit_completions, sections.position and widgets.user_id
+MIGRATION_PHASES: Tuple[Tuple[Migration, ...], ...] = (
+    (
+        run_clicks_migration,
+        run_preferences_migration,
+        run_users_migration,
+        run_habits_migration,
+        run_notes_migration,
+        run_ai_tools_migration,
+        run_widget_config_migration,
+    ),
+    (
+        run_user_id_migration,
+        run_role_migration,
+        run_tree_structure_migration,
+        run_model_migration,
+    ),
+    (run_indexes_migration,),
+)
+
+
+async def _load_schema(conn: AsyncConnection) -> Schema:
+    """Read the column names of every table in one read-only pass.
+
+    Migrations check this snapshot instead of each querying the schema in its own
+    transaction, and only begin a transaction when they have DDL to run.
+
+    Args:
+        conn: Database connection, with no transaction open
+
+    Returns:
+        Column names per table
+    """
+
+    def inspect_schema(connection) -> Schema:
+        inspector = inspect(connection)
+        return {
+            table: {column["name"] for column in inspector.get_columns(table)}
+            for table in inspector.get_table_names()
+        }
+
+    schema = await conn.run_sync(inspect_schema)
+    # Reflection began a transaction; end it so migrations can begin their own
+    await conn.rollback()
+    return schema
+
+
+async def _run_migration(
+    conn: AsyncConnection, migration: Migration, schema: Schema
+) -> Optional[BaseException]:
+    """Run one migration, leaving the connection without an open transaction.
+
+    Args:
+        conn: Database connection, with no transaction open
+        migration: Migration to run
+        schema: Column names per table, loaded before the migration's phase
+
+    Returns:
+        The exception raised by the migration, or None if it succeeded
+    """
+    try:
+        await migration(conn, schema)
+    except Exception as e:
+        return e
+    finally:
+        if conn.in_transaction():
+            await conn.rollback()
+    return None
+
+
+async def _run_phase(
+    engine: AsyncEngine,
+    conn: AsyncConnection,
+    phase: Sequence[Migration],
+    schema: Schema,
+) -> List[Optional[BaseException]]:
+    """Run the migrations of one phase, concurrently unless the database is SQLite.
+
+    SQLite allows a single writer, and a transaction that reads the schema before altering
+    it fails with "database is locked" instead of waiting when another writer is active.
+    Its migrations run one after another on the given connection; elsewhere each one runs
+    on a connection of its own.
+
+    Args:
+        engine: SQLAlchemy async engine
+        conn: Connection the schema was loaded with, with no transaction open
+        phase: Migrations to run
+        schema: Column names per table, loaded before the phase
+
+    Returns:
+        The exception raised by each migration, or None if it succeeded
+    """
+    if engine.dialect.name != "sqlite":
+
+        async def run_on_own_connection(migration: Migration) -> Optional[BaseException]:
+            async with engine.connect() as own_conn:
+                return await _run_migration(own_conn, migration, schema)
+
+        return await asyncio.gather(
+            *(run_on_own_connection(migration) for migration in phase), return_exceptions=True
+        )
+
+    return [await _run_migration(conn, migration, schema) for migration in phase]
+
+
+async def _run_phases(engine: AsyncEngine, conn: AsyncConnection) -> bool:
+    """Run the migration phases in order, stopping at the first phase with a failure.
+
+    Args:
+        engine: SQLAlchemy async engine
+        conn: Database connection, with no transaction open
+
+    Returns:
+        True if all migrations succeeded
+    """
+    for phase in MIGRATION_PHASES:
+        schema = await _load_schema(conn)
+        results = await _run_phase(engine, conn, phase, schema)
+        failures = [
+            (migration, error)
+            for migration, error in zip(phase, results)
+            if isinstance(error, Exception)
+        ]
+        for migration, error in failures:
+            logger.error(
+                "Migration failed",
+                extra={
+                    "migration": migration.__module__.rsplit(".", 1)[-1],
+                    "error_type": type(error).__name__,
+                    "error": str(error),
+                },
+                exc_info=error,
+            )
+        if failures:
+            return False
+    return True
+
+
+async def run_migrations(engine: AsyncEngine) -> bool:
+    """Run all startup migrations, phase by phase.
+
+    The schema is loaded again before each phase, as a phase may create the tables and
+    columns that later phases check for. A failed migration is logged and stops the
+    remaining phases, which may depend on it. On SQLite all of this happens on a single
+    connection, with a transaction per migration that has DDL to run.
+
+    Args:
+        engine: SQLAlchemy async engine
+
+    Returns:
+        True if all migrations succeeded
+    """
+    try:
+        async with engine.connect() as conn:
+            return await _run_phases(engine, conn)
+    except Exception as e:
+        logger.error(
+            "Failed to load database schema for migrations",
+            extra={"error_type": type(e).__name__, "error": str(e)},
+            exc_info=True,
+        )
+        return False
@@ -1,4 +1,4 @@
-"""Migration: Add performance indexes for habit_completions and sections."""
+"""Migration: Add performance indexes for habit_completions, sections and widgets."""
 
 import logging
 
@@ -7,15 +7,16 @@ from sqlalchemy import text
 logger = logging.getLogger(__name__)
 
 
-async def run_migration(engine):
+async def run_migration(conn, schema):
     """Add performance indexes to optimize common queries.
 
     Args:
-        engine: SQLAlchemy async engine
+        conn: Database connection, with no transaction open
+        schema: Column names per table, loaded before this migration's phase
     """
     logger.info("Migration: Adding performance indexes")
 
-    async with engine.begin() as conn:
+    async with conn.begin():
         # Add composite index on habit_completions for efficient lookups
         logger.info("Adding composite index on habit_completions...")
         try:
@@ -46,4 +47,25 @@ async def run_migration(engine):
         except Exception as e:
             logger.warning(f"Failed to add sections index: {e}")
 
+        # Add a partial index over enabled widgets for loading them per user or all at once.
+        # Lookups by (user_id, widget_id) are already served by the unique index on
+        # widget_id. It replaces the earlier full (user_id, enabled) index.
+        logger.info("Adding partial index on enabled widgets...")
+        enabled_predicate = (
+            "enabled IS TRUE" if conn.dialect.name == "postgresql" else "enabled IS 1"
+        )
+        try:
+            await conn.execute(
+                text(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS ix_widgets_enabled_user
+                    ON widgets(user_id) WHERE {enabled_predicate}
+                    """
+                )
+            )
+            await conn.execute(text("DROP INDEX IF EXISTS ix_widgets_user_enabled"))
+            logger.info("Partial index on enabled widgets added successfully")
+        except Exception as e:
+            logger.warning(f"Failed to add widgets index: {e}")
+
     logger.info("Migration completed: add_performance_indexes")
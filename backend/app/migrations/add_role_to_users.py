@@ -7,26 +7,23 @@ from sqlalchemy import text
 logger = logging.getLogger(__name__)
 
 
-async def run_migration(engine):
+async def run_migration(conn, schema):
     """Add role column to users table if it doesn't exist.
 
     Args:
-        engine: SQLAlchemy async engine
+        conn: Database connection, with no transaction open
+        schema: Column names per table, loaded before this migration's phase
     """
     logger.info("Migration: Checking for role column in users table")
 
-    async with engine.begin() as conn:
-        # Check if role column already exists
-        result = await conn.execute(text("PRAGMA table_info(users)"))
-        columns = [row[1] for row in result.fetchall()]
-
-        if "role" not in columns:
-            logger.info("Adding role column to users table...")
+    if "role" not in schema.get("users", ()):
+        logger.info("Adding role column to users table...")
+        async with conn.begin():
             await conn.execute(
                 text("ALTER TABLE users ADD COLUMN role VARCHAR(50) DEFAULT 'user' NOT NULL")
             )
-            logger.info("Role column added successfully")
-        else:
-            logger.debug("Role column already exists, skipping migration")
+        logger.info("Role column added successfully")
+    else:
+        logger.debug("Role column already exists, skipping migration")
 
     logger.info("Migration completed: add_role_to_users")
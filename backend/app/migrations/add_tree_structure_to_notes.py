@@ -7,19 +7,19 @@ from sqlalchemy import text
 logger = logging.getLogger(__name__)
 
 
-async def run_migration(engine):
+async def run_migration(conn, schema):
     """Add parent_id and position columns to notes table for hierarchical structure.
 
     Args:
-        engine: SQLAlchemy async engine
+        conn: Database connection, with no transaction open
+        schema: Column names per table, loaded before this migration's phase
     """
     logger.info("Migration: Adding tree structure to notes table")
 
-    async with engine.begin() as conn:
-        # Check if columns already exist
-        result = await conn.execute(text("PRAGMA table_info(notes)"))
-        columns = [row[1] for row in result.fetchall()]
+    columns = schema.get("notes", ())
 
+    # The index is not part of the model, so it is created here even if the columns exist
+    async with conn.begin():
         if "parent_id" not in columns:
             logger.info("Adding parent_id column to notes table...")
             await conn.execute(
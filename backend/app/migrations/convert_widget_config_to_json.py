@@ -0,0 +1,54 @@
+"""Migration: Store widget configs as native JSON."""
+
+import logging
+
+from sqlalchemy import inspect, text
+from sqlalchemy.dialects.postgresql import JSONB
+
+logger = logging.getLogger(__name__)
+
+# SQLite predicate matching configs that are not valid JSON objects
+_INVALID_CONFIG = "json_valid(config) = 0 OR json_type(config) != 'object'"
+
+
+async def run_migration(conn, schema):
+    """Prepare the widgets.config column for the JSON column type.
+
+    On SQLite the column keeps its TEXT storage, so only values that are not
+    valid JSON objects are reset to an empty object. On PostgreSQL the column
+    is converted to JSONB.
+
+    Args:
+        conn: Database connection, with no transaction open
+        schema: Column names per table, loaded before this migration's phase
+    """
+    logger.info("Migration: Converting widget configs to JSON")
+
+    if conn.dialect.name == "postgresql":
+        columns = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_columns("widgets"))
+        # Reflection began a transaction; end it so the conversion can begin its own
+        await conn.rollback()
+        config_type = next(column["type"] for column in columns if column["name"] == "config")
+        if not isinstance(config_type, JSONB):
+            logger.info("Converting widgets.config column to JSONB...")
+            async with conn.begin():
+                await conn.execute(
+                    text("ALTER TABLE widgets ALTER COLUMN config TYPE jsonb USING config::jsonb")
+                )
+            logger.info("widgets.config column converted successfully")
+        else:
+            logger.debug("widgets.config is already JSONB, skipping conversion")
+    else:
+        # Look for an invalid config read-only first, so a clean table never takes the
+        # write lock on startup
+        result = await conn.execute(text(f"SELECT 1 FROM widgets WHERE {_INVALID_CONFIG} LIMIT 1"))
+        has_invalid_config = result.first() is not None
+        await conn.rollback()
+        if has_invalid_config:
+            async with conn.begin():
+                result = await conn.execute(
+                    text(f"UPDATE widgets SET config = '{{}}' WHERE {_INVALID_CONFIG}")
+                )
+            logger.warning("Reset %s invalid widget configs to empty objects", result.rowcount)
+
+    logger.info("Migration completed: convert_widget_config_to_json")
@@ -7,23 +7,18 @@ from sqlalchemy import text
 logger = logging.getLogger(__name__)
 
 
-async def run_migration(engine):
+async def run_migration(conn, schema):
     """Create ai_tools table if it doesn't exist.
 
     Args:
-        engine: SQLAlchemy async engine
+        conn: Database connection, with no transaction open
+        schema: Column names per table, loaded before this migration's phase
     """
     logger.info("Migration: Checking for ai_tools table")
 
-    async with engine.begin() as conn:
-        # Check if ai_tools table already exists
-        result = await conn.execute(
-            text("SELECT name FROM sqlite_master WHERE type='table' AND name='ai_tools'")
-        )
-        table_exists = result.fetchone() is not None
-
-        if not table_exists:
-            logger.info("Creating ai_tools table...")
+    if "ai_tools" not in schema:
+        logger.info("Creating ai_tools table...")
+        async with conn.begin():
             await conn.execute(
                 text(
                     """
@@ -46,9 +41,8 @@ async def run_migration(engine):
             await conn.execute(
                 text("CREATE INDEX IF NOT EXISTS idx_ai_tools_user_id ON ai_tools(user_id)")
             )
-
-            logger.info("AI tools table created successfully")
-        else:
-            logger.debug("AI tools table already exists, skipping creation")
+        logger.info("AI tools table created successfully")
+    else:
+        logger.debug("AI tools table already exists, skipping creation")
 
     logger.info("Migration completed: create_ai_tools_table")
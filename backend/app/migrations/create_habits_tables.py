@@ -7,23 +7,18 @@ from sqlalchemy import text
 logger = logging.getLogger(__name__)
 
 
-async def run_migration(engine):
+async def run_migration(conn, schema):
     """Create habits and habit_completions tables if they don't exist.
 
     Args:
-        engine: SQLAlchemy async engine
+        conn: Database connection, with no transaction open
+        schema: Column names per table, loaded before this migration's phase
     """
     logger.info("Migration: Checking for habits tables")
 
-    async with engine.begin() as conn:
-        # Check if habits table already exists
-        result = await conn.execute(
-            text("SELECT name FROM sqlite_master WHERE type='table' AND name='habits'")
-        )
-        habits_table_exists = result.fetchone() is not None
-
-        if not habits_table_exists:
-            logger.info("Creating habits table...")
+    if "habits" not in schema:
+        logger.info("Creating habits table...")
+        async with conn.begin():
             await conn.execute(
                 text(
                     """
@@ -49,19 +44,13 @@ async def run_migration(engine):
             await conn.execute(
                 text("CREATE INDEX IF NOT EXISTS idx_habits_user_id ON habits(user_id)")
             )
+        logger.info("Habits table created successfully")
+    else:
+        logger.debug("Habits table already exists, skipping creation")
 
-            logger.info("Habits table created successfully")
-        else:
-            logger.debug("Habits table already exists, skipping creation")
-
-        # Check if habit_completions table already exists
-        result = await conn.execute(
-            text("SELECT name FROM sqlite_master WHERE type='table' AND name='habit_completions'")
-        )
-        completions_table_exists = result.fetchone() is not None
-
-        if not completions_table_exists:
-            logger.info("Creating habit_completions table...")
+    if "habit_completions" not in schema:
+        logger.info("Creating habit_completions table...")
+        async with conn.begin():
             await conn.execute(
                 text(
                     """
@@ -96,9 +85,8 @@ async def run_migration(engine):
                     "CREATE INDEX IF NOT EXISTS idx_habit_completions_date ON habit_completions(completion_date)"
                 )
             )
-
-            logger.info("Habit completions table created successfully")
-        else:
-            logger.debug("Habit completions table already exists, skipping creation")
+        logger.info("Habit completions table created successfully")
+    else:
+        logger.debug("Habit completions table already exists, skipping creation")
 
     logger.info("Migration completed: create_habits_tables")
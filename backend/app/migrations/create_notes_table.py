@@ -7,23 +7,18 @@ from sqlalchemy import text
 logger = logging.getLogger(__name__)
 
 
-async def run_migration(engine):
+async def run_migration(conn, schema):
     """Create notes table if it doesn't exist.
 
     Args:
-        engine: SQLAlchemy async engine
+        conn: Database connection, with no transaction open
+        schema: Column names per table, loaded before this migration's phase
     """
     logger.info("Migration: Checking for notes table")
 
-    async with engine.begin() as conn:
-        # Check if notes table already exists
-        result = await conn.execute(
-            text("SELECT name FROM sqlite_master WHERE type='table' AND name='notes'")
-        )
-        notes_table_exists = result.fetchone() is not None
-
-        if not notes_table_exists:
-            logger.info("Creating notes table...")
+    if "notes" not in schema:
+        logger.info("Creating notes table...")
+        async with conn.begin():
             await conn.execute(
                 text(
                     """
@@ -47,9 +42,8 @@ async def run_migration(engine):
             await conn.execute(
                 text("CREATE INDEX IF NOT EXISTS idx_notes_created ON notes(created)")
             )
-
-            logger.info("Notes table created successfully")
-        else:
-            logger.debug("Notes table already exists, skipping creation")
+        logger.info("Notes table created successfully")
+    else:
+        logger.debug("Notes table already exists, skipping creation")
 
     logger.info("Migration completed: create_notes_table")
@@ -7,23 +7,18 @@ from sqlalchemy import text
 logger = logging.getLogger(__name__)
 
 
-async def run_migration(engine):
+async def run_migration(conn, schema):
     """Create preferences table if it doesn't exist.
 
     Args:
-        engine: SQLAlchemy async engine
+        conn: Database connection, with no transaction open
+        schema: Column names per table, loaded before this migration's phase
     """
     logger.info("Migration: Checking for preferences table")
 
-    async with engine.begin() as conn:
-        # Check if preferences table already exists
-        result = await conn.execute(
-            text("SELECT name FROM sqlite_master WHERE type='table' AND name='preferences'")
-        )
-        table_exists = result.fetchone() is not None
-
-        if not table_exists:
-            logger.info("Creating preferences table...")
+    if "preferences" not in schema:
+        logger.info("Creating preferences table...")
+        async with conn.begin():
             await conn.execute(
                 text(
                     """
@@ -35,8 +30,8 @@ async def run_migration(engine):
             """
                 )
             )
-            logger.info("Preferences table created successfully")
-        else:
-            logger.debug("Preferences table already exists, skipping migration")
+        logger.info("Preferences table created successfully")
+    else:
+        logger.debug("Preferences table already exists, skipping migration")
 
     logger.info("Migration completed: create_preferences_table")
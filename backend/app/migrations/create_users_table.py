@@ -7,23 +7,18 @@ from sqlalchemy import text
 logger = logging.getLogger(__name__)
 
 
-async def run_migration(engine):
+async def run_migration(conn, schema):
     """Create users table if it doesn't exist.
 
     Args:
-        engine: SQLAlchemy async engine
+        conn: Database connection, with no transaction open
+        schema: Column names per table, loaded before this migration's phase
     """
     logger.info("Migration: Checking for users table")
 
-    async with engine.begin() as conn:
-        # Check if users table already exists
-        result = await conn.execute(
-            text("SELECT name FROM sqlite_master WHERE type='table' AND name='users'")
-        )
-        table_exists = result.fetchone() is not None
-
-        if not table_exists:
-            logger.info("Creating users table...")
+    if "users" not in schema:
+        logger.info("Creating users table...")
+        async with conn.begin():
             await conn.execute(
                 text(
                     """
@@ -46,9 +41,8 @@ async def run_migration(engine):
             await conn.execute(
                 text("CREATE INDEX IF NOT EXISTS idx_users_google_id ON users(google_id)")
             )
-
-            logger.info("Users table created successfully")
-        else:
-            logger.debug("Users table already exists, skipping migration")
+        logger.info("Users table created successfully")
+    else:
+        logger.debug("Users table already exists, skipping migration")
 
     logger.info("Migration completed: create_users_table")
@@ -1,9 +1,9 @@
 """Section database model for widget organization."""
 
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, NonNegativeInt
 from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -34,15 +34,28 @@ class Section(Base):
 
     def to_dict(self) -> dict:
         """Convert model to dictionary."""
+        return self.serialize(self)
+
+    @staticmethod
+    def serialize(row: Any) -> dict:
+        """
+        Convert a section row to dictionary.
+
+        Args:
+            row: Section instance or Core result row selecting the same columns
+
+        Returns:
+            Serialized section
+        """
         return {
-            "id": self.id,
-            "name": self.name,
-            "title": self.title,
-            "position": self.position,
-            "enabled": self.enabled,
-            "widget_ids": self.widget_ids.split(",") if self.widget_ids else [],
-            "created": self.created.isoformat() if self.created else None,
-            "updated": self.updated.isoformat() if self.updated else None,
+            "id": row.id,
+            "name": row.name,
+            "title": row.title,
+            "position": row.position,
+            "enabled": row.enabled,
+            "widget_ids": row.widget_ids.split(",") if row.widget_ids else [],
+            "created": row.created.isoformat() if row.created else None,
+            "updated": row.updated.isoformat() if row.updated else None,
         }
 
 
@@ -82,7 +95,14 @@ class SectionResponse(BaseModel):
         from_attributes = True
 
 
+class SectionOrderItem(BaseModel):
+    """Schema for a single section position in a reorder request."""
+
+    name: str
+    position: NonNegativeInt
+
+
 class SectionOrderUpdate(BaseModel):
     """Schema for updating section order."""
 
-    sections: List[dict]  # Array of {name: str, position: int}
+    sections: List[SectionOrderItem] = Field(min_length=1)
@@ -1,21 +1,37 @@
 """Widget database model."""
 
-import json
 import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field, field_validator
-from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Boolean, DateTime, ForeignKey, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.services.database import Base
 
+# Widget types accepted by the create/update schemas, built once at import
+_ALLOWED_WIDGET_TYPES = frozenset({"weather", "exchange_rate", "news", "market", "habit_tracking"})
+_INVALID_WIDGET_TYPE_MESSAGE = (
+    "Widget type must be one of: weather, exchange_rate, news, market, habit_tracking"
+)
+
 
 class Widget(Base):
     """Widget database model."""
 
     __tablename__ = "widgets"
+    # Partial index over enabled widgets only, for startup loading and config reloads. The
+    # predicate matches the "enabled IS true" rendered by Widget.enabled.is_(True).
+    __table_args__ = (
+        Index(
+            "ix_widgets_enabled_user",
+            "user_id",
+            sqlite_where=text("enabled IS 1"),
+            postgresql_where=text("enabled IS TRUE"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -29,7 +45,9 @@ class Widget(Base):
     position_width: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
     position_height: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
     refresh_interval: Mapped[int] = mapped_column(Integer, default=3600, nullable=False)  # seconds
-    config: Mapped[str] = mapped_column(Text, nullable=False)  # JSON string
+    config: Mapped[Dict[str, Any]] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=False
+    )
     created: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     updated: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
@@ -37,25 +55,33 @@ class Widget(Base):
 
     def to_dict(self) -> dict:
         """Convert model to dictionary."""
-        try:
-            config_dict = json.loads(self.config) if self.config else {}
-        except (json.JSONDecodeError, TypeError):
-            config_dict = {}
+        return self.serialize(self)
+
+    @staticmethod
+    def serialize(row: Any) -> dict:
+        """
+        Convert a widget row to dictionary.
+
+        Args:
+            row: Widget instance or Core result row selecting the same columns
 
+        Returns:
+            Serialized widget
+        """
         return {
-            "id": self.widget_id,
-            "type": self.widget_type,
-            "enabled": self.enabled,
+            "id": row.widget_id,
+            "type": row.widget_type,
+            "enabled": row.enabled,
             "position": {
-                "row": self.position_row,
-                "col": self.position_col,
-                "width": self.position_width,
-                "height": self.position_height,
+                "row": row.position_row,
+                "col": row.position_col,
+                "width": row.position_width,
+                "height": row.position_height,
             },
-            "refresh_interval": self.refresh_interval,
-            "config": config_dict,
-            "created": self.created.isoformat() if self.created else None,
-            "updated": self.updated.isoformat() if self.updated else None,
+            "refresh_interval": row.refresh_interval,
+            "config": row.config if isinstance(row.config, dict) else {},
+            "created": row.created.isoformat() if row.created else None,
+            "updated": row.updated.isoformat() if row.updated else None,
         }
 
 
@@ -100,9 +126,8 @@ class WidgetCreate(BaseModel):
     @classmethod
     def validate_type(cls, v: str) -> str:
         """Validate widget type."""
-        allowed_types = ["weather", "exchange_rate", "news", "market", "habit_tracking"]
-        if v not in allowed_types:
-            raise ValueError(f'Widget type must be one of: {", ".join(allowed_types)}')
+        if v not in _ALLOWED_WIDGET_TYPES:
+            raise ValueError(_INVALID_WIDGET_TYPE_MESSAGE)
         return v
 
 
@@ -122,9 +147,8 @@ class WidgetUpdate(BaseModel):
     def validate_type(cls, v: Optional[str]) -> Optional[str]:
         """Validate widget type."""
         if v is not None:
-            allowed_types = ["weather", "exchange_rate", "news", "market", "habit_tracking"]
-            if v not in allowed_types:
-                raise ValueError(f'Widget type must be one of: {", ".join(allowed_types)}')
+            if v not in _ALLOWED_WIDGET_TYPES:
+                raise ValueError(_INVALID_WIDGET_TYPE_MESSAGE)
         return v
 
 
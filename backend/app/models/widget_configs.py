@@ -235,6 +235,9 @@ WIDGET_CONFIG_SCHEMAS = {
     "habit_tracking": HabitTrackingWidgetConfig,
 }
 
+# Precomputed for unknown-type error messages
+_ALLOWED_WIDGET_TYPES = ", ".join(WIDGET_CONFIG_SCHEMAS)
+
 
 def validate_widget_config(widget_type: str, config: dict) -> dict:
     """
@@ -250,11 +253,12 @@ def validate_widget_config(widget_type: str, config: dict) -> dict:
     Raises:
         ValueError: If widget type is unknown or configuration is invalid
     """
-    if widget_type not in WIDGET_CONFIG_SCHEMAS:
+    schema_class = WIDGET_CONFIG_SCHEMAS.get(widget_type)
+    if schema_class is None:
         raise ValueError(
-            f"Unknown widget type: {widget_type}. Allowed types: {', '.join(WIDGET_CONFIG_SCHEMAS.keys())}"
+            f"Unknown widget type: {widget_type}. Allowed types: {_ALLOWED_WIDGET_TYPES}"
         )
 
-    schema_class = WIDGET_CONFIG_SCHEMAS[widget_type]
-    validated_config = schema_class(**config)
-    return validated_config.model_dump()
+    # model_validate runs the schema's validator compiled at class creation directly on the
+    # dict, without unpacking it into keyword arguments
+    return schema_class.model_validate(config).model_dump()
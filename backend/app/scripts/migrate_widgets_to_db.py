@@ -1,7 +1,6 @@
 """Migration script to import widgets from YAML to database."""
 
 import asyncio
-import json
 import logging
 import sys
 from pathlib import Path
@@ -80,7 +79,7 @@ async def migrate_widgets():
                 position_width=position.get("width", 1),
                 position_height=position.get("height", 1),
                 refresh_interval=widget_config.get("refresh_interval", 3600),
-                config=json.dumps(widget_config.get("config", {})),
+                config=widget_config.get("config", {}),
             )
 
             session.add(widget)
@@ -26,7 +26,7 @@ class AIToolService:
             .order_by(AITool.created.desc())
         )
         tools = result.scalars().all()
-        logger.info(f"Listed {len(tools)} AI tools for user {user_id}")
+        logger.info("Listed %s AI tools for user %s", len(tools), user_id)
         return tools
 
     async def get_tool(self, tool_id: int, user_id: int) -> Optional[AITool]:
@@ -36,7 +36,7 @@ class AIToolService:
         )
         tool = result.scalar_one_or_none()
         if tool:
-            logger.info(f"Retrieved AI tool {tool_id} for user {user_id}")
+            logger.info("Retrieved AI tool %s for user %s", tool_id, user_id)
         else:
             logger.warning(f"AI tool {tool_id} not found for user {user_id}")
         return tool
@@ -53,7 +53,7 @@ class AIToolService:
         self.db.add(tool)
         await self.db.commit()
         await self.db.refresh(tool)
-        logger.info(f"Created AI tool {tool.id} for user {user_id}")
+        logger.info("Created AI tool %s for user %s", tool.id, user_id)
         return tool
 
     async def update_tool(
@@ -75,7 +75,7 @@ class AIToolService:
 
         await self.db.commit()
         await self.db.refresh(tool)
-        logger.info(f"Updated AI tool {tool_id} for user {user_id}")
+        logger.info("Updated AI tool %s for user %s", tool_id, user_id)
         return tool
 
     async def delete_tool(self, tool_id: int, user_id: int) -> bool:
@@ -86,5 +86,5 @@ class AIToolService:
 
         await self.db.delete(tool)
         await self.db.commit()
-        logger.info(f"Deleted AI tool {tool_id} for user {user_id}")
+        logger.info("Deleted AI tool %s for user %s", tool_id, user_id)
         return True
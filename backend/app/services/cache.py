@@ -1,23 +1,50 @@
 """Caching service using Redis."""
 
-import json
-from typing import Any, Optional
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import orjson
 import redis.asyncio as redis
 
 from app.config import settings
+from app.constants import (
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_KEY_PREFIX_WIDGET,
+    CACHE_KEY_PREFIX_WIDGET_LIST,
+    CACHE_SCAN_COUNT,
+    WIDGET_DATA_LOCAL_CACHE_MAX_SIZE,
+    WIDGET_DATA_LOCAL_CACHE_TTL,
+)
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
 class CacheService:
-    """Redis-based caching service."""
+    """
+    Redis-based caching service.
+
+    Widget data keys are additionally held in a small process-local (L1) cache so hot
+    polling does not round-trip to Redis. Writes and deletes of those keys are published
+    on a Redis channel, and every worker evicts the published keys from its L1 cache.
+    """
 
     def __init__(self):
         """Initialize cache service."""
         self._redis: Optional[redis.Redis] = None
         self._enabled = settings.REDIS_ENABLED
+        # Format: {cache_key: (expiration_timestamp, value)}
+        self._local: Dict[str, Tuple[float, Any]] = {}
+        # Invalidation counts per local key, and an epoch bumped whenever the local cache is
+        # cleared or the counts are reset; a Redis read only fills the local cache if its
+        # key's (epoch, count) did not change while the read was in flight
+        self._local_invalidations: Dict[str, int] = {}
+        self._local_epoch = 0
+        # Identifies this process's own invalidation messages
+        self._instance_id = uuid.uuid4().hex
+        self._listener_task: Optional[asyncio.Task] = None
 
     async def connect(self):
         """Connect to Redis."""
@@ -33,6 +60,7 @@ class CacheService:
             self._redis = redis.from_url(settings.REDIS_URL, decode_responses=True)
             # Test connection
             await self._redis.ping()
+            self._listener_task = asyncio.create_task(self._listen_for_invalidations())
             logger.info(
                 "Connected to Redis successfully",
                 extra={"operation": "cache_connected", "cache_type": "redis"},
@@ -51,6 +79,15 @@ class CacheService:
 
     async def disconnect(self):
         """Disconnect from Redis."""
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        self._clear_local()
+
         if self._redis:
             await self._redis.close()
             logger.info(
@@ -75,11 +112,35 @@ class CacheService:
             )
             return None
 
+        local = self._is_local(key)
+        if local:
+            entry = self._local.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    return entry[1]
+                self._local.pop(key, None)
+
         try:
-            value = await self._redis.get(key)
+            if local:
+                version = self._local_version(key)
+                # Fetch the remaining TTL in the same round-trip, so the local copy never
+                # outlives the Redis key
+                pipe = self._redis.pipeline(transaction=False)
+                pipe.get(key)
+                pipe.pttl(key)
+                value, pttl = await pipe.execute()
+            else:
+                value = await self._redis.get(key)
             if value:
                 logger.debug("Cache hit", extra={"operation": "cache_hit", "cache_key": key})
-                return json.loads(value)
+                decoded = orjson.loads(value)
+                # Skip the local copy if the key was invalidated while the read was in flight
+                if local and self._local_version(key) == version:
+                    ttl = WIDGET_DATA_LOCAL_CACHE_TTL
+                    if pttl >= 0:  # negative: no expiry
+                        ttl = min(ttl, pttl / 1000)
+                    self._set_local(key, decoded, ttl)
+                return decoded
             logger.debug("Cache miss", extra={"operation": "cache_miss", "cache_key": key})
             return None
         except Exception as e:
@@ -111,15 +172,30 @@ class CacheService:
             return
 
         try:
-            serialized = json.dumps(value)
+            serialized = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+            local = self._is_local(key)
+            # Pipeline the write with its invalidation message in one round-trip
+            pipe = self._redis.pipeline(transaction=False)
+            if ttl:
+                pipe.setex(key, ttl, serialized)
+            else:
+                pipe.set(key, serialized)
+            if local:
+                self._publish_invalidation(pipe, [key])
+            await pipe.execute()
+
+            if local:
+                # Also fences off reads of the previous value still in flight
+                self._invalidate_local(key)
+                self._set_local(
+                    key, value, min(ttl or WIDGET_DATA_LOCAL_CACHE_TTL, WIDGET_DATA_LOCAL_CACHE_TTL)
+                )
             if ttl:
-                await self._redis.setex(key, ttl, serialized)
                 logger.debug(
                     "Cache value set with TTL",
                     extra={"operation": "cache_set", "cache_key": key, "ttl_seconds": ttl},
                 )
             else:
-                await self._redis.set(key, serialized)
                 logger.debug("Cache value set", extra={"operation": "cache_set", "cache_key": key})
         except Exception as e:
             logger.error(
@@ -147,7 +223,14 @@ class CacheService:
             return
 
         try:
-            await self._redis.delete(key)
+            if self._is_local(key):
+                self._invalidate_local(key)
+                pipe = self._redis.pipeline(transaction=False)
+                pipe.delete(key)
+                self._publish_invalidation(pipe, [key])
+                await pipe.execute()
+            else:
+                await self._redis.delete(key)
             logger.debug(
                 "Cache value deleted", extra={"operation": "cache_delete", "cache_key": key}
             )
@@ -162,6 +245,107 @@ class CacheService:
                 exc_info=True,
             )
 
+    async def delete_many(self, keys: Iterable[str]):
+        """
+        Delete multiple values from cache in a single round-trip.
+
+        Uses UNLINK so Redis reclaims the memory in a background thread.
+
+        Args:
+            keys: Cache keys
+        """
+        keys = list(keys)
+        if not keys:
+            return
+
+        if not self._enabled or not self._redis:
+            logger.debug(
+                "Cache delete skipped - cache not enabled",
+                extra={"operation": "cache_delete_many", "key_count": len(keys)},
+            )
+            return
+
+        try:
+            local_keys = [key for key in keys if self._is_local(key)]
+            if local_keys:
+                for key in local_keys:
+                    self._invalidate_local(key)
+                pipe = self._redis.pipeline(transaction=False)
+                pipe.unlink(*keys)
+                self._publish_invalidation(pipe, local_keys)
+                await pipe.execute()
+            else:
+                await self._redis.unlink(*keys)
+            logger.debug(
+                "Cache values deleted",
+                extra={"operation": "cache_delete_many", "key_count": len(keys)},
+            )
+        except Exception as e:
+            logger.error(
+                "Cache delete operation failed",
+                extra={
+                    "operation": "cache_delete_many_failed",
+                    "key_count": len(keys),
+                    "error_type": type(e).__name__,
+                },
+                exc_info=True,
+            )
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """
+        Delete all values whose keys match a glob-style pattern.
+
+        Walks the keyspace with SCAN rather than KEYS so Redis is never blocked, and
+        queues an UNLINK per match on a single pipeline.
+
+        Args:
+            pattern: Redis glob-style key pattern, e.g. ``widget:*``
+
+        Returns:
+            Number of keys deleted
+        """
+        if not self._enabled or not self._redis:
+            logger.debug(
+                "Cache delete skipped - cache not enabled",
+                extra={"operation": "cache_delete_pattern", "cache_pattern": pattern},
+            )
+            return 0
+
+        # Matching keys may be read concurrently without a local entry, so reset them all
+        self._clear_local()
+
+        try:
+            keys = []
+            pipe = self._redis.pipeline(transaction=False)
+            async for key in self._redis.scan_iter(match=pattern, count=CACHE_SCAN_COUNT):
+                keys.append(key)
+                pipe.unlink(key)
+            local_keys = [key for key in keys if self._is_local(key)]
+            if local_keys:
+                self._publish_invalidation(pipe, local_keys)
+            if keys:
+                await pipe.execute()
+            logger.debug(
+                "Cache values deleted by pattern",
+                extra={
+                    "operation": "cache_delete_pattern",
+                    "cache_pattern": pattern,
+                    "key_count": len(keys),
+                },
+            )
+            return len(keys)
+        except Exception as e:
+            logger.error(
+                "Cache delete operation failed",
+                extra={
+                    "operation": "cache_delete_pattern_failed",
+                    "cache_pattern": pattern,
+                    "error_type": type(e).__name__,
+                },
+                exc_info=True,
+            )
+            return 0
+
     async def clear(self):
         """Clear all cache entries."""
         if not self._enabled or not self._redis:
@@ -171,6 +355,7 @@ class CacheService:
             )
             return
 
+        self._clear_local()
         try:
             await self._redis.flushdb()
             logger.info("Cache cleared successfully", extra={"operation": "cache_cleared"})
@@ -181,6 +366,109 @@ class CacheService:
                 exc_info=True,
             )
 
+    @staticmethod
+    def _is_local(key: str) -> bool:
+        """Check whether a key is held in the process-local cache (widget data keys)."""
+        return key.startswith(CACHE_KEY_PREFIX_WIDGET)
+
+    def _set_local(self, key: str, value: Any, ttl: float):
+        """
+        Store a value in the process-local cache.
+
+        Args:
+            key: Cache key
+            value: Decoded value
+            ttl: Time to live in seconds
+        """
+        if key not in self._local and len(self._local) >= WIDGET_DATA_LOCAL_CACHE_MAX_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._local.pop(next(iter(self._local)))
+        self._local[key] = (time.monotonic() + ttl, value)
+
+    def _local_version(self, key: str) -> Tuple[int, int]:
+        """
+        Get the invalidation version of a process-local cache key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of the local cache epoch and the key's invalidation count
+        """
+        return self._local_epoch, self._local_invalidations.get(key, 0)
+
+    def _invalidate_local(self, key: str):
+        """
+        Evict a key from the process-local cache and bump its invalidation count.
+
+        Args:
+            key: Cache key
+        """
+        self._local.pop(key, None)
+        if (
+            key not in self._local_invalidations
+            and len(self._local_invalidations) >= WIDGET_DATA_LOCAL_CACHE_MAX_SIZE
+        ):
+            # Bound the counts; the new epoch stands in for every count dropped
+            self._local_invalidations.clear()
+            self._local_epoch += 1
+        self._local_invalidations[key] = self._local_invalidations.get(key, 0) + 1
+
+    def _clear_local(self):
+        """Evict every key from the process-local cache."""
+        self._local.clear()
+        self._local_invalidations.clear()
+        self._local_epoch += 1
+
+    def _publish_invalidation(self, pipe: Any, keys: List[str]):
+        """
+        Queue an invalidation message for process-local cache keys on a pipeline.
+
+        Args:
+            pipe: Redis pipeline
+            keys: Keys other workers should evict
+        """
+        message = orjson.dumps({"origin": self._instance_id, "keys": keys})
+        pipe.publish(CACHE_INVALIDATION_CHANNEL, message)
+
+    def _handle_invalidation(self, payload: str):
+        """
+        Evict the keys of an invalidation message published by another worker.
+
+        Args:
+            payload: Encoded invalidation message
+        """
+        data = orjson.loads(payload)
+        if data["origin"] == self._instance_id:
+            return
+        for key in data["keys"]:
+            self._invalidate_local(key)
+
+    async def _listen_for_invalidations(self):
+        """Evict keys published by other workers from the process-local cache."""
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._handle_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Messages may have been missed, so nothing in the local cache can be trusted
+                self._clear_local()
+                logger.warning(
+                    "Cache invalidation listener failed, retrying",
+                    extra={
+                        "operation": "cache_invalidation_listener",
+                        "error_type": type(e).__name__,
+                    },
+                )
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
     async def health_check(self) -> dict:
         """Check the health of the Redis connection.
 
@@ -233,3 +521,16 @@ cache_service = CacheService()
 async def get_cache_service() -> CacheService:
     """Dependency to get cache service instance."""
     return cache_service
+
+
+def widget_list_cache_key(user_id: int) -> str:
+    """
+    Get the cache key for a user's widget list response.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Cache key string
+    """
+    return f"{CACHE_KEY_PREFIX_WIDGET_LIST}{user_id}"
@@ -1,15 +1,114 @@
 """Database connection and initialization."""
 
+import logging
+from typing import Any, Dict
+
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Applied to every new SQLite connection. WAL lets readers proceed while a write is in
+# progress, and synchronous=NORMAL is durable under WAL except on power loss.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",  # 64 MB
+    "PRAGMA mmap_size=268435456",  # 256 MB
+)
+
+
+def set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any):
+    """
+    Configure a new SQLite connection for concurrent access.
+
+    Args:
+        dbapi_connection: DBAPI connection being opened
+        connection_record: Pool record of the connection
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def get_engine_connect_args(database_url: str, statement_cache_size: int) -> Dict[str, Any]:
+    """
+    Get driver connect arguments enabling the prepared statement cache.
+
+    Statements issued by the application have stable SQL text, so keeping them
+    prepared per connection skips re-parsing on every execution.
+
+    Args:
+        database_url: SQLAlchemy database URL
+        statement_cache_size: Number of prepared statements cached per connection
+
+    Returns:
+        Keyword arguments passed to the DBAPI connect call
+    """
+    if database_url.startswith("sqlite"):
+        return {"cached_statements": statement_cache_size}
+    if database_url.startswith("postgresql+asyncpg"):
+        return {
+            "prepared_statement_cache_size": statement_cache_size,
+            "statement_cache_size": statement_cache_size,
+        }
+    return {}
+
+
+def get_engine_pool_args(database_url: str) -> Dict[str, Any]:
+    """
+    Get connection pool arguments for the async engine.
+
+    In-memory SQLite uses a single static connection, so no queue pool
+    arguments apply to it. File-based aiosqlite defaults to NullPool, which
+    opens a connection per checkout, so a queue pool is requested explicitly.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Keyword arguments passed to create_async_engine
+    """
+    is_sqlite = database_url.startswith("sqlite")
+    if is_sqlite and (":memory:" in database_url or database_url.endswith("://")):
+        return {}
+
+    pool_args: Dict[str, Any] = {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+    if is_sqlite:
+        pool_args["poolclass"] = AsyncAdaptedQueuePool
+    return pool_args
+
+
 # Create async engine
-engine = create_async_engine(settings.DATABASE_URL, echo=settings.DEBUG, future=True)
+engine = create_async_engine(
+    settings.DATABASE_URL,
+    echo=settings.DEBUG,
+    future=True,
+    connect_args=get_engine_connect_args(
+        settings.DATABASE_URL, settings.DATABASE_STATEMENT_CACHE_SIZE
+    ),
+    **get_engine_pool_args(settings.DATABASE_URL),
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+)
+if settings.DATABASE_URL.startswith("sqlite"):
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
 
 # Create session maker
 AsyncSessionLocal = async_sessionmaker(
@@ -25,12 +124,16 @@ class Base(DeclarativeBase):
 
 async def get_db() -> AsyncSession:
     """Dependency to get database session."""
+    # Checked once per session; avoids building log extras on every request
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     async with AsyncSessionLocal() as session:
         try:
-            logger.debug("Database session created", extra={"operation": "session_creation"})
+            if debug_enabled:
+                logger.debug("Database session created", extra={"operation": "session_creation"})
             yield session
             await session.commit()
-            logger.debug("Database session committed", extra={"operation": "session_commit"})
+            if debug_enabled:
+                logger.debug("Database session committed", extra={"operation": "session_commit"})
         except Exception as e:
             # Log expected HTTP exceptions at debug level
             error_type = type(e).__name__
@@ -48,7 +151,8 @@ async def get_db() -> AsyncSession:
             raise
         finally:
             await session.close()
-            logger.debug("Database session closed", extra={"operation": "session_close"})
+            if debug_enabled:
+                logger.debug("Database session closed", extra={"operation": "session_close"})
 
 
 def get_async_session():
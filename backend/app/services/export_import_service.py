@@ -16,6 +16,8 @@ from app.models.preference import Preference
 from app.models.section import Section
 from app.models.user import User
 from app.models.widget import Widget
+from app.services.cache import cache_service, widget_list_cache_key
+from app.services.section_service import invalidate_sections_cache
 
 
 class ExportImportService:
@@ -134,6 +136,8 @@ class ExportImportService:
         deleted_preferences = preference_result.rowcount
 
         await db.commit()
+        invalidate_sections_cache(user_id)
+        await cache_service.delete(widget_list_cache_key(user_id))
 
         return {
             "deleted_bookmarks": deleted_bookmarks,
@@ -291,7 +295,7 @@ class ExportImportService:
                     "position_width": widget.get("position", {}).get("width"),
                     "position_height": widget.get("position", {}).get("height"),
                     "refresh_interval": widget.get("refresh_interval"),
-                    "config": json.dumps(widget.get("config", {})),
+                    "config": widget.get("config", {}),
                     "created": widget.get("created"),
                     "updated": widget.get("updated"),
                 }
@@ -243,7 +243,13 @@ class NoteService:
                     sibling.position = idx
 
                 logger.debug(
-                    f"Swapped positions: note {note_id} ({old_position}->{new_position}) with note {target_note.id} ({new_position}->{old_position})",
+                    "Swapped positions: note %s (%s->%s) with note %s (%s->%s)",
+                    note_id,
+                    old_position,
+                    new_position,
+                    target_note.id,
+                    new_position,
+                    old_position,
                     extra={
                         "operation": "reorder_note_swap",
                         "note_id": note_id,
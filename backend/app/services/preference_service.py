@@ -71,12 +71,12 @@ class PreferenceService:
         if preference:
             # Update existing preference
             preference.value = value
-            logger.debug(f"Updating preference for user {user_id}: {key} = {value}")
+            logger.debug("Updating preference for user %s: %s = %s", user_id, key, value)
         else:
             # Create new preference
             preference = Preference(user_id=user_id, key=key, value=value)
             db.add(preference)
-            logger.debug(f"Creating preference for user {user_id}: {key} = {value}")
+            logger.debug("Creating preference for user %s: %s = %s", user_id, key, value)
 
         await db.commit()
         await db.refresh(preference)
@@ -3,13 +3,23 @@
 This module configures rate limiting with Redis support for multi-instance deployments.
 When Redis is enabled and available, rate limits are shared across all application
 instances. If Redis is unavailable, it falls back to in-memory storage.
+
+High-traffic endpoints can instead use the in-process token bucket provided by
+``token_bucket_limit``, which performs no I/O per request. Its limits apply per
+application process rather than globally.
 """
 
-import os
+import math
+import time
+from typing import Callable, Dict, Optional
 
+from fastapi import HTTPException, Request
+from limits import parse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from app.config import settings
+from app.constants import RATE_LIMIT_STRATEGY
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -24,8 +34,8 @@ def get_rate_limit_storage_uri() -> str | None:
     Returns:
         Storage URI for rate limiting or None for in-memory storage.
     """
-    redis_enabled = os.getenv("REDIS_ENABLED", "true").lower() == "true"
-    redis_url = os.getenv("REDIS_URL", "redis://redis:6379")
+    redis_enabled = settings.REDIS_ENABLED
+    redis_url = settings.REDIS_URL
 
     if redis_enabled and redis_url:
         logger.info(
@@ -44,10 +54,153 @@ def get_rate_limit_storage_uri() -> str | None:
 # Create limiter instance that will be shared across the application
 # Uses Redis for multi-instance deployment support when available
 # in_memory_fallback_enabled ensures the app continues working if Redis fails
+# The sliding window counter weights the previous window's count by its overlap with the
+# trailing period, so a client cannot fit twice the limit into a short span straddling a
+# fixed window boundary. Unlike the moving window, which keeps one entry per hit, it stores
+# two counters per key, so each check costs the same whatever the limit.
 _storage_uri = get_rate_limit_storage_uri()
 limiter = Limiter(
     key_func=get_remote_address,
     default_limits=["100/minute"],
     storage_uri=_storage_uri,
+    strategy=RATE_LIMIT_STRATEGY,
     in_memory_fallback_enabled=True,  # Fall back to memory if Redis fails
 )
+
+
+class TokenBucket:
+    """Token bucket state for a single rate limit key."""
+
+    __slots__ = ("tokens", "last")
+
+    def __init__(self, tokens: float, last: float):
+        """
+        Initialize token bucket.
+
+        Args:
+            tokens: Initial number of tokens
+            last: Timestamp of the last refill
+        """
+        self.tokens = tokens
+        self.last = last
+
+    def take(self, rate: float, burst: int, now: float) -> bool:
+        """
+        Refill the bucket and try to take a single token.
+
+        Args:
+            rate: Refill rate in tokens per second
+            burst: Bucket capacity
+            now: Current monotonic timestamp
+
+        Returns:
+            True if a token was taken, False if the bucket is empty
+        """
+        self.tokens = min(burst, self.tokens + (now - self.last) * rate)
+        self.last = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class TokenBucketLimiter:
+    """In-process token bucket rate limiter keyed by an arbitrary string."""
+
+    def __init__(self, limit: str):
+        """
+        Initialize token bucket limiter.
+
+        Args:
+            limit: Rate limit string in slowapi notation (e.g. "100/minute")
+        """
+        item = parse(limit)
+        self.limit = limit
+        self.burst = item.amount
+        self.rate = item.amount / item.get_expiry()
+        # A bucket idle this long has refilled completely and can be dropped
+        self._idle_timeout = item.get_expiry()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._last_eviction = time.monotonic()
+
+    def hit(self, key: str, now: Optional[float] = None) -> bool:
+        """
+        Consume a token for the given key.
+
+        Args:
+            key: Rate limit key (e.g. client address)
+            now: Current monotonic timestamp (defaults to time.monotonic())
+
+        Returns:
+            True if the request is allowed, False if rate limited
+        """
+        if now is None:
+            now = time.monotonic()
+
+        if now - self._last_eviction > self._idle_timeout:
+            self._evict(now)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self.burst, now)
+        return bucket.take(self.rate, self.burst, now)
+
+    def retry_after(self, key: str) -> int:
+        """
+        Get the number of seconds until the next token is available.
+
+        Args:
+            key: Rate limit key
+
+        Returns:
+            Seconds to wait before retrying
+        """
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return 0
+        return max(1, math.ceil((1 - bucket.tokens) / self.rate))
+
+    def _evict(self, now: float) -> None:
+        """Drop buckets that have been idle long enough to be full again."""
+        idle = [
+            key for key, bucket in self._buckets.items() if now - bucket.last > self._idle_timeout
+        ]
+        for key in idle:
+            del self._buckets[key]
+        self._last_eviction = now
+
+
+def token_bucket_limit(limit: str) -> Callable:
+    """
+    Create a FastAPI dependency enforcing an in-process token bucket rate limit.
+
+    Each call creates an independent limiter, so use one per endpoint. Requests are
+    keyed by client address, matching the slowapi limiter. Because buckets are
+    already sharded per endpoint, the key is the bare address string; no composite
+    "key:route" string is built or hashed per request.
+
+    Args:
+        limit: Rate limit string in slowapi notation (e.g. "100/minute")
+
+    Returns:
+        Dependency callable raising HTTP 429 when the limit is exceeded
+    """
+    bucket_limiter = TokenBucketLimiter(limit)
+
+    async def dependency(request: Request) -> None:
+        if not limiter.enabled:
+            return
+
+        key = get_remote_address(request)
+        if not bucket_limiter.hit(key):
+            logger.warning(
+                "Rate limit exceeded",
+                extra={"path": request.url.path, "limit": limit, "limiter": "token_bucket"},
+            )
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded: {limit}",
+                headers={"Retry-After": str(bucket_limiter.retry_after(key))},
+            )
+
+    return dependency
@@ -6,29 +6,123 @@ separated from the API layer for better maintainability and testability.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, case, delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.section import Section, SectionCreate, SectionUpdate
+from app.constants import SECTIONS_CACHE_MAX_SIZE, SECTIONS_CACHE_TTL
+from app.models.section import Section, SectionCreate, SectionOrderItem, SectionUpdate
+from app.utils.etag import compute_etag
 
 logger = logging.getLogger(__name__)
 
+# Set once the startup check has run so it executes at most once per process
+_default_sections_initialized = False
+
+# Statements reused across requests; values are supplied as bound parameters
+_SELECT_ALL_ORDERED = select(Section).order_by(Section.position)
+_SELECT_BY_USER_ORDERED = (
+    select(Section).where(Section.user_id == bindparam("user_id")).order_by(Section.position)
+)
+_SELECT_COLUMNS_BY_USER_ORDERED = (
+    select(
+        Section.id,
+        Section.name,
+        Section.title,
+        Section.position,
+        Section.enabled,
+        Section.widget_ids,
+        Section.created,
+        Section.updated,
+    )
+    .where(Section.user_id == bindparam("user_id"))
+    .order_by(Section.position)
+)
+_SELECT_BY_ID = select(Section).where(Section.id == bindparam("section_id"))
+_SELECT_ID_BY_NAME = select(Section.id).where(Section.name == bindparam("name")).limit(1)
+
+# Process-local cache of serialized section lists and their ETags
+# Format: {user_id: (expiration_timestamp, [section_dict, ...], etag)}
+_sections_cache: Dict[int, Tuple[float, List[Dict[str, Any]], str]] = {}
+
+
+def get_cached_sections(user_id: int) -> Optional[Tuple[List[Dict[str, Any]], str]]:
+    """
+    Get a user's cached section list if present and not expired.
+
+    Args:
+        user_id: User ID
+
+    Returns:
+        Tuple of (serialized sections, ETag), or None on cache miss
+    """
+    entry = _sections_cache.get(user_id)
+    if entry is None:
+        return None
+    expiration, sections, etag = entry
+    if time.monotonic() > expiration:
+        _sections_cache.pop(user_id, None)
+        return None
+    return sections, etag
+
+
+def set_cached_sections(user_id: int, sections: List[Dict[str, Any]]) -> str:
+    """
+    Cache a user's serialized section list.
+
+    Args:
+        user_id: User ID
+        sections: List of serialized sections
+
+    Returns:
+        ETag of the cached section list
+    """
+    if user_id not in _sections_cache and len(_sections_cache) >= SECTIONS_CACHE_MAX_SIZE:
+        # Evict the oldest entry (dicts preserve insertion order)
+        _sections_cache.pop(next(iter(_sections_cache)), None)
+    etag = compute_etag(sections)
+    _sections_cache[user_id] = (time.monotonic() + SECTIONS_CACHE_TTL, sections, etag)
+    return etag
+
+
+def invalidate_sections_cache(user_id: Optional[int] = None) -> None:
+    """
+    Invalidate cached section lists.
+
+    Must be called after every write to the sections table.
+
+    Args:
+        user_id: User ID to invalidate, or None to invalidate all users
+    """
+    if user_id is None:
+        _sections_cache.clear()
+    else:
+        _sections_cache.pop(user_id, None)
+
 
 async def initialize_default_sections(db: AsyncSession):
     """
     Initialize default sections if none exist (legacy, kept for backwards compatibility).
 
+    Called from the application lifespan, never from request handlers. Subsequent
+    calls in the same process are no-ops.
+
     Args:
         db: Database session
     """
-    result = await db.execute(select(Section))
-    existing = result.scalars().all()
+    global _default_sections_initialized
+    if _default_sections_initialized:
+        return
 
-    if not existing:
+    result = await db.execute(select(Section.id).limit(1))
+
+    if result.scalar_one_or_none() is None:
         logger.info("No sections found. Sections should be created per-user.")
 
+    _default_sections_initialized = True
+
 
 async def initialize_default_sections_for_user(db: AsyncSession, user_id: int):
     """
@@ -42,13 +136,15 @@ async def initialize_default_sections_for_user(db: AsyncSession, user_id: int):
         db: Database session
         user_id: User ID to create sections for
     """
-    # Get user's existing sections
-    result = await db.execute(select(Section).where(Section.user_id == user_id))
-    existing = result.scalars().all()
-    existing_names = {section.name for section in existing}
+    # Get user's existing section names and positions
+    result = await db.execute(
+        select(Section.name, Section.position).where(Section.user_id == user_id)
+    )
+    existing = result.all()
+    existing_names = {row.name for row in existing}
 
     # Get the max position to place new sections after existing ones
-    max_position = max((section.position for section in existing), default=-1)
+    max_position = max((row.position for row in existing), default=-1)
 
     default_sections = [
         {
@@ -93,25 +189,25 @@ async def initialize_default_sections_for_user(db: AsyncSession, user_id: int):
         },
     ]
 
-    # Create only missing sections
-    created_count = 0
+    # Collect only missing sections, placed after existing ones
+    new_sections = []
     for section_data in default_sections:
         if section_data["name"] not in existing_names:
-            # Place new sections after existing ones
             max_position += 1
             # Create a copy to avoid modifying the original dict
             new_section_data = section_data.copy()
             new_section_data["position"] = max_position
-            section = Section(**new_section_data)
-            db.add(section)
-            created_count += 1
-            logger.debug(f"Creating missing section '{section_data['name']}' for user {user_id}")
+            new_sections.append(new_section_data)
+            logger.debug("Creating missing section '%s' for user %s", section_data["name"], user_id)
 
-    if created_count > 0:
+    if new_sections:
+        # Single executemany INSERT instead of per-instance unit-of-work adds
+        await db.execute(insert(Section), new_sections)
         await db.commit()
-        logger.info(f"Created {created_count} missing sections for user {user_id}")
+        invalidate_sections_cache(user_id)
+        logger.info("Created %s missing sections for user %s", len(new_sections), user_id)
     else:
-        logger.debug(f"User {user_id} already has all {len(default_sections)} default sections")
+        logger.debug("User %s already has all %s default sections", user_id, len(default_sections))
 
 
 class SectionService:
@@ -136,12 +232,44 @@ class SectionService:
         Returns:
             List of sections ordered by position
         """
-        query = select(Section).order_by(Section.position)
-        if user_id is not None:
-            query = query.where(Section.user_id == user_id)
-        result = await self.db.execute(query)
+        if user_id is None:
+            result = await self.db.execute(_SELECT_ALL_ORDERED)
+        else:
+            result = await self.db.execute(_SELECT_BY_USER_ORDERED, {"user_id": user_id})
         return result.scalars().all()
 
+    async def list_section_dicts(self, user_id: int) -> List[Dict[str, Any]]:
+        """
+        Get a user's serialized sections ordered by position.
+
+        Selects plain columns, skipping ORM instance construction and identity
+        map bookkeeping.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            List of serialized sections ordered by position
+        """
+        result = await self.db.execute(_SELECT_COLUMNS_BY_USER_ORDERED, {"user_id": user_id})
+        return [Section.serialize(row) for row in result.all()]
+
+    async def existing_names(self, names: List[str], user_id: int) -> Set[str]:
+        """
+        Get which of the given section names exist for a user.
+
+        Args:
+            names: Section names to check
+            user_id: User ID
+
+        Returns:
+            Set of names that exist
+        """
+        result = await self.db.execute(
+            select(Section.name).where(Section.user_id == user_id, Section.name.in_(names))
+        )
+        return set(result.scalars())
+
     async def get_section(self, section_id: int) -> Optional[Section]:
         """
         Get a specific section by ID.
@@ -152,7 +280,7 @@ class SectionService:
         Returns:
             Section if found, None otherwise
         """
-        result = await self.db.execute(select(Section).where(Section.id == section_id))
+        result = await self.db.execute(_SELECT_BY_ID, {"section_id": section_id})
         return result.scalar_one_or_none()
 
     async def create_section(self, section_data: SectionCreate) -> Optional[Section]:
@@ -166,10 +294,9 @@ class SectionService:
             Created section, or None if section with same name exists
         """
         # Check if section with same name already exists
-        result = await self.db.execute(select(Section).where(Section.name == section_data.name))
-        existing = result.scalar_one_or_none()
+        result = await self.db.execute(_SELECT_ID_BY_NAME, {"name": section_data.name})
 
-        if existing:
+        if result.scalar_one_or_none() is not None:
             return None
 
         # Convert widget_ids list to comma-separated string
@@ -186,8 +313,9 @@ class SectionService:
         self.db.add(section)
         await self.db.commit()
         await self.db.refresh(section)
+        invalidate_sections_cache(section.user_id)
 
-        logger.info(f"Created section: {section.name}")
+        logger.info("Created section: %s", section.name)
         return section
 
     async def update_section(
@@ -203,26 +331,37 @@ class SectionService:
         Returns:
             Updated section if found, None otherwise
         """
-        result = await self.db.execute(select(Section).where(Section.id == section_id))
-        section = result.scalar_one_or_none()
-
-        if not section:
-            return None
-
-        # Update fields
+        # Collect fields to update
+        values: Dict[str, Any] = {}
         if section_data.title is not None:
-            section.title = section_data.title
+            values["title"] = section_data.title
         if section_data.position is not None:
-            section.position = section_data.position
+            values["position"] = section_data.position
         if section_data.enabled is not None:
-            section.enabled = section_data.enabled
+            values["enabled"] = section_data.enabled
         if section_data.widget_ids is not None:
-            section.widget_ids = ",".join(section_data.widget_ids)
+            values["widget_ids"] = ",".join(section_data.widget_ids)
+
+        if not values:
+            return await self.get_section(section_id)
+
+        # Single UPDATE ... RETURNING round-trip instead of SELECT + UPDATE + refresh
+        result = await self.db.execute(
+            update(Section)
+            .where(Section.id == section_id)
+            .values(**values)
+            .returning(Section)
+            .execution_options(populate_existing=True)
+        )
+        section = result.scalar_one_or_none()
+
+        if not section:
+            return None
 
         await self.db.commit()
-        await self.db.refresh(section)
+        invalidate_sections_cache(section.user_id)
 
-        logger.info(f"Updated section: {section.name}")
+        logger.info("Updated section: %s", section.name)
         return section
 
     async def delete_section(self, section_id: int) -> bool:
@@ -235,53 +374,54 @@ class SectionService:
         Returns:
             True if section was deleted, False if not found
         """
-        result = await self.db.execute(select(Section).where(Section.id == section_id))
-        section = result.scalar_one_or_none()
+        # Single DELETE ... RETURNING round-trip instead of SELECT + DELETE
+        result = await self.db.execute(
+            delete(Section).where(Section.id == section_id).returning(Section.user_id, Section.name)
+        )
+        deleted = result.one_or_none()
 
-        if not section:
+        if deleted is None:
             return False
 
-        await self.db.delete(section)
         await self.db.commit()
+        invalidate_sections_cache(deleted.user_id)
 
-        logger.info(f"Deleted section: {section.name}")
+        logger.info("Deleted section: %s", deleted.name)
         return True
 
     async def reorder_sections(
-        self, sections_order: List[Dict[str, Any]], user_id: Optional[int] = None
+        self, sections_order: List[SectionOrderItem], user_id: Optional[int] = None
     ) -> List[Section]:
         """
         Update the order of multiple sections.
 
         Args:
-            sections_order: List of dictionaries with 'name' and 'position' keys
+            sections_order: List of validated section name/position items
             user_id: Optional user ID to filter sections
 
         Returns:
-            List of updated sections ordered by position
+            List of the updated sections ordered by position
         """
-        # Get all sections (filtered by user if provided)
-        query = select(Section)
+        # Later items win for duplicate names, as with sequential assignment
+        positions = {item.name: item.position for item in sections_order}
+
+        # Single UPDATE ... RETURNING with a CASE over the names instead of one UPDATE
+        # per section (portable to SQLite, which lacks column aliases on VALUES)
+        stmt = (
+            update(Section)
+            .where(Section.name.in_(positions))
+            .values(position=case(positions, value=Section.name))
+            .returning(Section)
+            .execution_options(populate_existing=True)
+        )
         if user_id is not None:
-            query = query.where(Section.user_id == user_id)
-        result = await self.db.execute(query)
-        sections = {section.name: section for section in result.scalars().all()}
+            stmt = stmt.where(Section.user_id == user_id)
 
-        # Update positions
-        for section_order in sections_order:
-            section_name = section_order["name"]
-            new_position = section_order["position"]
-            if section_name in sections:
-                sections[section_name].position = new_position
+        result = await self.db.execute(stmt)
+        updated_sections = sorted(result.scalars().all(), key=lambda section: section.position)
 
         await self.db.commit()
-
-        # Return updated sections ordered by position (filtered by user if provided)
-        query = select(Section).order_by(Section.position)
-        if user_id is not None:
-            query = query.where(Section.user_id == user_id)
-        result = await self.db.execute(query)
-        updated_sections = result.scalars().all()
+        invalidate_sections_cache(user_id)
 
         logger.info("Reordered sections", extra={"user_id": user_id})
         return updated_sections
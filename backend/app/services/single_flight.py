@@ -0,0 +1,63 @@
+"""
+Coalescing of duplicate concurrent async calls.
+
+While a call for a key is in flight, further callers for the same key await the
+result of that call instead of starting their own.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from app.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its result."""
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Execute fn, or join a call already in flight for the same key.
+
+        Args:
+            key: Deduplication key
+            fn: Coroutine function to call if no call is in flight
+
+        Returns:
+            Result of the (possibly shared) call
+
+        Raises:
+            Exception: Whatever the shared call raised
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            logger.debug("Joining in-flight call", extra={"key": key})
+            # Shield so a cancelled waiter does not cancel the shared call
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+
+# Global single-flight group for widget data fetches
+widget_data_flight = SingleFlight()
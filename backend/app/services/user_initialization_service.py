@@ -1,6 +1,5 @@
 """Service for initializing default data for new users."""
 
-import json
 import logging
 import uuid
 from datetime import datetime
@@ -12,6 +11,7 @@ from app.models.bookmark import Bookmark
 from app.models.habit import Habit
 from app.models.user import User
 from app.models.widget import Widget
+from app.services.cache import cache_service, widget_list_cache_key
 from app.services.section_service import initialize_default_sections_for_user
 
 logger = logging.getLogger(__name__)
@@ -34,7 +34,7 @@ class UserInitializationService:
             db: Database session
             user: The user to initialize data for
         """
-        logger.info(f"Initializing default data for user {user.id} ({user.email})")
+        logger.info("Initializing default data for user %s (%s)", user.id, user.email)
 
         try:
             # Check if user already has data (bookmarks or widgets)
@@ -42,7 +42,7 @@ class UserInitializationService:
             has_widgets = await UserInitializationService._user_has_widgets(db, user.id)
 
             if has_bookmarks and has_widgets:
-                logger.info(f"User {user.id} already has data, skipping initialization")
+                logger.info("User %s already has data, skipping initialization", user.id)
                 # Still ensure sections exist
                 await initialize_default_sections_for_user(db, user.id)
                 return
@@ -60,7 +60,8 @@ class UserInitializationService:
                 await UserInitializationService._create_default_habit_widget(db, user.id)
 
             await db.commit()
-            logger.info(f"Successfully initialized default data for user {user.id}")
+            await cache_service.delete(widget_list_cache_key(user.id))
+            logger.info("Successfully initialized default data for user %s", user.id)
 
         except Exception as e:
             logger.error(f"Failed to initialize default data for user {user.id}: {str(e)}")
@@ -82,7 +83,7 @@ class UserInitializationService:
     @staticmethod
     async def _create_default_bookmark(db: AsyncSession, user_id: int) -> None:
         """Create default bookmark for user: Home Page."""
-        logger.info(f"Creating default bookmark for user {user_id}")
+        logger.info("Creating default bookmark for user %s", user_id)
 
         bookmark = Bookmark(
             user_id=user_id,
@@ -98,12 +99,12 @@ class UserInitializationService:
         )
 
         db.add(bookmark)
-        logger.info(f"Created default bookmark for user {user_id}")
+        logger.info("Created default bookmark for user %s", user_id)
 
     @staticmethod
     async def _create_default_weather_widget(db: AsyncSession, user_id: int) -> None:
         """Create default weather widget for user: Provodov, CZ."""
-        logger.info(f"Creating default weather widget for user {user_id}")
+        logger.info("Creating default weather widget for user %s", user_id)
 
         # Weather widget configuration for Provodov, CZ
         widget_config = {
@@ -122,18 +123,18 @@ class UserInitializationService:
             position_width=2,
             position_height=2,
             refresh_interval=3600,  # 1 hour
-            config=json.dumps(widget_config),
+            config=widget_config,
             created=datetime.utcnow(),
             updated=datetime.utcnow(),
         )
 
         db.add(widget)
-        logger.info(f"Created default weather widget for user {user_id}")
+        logger.info("Created default weather widget for user %s", user_id)
 
     @staticmethod
     async def _create_default_habit_widget(db: AsyncSession, user_id: int) -> None:
         """Create default habit tracking widget for user with a default habit."""
-        logger.info(f"Creating default habit tracking widget for user {user_id}")
+        logger.info("Creating default habit tracking widget for user %s", user_id)
 
         # First, create a default habit
         habit_id = str(uuid.uuid4())
@@ -147,7 +148,7 @@ class UserInitializationService:
             updated=datetime.utcnow(),
         )
         db.add(habit)
-        logger.info(f"Created default habit {habit_id} for user {user_id}")
+        logger.info("Created default habit %s for user %s", habit_id, user_id)
 
         # Habit tracking widget configuration with habit_id
         widget_config = {
@@ -165,10 +166,10 @@ class UserInitializationService:
             position_width=2,
             position_height=2,
             refresh_interval=300,  # 5 minutes
-            config=json.dumps(widget_config),
+            config=widget_config,
             created=datetime.utcnow(),
             updated=datetime.utcnow(),
         )
 
         db.add(widget)
-        logger.info(f"Created default habit tracking widget for user {user_id}")
+        logger.info("Created default habit tracking widget for user %s", user_id)
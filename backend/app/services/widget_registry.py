@@ -1,8 +1,7 @@
 """Widget registry for managing widget types."""
 
-import json
 import logging
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type
 
 from app.widgets.base_widget import BaseWidget
 
@@ -17,6 +16,9 @@ class WidgetRegistry:
         self._widget_classes: Dict[str, Type[BaseWidget]] = {}
         self._widget_instances: Dict[str, BaseWidget] = {}
         self._widget_configs: List[Dict[str, Any]] = []
+        # Derived from _widget_classes; rebuilt only when a type is registered
+        self._types_list: Tuple[str, ...] = ()
+        self._types_set: FrozenSet[str] = frozenset()
 
     def register(self, widget_class: Type[BaseWidget]):
         """
@@ -30,7 +32,9 @@ class WidgetRegistry:
             logger.warning(f"Widget type '{widget_type}' already registered, overwriting")
 
         self._widget_classes[widget_type] = widget_class
-        logger.info(f"Registered widget type: {widget_type}")
+        self._types_list = tuple(self._widget_classes)
+        self._types_set = frozenset(self._widget_classes)
+        logger.info("Registered widget type: %s", widget_type)
 
     def get_widget_class(self, widget_type: str) -> Optional[Type[BaseWidget]]:
         """
@@ -66,12 +70,53 @@ class WidgetRegistry:
         try:
             widget = widget_class(widget_id, config)
             self._widget_instances[widget_id] = widget
-            logger.info(f"Created widget instance: {widget_id} (type: {widget_type})")
+            logger.info("Created widget instance: %s (type: %s)", widget_id, widget_type)
             return widget
         except Exception as e:
             logger.error(f"Failed to create widget {widget_id}: {str(e)}")
             return None
 
+    def bulk_load(self, rows: Iterable[Any]) -> int:
+        """
+        Create widget instances for many widget rows in a single pass.
+
+        Each instance config is built once from the row, without the intermediate
+        dictionaries and per-widget logging of create_widget.
+
+        Args:
+            rows: Widget instances or Core rows selecting the widget columns and user_id
+
+        Returns:
+            Number of widget instances created
+        """
+        created = 0
+        for row in rows:
+            widget_class = self._widget_classes.get(row.widget_type)
+            if not widget_class:
+                logger.error(f"Widget type '{row.widget_type}' not found in registry")
+                continue
+
+            config = {
+                **(row.config if isinstance(row.config, dict) else {}),
+                "enabled": row.enabled,
+                "refresh_interval": row.refresh_interval,
+                "user_id": row.user_id,  # Add user_id for widgets that need it
+                "position": {
+                    "row": row.position_row,
+                    "col": row.position_col,
+                    "width": row.position_width,
+                    "height": row.position_height,
+                },
+            }
+            try:
+                self._widget_instances[row.widget_id] = widget_class(row.widget_id, config)
+                created += 1
+            except Exception as e:
+                logger.error(f"Failed to create widget {row.widget_id}: {str(e)}")
+
+        logger.info("Created %s widget instances", created)
+        return created
+
     def get_widget(self, widget_id: str) -> Optional[BaseWidget]:
         """
         Get widget instance by ID.
@@ -84,14 +129,44 @@ class WidgetRegistry:
         """
         return self._widget_instances.get(widget_id)
 
-    def list_widget_types(self) -> List[str]:
+    def evict(self, widget_id: str) -> bool:
+        """
+        Remove a widget instance, e.g. after its widget was deleted.
+
+        Args:
+            widget_id: Widget identifier
+
+        Returns:
+            True if an instance was removed
+        """
+        return self._widget_instances.pop(widget_id, None) is not None
+
+    def reset(self):
+        """
+        Remove all widget instances; registered widget types are kept.
+        """
+        self._widget_instances.clear()
+
+    def list_widget_types(self) -> Tuple[str, ...]:
         """
         List all registered widget types.
 
         Returns:
-            List of widget type names
+            Tuple of widget type names
+        """
+        return self._types_list
+
+    def has_widget_type(self, widget_type: str) -> bool:
+        """
+        Check whether a widget type is registered.
+
+        Args:
+            widget_type: Type of widget
+
+        Returns:
+            True if the widget type is registered
         """
-        return list(self._widget_classes.keys())
+        return widget_type in self._types_set
 
     def list_widgets(self) -> List[Dict[str, Any]]:
         """
@@ -113,19 +188,25 @@ class WidgetRegistry:
             from app.services.database import AsyncSessionLocal
 
             async with AsyncSessionLocal() as session:
-                result = await session.execute(select(Widget).where(Widget.enabled.is_(True)))
-                widgets = result.scalars().all()
-
-                self._widget_configs = []
-
-                for widget in widgets:
-                    try:
-                        config_dict = json.loads(widget.config) if widget.config else {}
-                    except (json.JSONDecodeError, TypeError):
-                        config_dict = {}
-
-                    # Create widget config
-                    widget_config = {
+                # Select only the columns needed, without constructing ORM instances
+                result = await session.execute(
+                    select(
+                        Widget.widget_id,
+                        Widget.widget_type,
+                        Widget.user_id,
+                        Widget.enabled,
+                        Widget.position_row,
+                        Widget.position_col,
+                        Widget.position_width,
+                        Widget.position_height,
+                        Widget.refresh_interval,
+                        Widget.config,
+                    ).where(Widget.enabled.is_(True))
+                )
+                widgets = result.all()
+
+                self._widget_configs = [
+                    {
                         "id": widget.widget_id,
                         "type": widget.widget_type,
                         "enabled": widget.enabled,
@@ -136,21 +217,13 @@ class WidgetRegistry:
                             "height": widget.position_height,
                         },
                         "refresh_interval": widget.refresh_interval,
-                        "config": config_dict,
+                        "config": widget.config if isinstance(widget.config, dict) else {},
                     }
+                    for widget in widgets
+                ]
+                self.bulk_load(widgets)
 
-                    self._widget_configs.append(widget_config)
-
-                    # Create widget instance
-                    config = config_dict.copy()
-                    config["enabled"] = widget.enabled
-                    config["refresh_interval"] = widget.refresh_interval
-                    config["user_id"] = widget.user_id  # Add user_id for widgets that need it
-                    config["position"] = widget_config["position"]
-
-                    self.create_widget(widget.widget_id, widget.widget_type, config)
-
-                logger.info(f"Loaded {len(widgets)} widget configurations from database")
+                logger.info("Loaded %s widget configurations from database", len(widgets))
 
         except Exception as e:
             logger.error(f"Failed to load widget config from database: {str(e)}")
@@ -0,0 +1,66 @@
+"""HTTP ETag utilities for conditional GET requests."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request
+
+# Authenticated responses must not be stored by shared caches, but browsers may
+# keep them as long as they revalidate with If-None-Match on every use
+ETAG_CACHE_CONTROL = "private, no-cache"
+
+
+def compute_etag(data: Any) -> str:
+    """
+    Compute a weak ETag for a JSON-serializable payload.
+
+    Args:
+        data: Response payload
+
+    Returns:
+        Weak ETag header value
+    """
+    serialized = orjson.dumps(
+        data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+    )
+    return compute_etag_bytes(serialized)
+
+
+def compute_etag_bytes(serialized: bytes) -> str:
+    """
+    Compute a weak ETag for an already serialized payload.
+
+    Args:
+        serialized: Response body bytes
+
+    Returns:
+        Weak ETag header value
+    """
+    digest = hashlib.blake2b(serialized, digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+
+    Uses weak comparison as required for If-None-Match (RFC 9110).
+
+    Args:
+        request: Incoming HTTP request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag for candidate in if_none_match.split(",")
+    )
@@ -1,11 +1,13 @@
 """Base widget class for all widgets."""
 
 import hashlib
-import json
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+import orjson
+
+from app.constants import CACHE_KEY_PREFIX_WIDGET
 from app.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -28,6 +30,8 @@ class BaseWidget(ABC):
         self.config = config
         self.enabled = config.get("enabled", True)
         self.refresh_interval = config.get("refresh_interval", 3600)
+        # Computed on first use; instances are rebuilt whenever their config changes
+        self._cache_key: Optional[str] = None
 
     @abstractmethod
     async def fetch_data(self) -> Dict[str, Any]:
@@ -56,13 +60,22 @@ class BaseWidget(ABC):
         """
         Generate cache key for this widget instance.
 
+        The key is computed once per instance, so it stays stable even if
+        validate_config normalizes the config in place.
+
         Returns:
             Cache key string
         """
-        # Create a hash of the widget config for cache key
-        config_str = json.dumps(self.config, sort_keys=True)
-        config_hash = hashlib.md5(config_str.encode()).hexdigest()[:8]
-        return f"widget:{self.widget_type}:{self.widget_id}:{config_hash}"
+        if self._cache_key is None:
+            # Create a hash of the widget config for cache key
+            config_bytes = orjson.dumps(
+                self.config, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+            config_hash = hashlib.md5(config_bytes).hexdigest()[:8]
+            self._cache_key = (
+                f"{CACHE_KEY_PREFIX_WIDGET}{self.widget_type}:{self.widget_id}:{config_hash}"
+            )
+        return self._cache_key
 
     def get_timestamp(self) -> str:
         """
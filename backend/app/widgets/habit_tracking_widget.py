@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.logging_config import get_logger
 from app.models.habit import Habit, HabitCompletion
-from app.services.database import get_db
+from app.services.database import get_async_session
 from app.widgets.base_widget import BaseWidget
 
 logger = get_logger(__name__)
@@ -116,107 +116,102 @@ class HabitTrackingWidget(BaseWidget):
         Returns:
             Dictionary containing the single habit and its completion history
         """
-        # Get database session
-        db_gen = get_db()
-        db: AsyncSession = await anext(db_gen)
-
-        try:
-            # Calculate date range (last 7 days = today + 6 previous days)
-            end_date = date.today()
-            start_date = end_date - timedelta(days=6)  # 7 days total including today
-
-            # Fetch the specific habit for the user
-            stmt = select(Habit).where(
-                and_(
-                    Habit.user_id == self.user_id,
-                    Habit.habit_id == self.habit_id,
-                    Habit.active.is_(True),
+        async with get_async_session() as db:
+            try:
+                # Calculate date range (last 7 days = today + 6 previous days)
+                end_date = date.today()
+                start_date = end_date - timedelta(days=6)  # 7 days total including today
+
+                # Fetch the specific habit for the user
+                stmt = select(Habit).where(
+                    and_(
+                        Habit.user_id == self.user_id,
+                        Habit.habit_id == self.habit_id,
+                        Habit.active.is_(True),
+                    )
                 )
-            )
-            result = await db.execute(stmt)
-            habit = result.scalar_one_or_none()
+                result = await db.execute(stmt)
+                habit = result.scalar_one_or_none()
+
+                if not habit:
+                    logger.warning(
+                        "Habit not found or not active",
+                        extra={
+                            "widget_id": self.widget_id,
+                            "user_id": self.user_id,
+                            "habit_id": self.habit_id,
+                        },
+                    )
+                    return {
+                        "habits": [],
+                        "start_date": start_date.isoformat(),
+                        "end_date": end_date.isoformat(),
+                    }
 
-            if not habit:
-                logger.warning(
-                    "Habit not found or not active",
-                    extra={
-                        "widget_id": self.widget_id,
-                        "user_id": self.user_id,
-                        "habit_id": self.habit_id,
-                    },
+                # Fetch completions for this habit in the date range (for display)
+                completions_stmt = select(HabitCompletion).where(
+                    and_(
+                        HabitCompletion.user_id == self.user_id,
+                        HabitCompletion.habit_id == self.habit_id,
+                        HabitCompletion.completion_date >= start_date,
+                        HabitCompletion.completion_date <= end_date,
+                    )
                 )
+                completions_result = await db.execute(completions_stmt)
+                completions = completions_result.scalars().all()
+
+                # Organize completions by date
+                completions_map: Dict[str, bool] = {}
+                for completion in completions:
+                    date_str = completion.completion_date.isoformat()
+                    completions_map[date_str] = completion.completed
+
+                # Generate date array for the last 7 days
+                dates_data = []
+                current_date = start_date
+                while current_date <= end_date:
+                    date_str = current_date.isoformat()
+                    # Get day of week (0 = Monday, 6 = Sunday)
+                    day_of_week = current_date.weekday()
+
+                    # Check if habit was completed on this date
+                    completed = completions_map.get(date_str, False)
+
+                    dates_data.append(
+                        {
+                            "date": date_str,
+                            "day_of_week": day_of_week,
+                            "completed": completed,
+                            "is_today": current_date == end_date,
+                        }
+                    )
+                    current_date += timedelta(days=1)
+
+                # Calculate the actual current streak using all historical data
+                current_streak = await self._calculate_current_streak(db)
+
+                habit_data = {
+                    "id": habit.habit_id,
+                    "name": habit.name,
+                    "description": habit.description,
+                    "days": dates_data,
+                    "current_streak": current_streak,
+                }
+
                 return {
-                    "habits": [],
+                    "habits": [habit_data],
                     "start_date": start_date.isoformat(),
                     "end_date": end_date.isoformat(),
                 }
 
-            # Fetch completions for this habit in the date range (for display)
-            completions_stmt = select(HabitCompletion).where(
-                and_(
-                    HabitCompletion.user_id == self.user_id,
-                    HabitCompletion.habit_id == self.habit_id,
-                    HabitCompletion.completion_date >= start_date,
-                    HabitCompletion.completion_date <= end_date,
-                )
-            )
-            completions_result = await db.execute(completions_stmt)
-            completions = completions_result.scalars().all()
-
-            # Organize completions by date
-            completions_map: Dict[str, bool] = {}
-            for completion in completions:
-                date_str = completion.completion_date.isoformat()
-                completions_map[date_str] = completion.completed
-
-            # Generate date array for the last 7 days
-            dates_data = []
-            current_date = start_date
-            while current_date <= end_date:
-                date_str = current_date.isoformat()
-                # Get day of week (0 = Monday, 6 = Sunday)
-                day_of_week = current_date.weekday()
-
-                # Check if habit was completed on this date
-                completed = completions_map.get(date_str, False)
-
-                dates_data.append(
-                    {
-                        "date": date_str,
-                        "day_of_week": day_of_week,
-                        "completed": completed,
-                        "is_today": current_date == end_date,
-                    }
+            except Exception as e:
+                logger.error(
+                    f"Error fetching habit tracking data: {str(e)}",
+                    extra={
+                        "widget_id": self.widget_id,
+                        "user_id": self.user_id,
+                        "habit_id": self.habit_id,
+                    },
+                    exc_info=True,
                 )
-                current_date += timedelta(days=1)
-
-            # Calculate the actual current streak using all historical data
-            current_streak = await self._calculate_current_streak(db)
-
-            habit_data = {
-                "id": habit.habit_id,
-                "name": habit.name,
-                "description": habit.description,
-                "days": dates_data,
-                "current_streak": current_streak,
-            }
-
-            return {
-                "habits": [habit_data],
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-            }
-
-        except Exception as e:
-            logger.error(
-                f"Error fetching habit tracking data: {str(e)}",
-                extra={
-                    "widget_id": self.widget_id,
-                    "user_id": self.user_id,
-                    "habit_id": self.habit_id,
-                },
-                exc_info=True,
-            )
-            raise
-        finally:
-            await db.close()
+                raise
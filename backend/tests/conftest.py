@@ -38,6 +38,7 @@ try:
     from app.services.database import Base, get_db
     from app.models.user import User
     from app.api.dependencies import require_auth, get_current_user
+    from app.services.section_service import invalidate_sections_cache
 finally:
     # Restore original connector
     aiohttp.TCPConnector = original_connector
@@ -68,11 +69,15 @@ async def test_db():
 
     app.dependency_overrides[get_db] = override_get_db
 
+    # Each test gets a fresh database, so drop any process-local cached data
+    invalidate_sections_cache()
+
     yield engine
 
     # Cleanup
     await engine.dispose()
     app.dependency_overrides.clear()
+    invalidate_sections_cache()
 
 
 @pytest.fixture
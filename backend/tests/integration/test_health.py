@@ -1,5 +1,7 @@
 """Integration tests for health check endpoints."""
 
+import logging
+
 import pytest
 from httpx import AsyncClient
 
@@ -22,7 +24,179 @@ async def test_health_check_endpoint(client: AsyncClient):
     """Test health check endpoint."""
     response = await client.get("/health")
     assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
 
     data = response.json()
     assert "status" in data
     assert data["status"] == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_cors_allowed_origin(client: AsyncClient):
+    """Test CORS headers are sent only for allow-listed origins."""
+    from app.config import settings
+
+    allowed = settings.CORS_ORIGINS[0]
+    response = await client.get("/health", headers={"Origin": allowed})
+    assert response.headers["access-control-allow-origin"] == allowed
+
+    response = await client.get("/health", headers={"Origin": "https://evil.example"})
+    assert "access-control-allow-origin" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight_cached(client: AsyncClient):
+    """Test preflights allow the frontend's headers and may be cached for two hours."""
+    from app.config import settings
+
+    preflight_headers = {
+        "Origin": settings.CORS_ORIGINS[0],
+        "Access-Control-Request-Method": "POST",
+        "Access-Control-Request-Headers": "authorization, content-type",
+    }
+    response = await client.options("/api/widgets/", headers=preflight_headers)
+    assert response.status_code == 200
+    assert response.headers["access-control-max-age"] == "7200"
+
+    preflight_headers["Access-Control-Request-Headers"] = "x-custom-header"
+    response = await client.options("/api/widgets/", headers=preflight_headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_request_summary_logged_only_when_enabled(client: AsyncClient, caplog):
+    """Test the request summary record is skipped when its level is disabled."""
+    caplog.set_level(logging.INFO, logger="app.main")
+    await client.get("/")
+    completed = [record for record in caplog.records if record.message == "Request completed"]
+    assert completed[-1].status_code == 200
+    assert 0 <= completed[-1].duration_seconds * 1000 <= completed[-1].response_time_ms
+
+    caplog.clear()
+    caplog.set_level(logging.WARNING, logger="app.main")
+    await client.get("/")
+    assert not [record for record in caplog.records if record.message == "Request completed"]
+
+
+@pytest.mark.asyncio
+async def test_request_summary_fields(client: AsyncClient, caplog):
+    """Test the request summary record carries the request details read from the scope."""
+    caplog.set_level(logging.INFO, logger="app.main")
+    await client.get("/?page=2", headers={"User-Agent": "pytest-agent"})
+    completed = [record for record in caplog.records if record.message == "Request completed"]
+    assert completed[-1].method == "GET"
+    assert completed[-1].path == "/"
+    assert completed[-1].query_params == "page=2"
+    assert completed[-1].user_agent == "pytest-agent"
+    assert completed[-1].client_host == "127.0.0.1"
+
+
+@pytest.mark.asyncio
+async def test_health_check_not_logged(client: AsyncClient, caplog):
+    """Test healthcheck polls are served with security headers but without a log record."""
+    caplog.set_level(logging.DEBUG, logger="app.main")
+    response = await client.get("/health")
+    assert response.status_code == 200
+    assert response.headers["X-Frame-Options"] == "SAMEORIGIN"
+    assert not [record for record in caplog.records if record.name == "app.main"]
+
+
+@pytest.mark.asyncio
+async def test_request_too_large_response(client: AsyncClient):
+    """Test oversized bodies are rejected with a UTC ISO 8601 timestamp in the error body."""
+    from datetime import datetime, timedelta
+
+    response = await client.post("/api/widgets/", content=b"x" * (1024 * 1024 + 1))
+    assert response.status_code == 413
+
+    data = response.json()
+    assert data["error"] == "Request body too large"
+    assert datetime.fromisoformat(data["timestamp"]).utcoffset() == timedelta(0)
+
+
+@pytest.mark.asyncio
+async def test_request_size_not_checked_for_bodyless_methods(client: AsyncClient):
+    """Test GET requests are served regardless of their declared body size."""
+    response = await client.request("GET", "/", content=b"x" * (1024 * 1024 + 1))
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_request_log_skip_path_prefixes(caplog):
+    """Test skip paths ending in "*" skip every path with that prefix."""
+    from app.main import RequestMiddleware
+
+    async def endpoint(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def send(message):
+        pass
+
+    middleware = RequestMiddleware(endpoint, skip_log_paths=["/health", "/static/*"])
+    caplog.set_level(logging.INFO, logger="app.main")
+    for path in ("/health", "/static/app.js", "/static/"):
+        scope = {"type": "http", "method": "GET", "path": path, "headers": [], "query_string": b""}
+        await middleware(scope, None, send)
+    assert not [record for record in caplog.records if record.name == "app.main"]
+
+    scope = {"type": "http", "method": "GET", "path": "/static", "headers": [], "query_string": b""}
+    await middleware(scope, None, send)
+    assert [record.path for record in caplog.records if record.name == "app.main"] == ["/static"]
+
+
+@pytest.mark.asyncio
+async def test_request_too_large_without_content_length():
+    """Test bodies streamed without Content-Length are rejected once they exceed the limit."""
+    from starlette.requests import Request
+    from starlette.responses import Response
+
+    from app.main import RequestMiddleware
+
+    async def endpoint(scope, receive, send):
+        body = await Request(scope, receive).body()
+        await Response(body)(scope, receive, send)
+
+    def chunks(*bodies):
+        messages = [{"type": "http.request", "body": body, "more_body": True} for body in bodies]
+        messages[-1]["more_body"] = False
+
+        async def receive():
+            return messages.pop(0)
+
+        return receive
+
+    def scope():
+        return {"type": "http", "method": "POST", "path": "/", "headers": [], "query_string": b""}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = RequestMiddleware(endpoint, max_size=8)
+    await middleware(scope(), chunks(b"x" * 5, b"x" * 5), send)
+    assert sent[0]["status"] == 413
+    assert len([message for message in sent if message["type"] == "http.response.start"]) == 1
+
+    sent.clear()
+    await middleware(scope(), chunks(b"x" * 4, b"x" * 4), send)
+    assert sent[0]["status"] == 200
+    assert sent[1]["body"] == b"x" * 8
+
+
+def test_routes_registered_once():
+    """Test no (method, path) pair is served by more than one route, e.g. a copied router."""
+    from collections import Counter
+
+    from fastapi.routing import APIRoute
+
+    from app.main import app
+
+    routes = Counter(
+        (method, route.path)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    )
+    assert [route for route, count in routes.items() if count > 1] == []
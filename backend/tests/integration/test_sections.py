@@ -0,0 +1,163 @@
+"""Integration tests for section API endpoints."""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.models.section import Section
+from app.services.section_service import initialize_default_sections_for_user
+
+
+@pytest.mark.asyncio
+async def test_initialize_default_sections_for_user(db_session, test_user):
+    """Test default sections are created once and in order."""
+    await initialize_default_sections_for_user(db_session, test_user.id)
+    # Second call must be a no-op (no duplicates)
+    await initialize_default_sections_for_user(db_session, test_user.id)
+
+    result = await db_session.execute(
+        select(Section.name, Section.position)
+        .where(Section.user_id == test_user.id)
+        .order_by(Section.position)
+    )
+    rows = result.all()
+    assert [row.name for row in rows] == ["weather", "rates", "markets", "news", "habits"]
+    assert [row.position for row in rows] == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_list_sections(client: AsyncClient, db_session, test_user):
+    """Test listing sections for the current user."""
+    await initialize_default_sections_for_user(db_session, test_user.id)
+
+    response = await client.get("/api/sections/")
+    assert response.status_code == 200
+
+    data = response.json()
+    assert [section["name"] for section in data] == [
+        "weather",
+        "rates",
+        "markets",
+        "news",
+        "habits",
+    ]
+    assert data[0]["widget_ids"] == []
+
+
+@pytest.mark.asyncio
+async def test_reorder_sections(client: AsyncClient, db_session, test_user):
+    """Test reordering sections returns the new order."""
+    await initialize_default_sections_for_user(db_session, test_user.id)
+
+    response = await client.put(
+        "/api/sections/reorder",
+        json={"sections": [{"name": "habits", "position": 0}, {"name": "weather", "position": 9}]},
+    )
+    assert response.status_code == 200
+
+    names = [section["name"] for section in response.json()]
+    assert names[0] == "habits"
+    assert names[-1] == "weather"
+
+    response = await client.get("/api/sections/")
+    positions = {section["name"]: section["position"] for section in response.json()}
+    assert positions["habits"] == 0
+    assert positions["weather"] == 9
+
+
+@pytest.mark.asyncio
+async def test_reorder_sections_unknown_section(client: AsyncClient, db_session, test_user):
+    """Test reordering with an unknown section name returns 404."""
+    await initialize_default_sections_for_user(db_session, test_user.id)
+
+    response = await client.put(
+        "/api/sections/reorder",
+        json={
+            "sections": [
+                {"name": "weather", "position": 0},
+                {"name": "missing", "position": 1},
+                {"name": "absent", "position": 2},
+            ]
+        },
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Sections not found: absent, missing"
+
+
+@pytest.mark.asyncio
+async def test_list_sections_cache_invalidated_on_update(
+    client: AsyncClient, db_session, test_user
+):
+    """Test cached section list is refreshed after a section update."""
+    await initialize_default_sections_for_user(db_session, test_user.id)
+
+    first = await client.get("/api/sections/")
+    weather = next(section for section in first.json() if section["name"] == "weather")
+
+    response = await client.put(f"/api/sections/{weather['id']}", json={"title": "Forecast"})
+    assert response.status_code == 200
+
+    second = await client.get("/api/sections/")
+    titles = {section["name"]: section["title"] for section in second.json()}
+    assert titles["weather"] == "Forecast"
+
+
+@pytest.mark.asyncio
+async def test_reorder_sections_rejects_negative_position(client: AsyncClient):
+    """Test reorder payloads are validated by the request schema."""
+    response = await client.put(
+        "/api/sections/reorder", json={"sections": [{"name": "weather", "position": -1}]}
+    )
+    assert response.status_code == 422
+
+    response = await client.put("/api/sections/reorder", json={"sections": [{"name": "weather"}]})
+    assert response.status_code == 422
+
+    response = await client.put("/api/sections/reorder", json={"sections": []})
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_section(client: AsyncClient, db_session, test_user):
+    """Test updating and deleting a single section."""
+    await initialize_default_sections_for_user(db_session, test_user.id)
+    sections = (await client.get("/api/sections/")).json()
+    section_id = sections[0]["id"]
+
+    response = await client.put(
+        f"/api/sections/{section_id}", json={"enabled": False, "widget_ids": ["a", "b"]}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is False
+    assert data["widget_ids"] == ["a", "b"]
+    assert data["updated"] is not None
+
+    response = await client.delete(f"/api/sections/{section_id}")
+    assert response.status_code == 200
+
+    response = await client.delete(f"/api/sections/{section_id}")
+    assert response.status_code == 404
+
+    response = await client.put(f"/api/sections/{section_id}", json={"title": "Gone"})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_sections_etag(client: AsyncClient, db_session, test_user):
+    """Test conditional GET returns 304 until the section list changes."""
+    await initialize_default_sections_for_user(db_session, test_user.id)
+
+    response = await client.get("/api/sections/")
+    etag = response.headers["etag"]
+
+    response = await client.get("/api/sections/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    section_id = (await client.get("/api/sections/")).json()[0]["id"]
+    await client.put(f"/api/sections/{section_id}", json={"title": "Changed"})
+
+    response = await client.get("/api/sections/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
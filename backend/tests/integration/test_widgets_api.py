@@ -0,0 +1,516 @@
+"""Integration tests for widget API endpoints."""
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app.services.widget_registry import widget_registry
+from app.widgets import register_all_widgets
+
+WEATHER_WIDGET = {
+    "type": "weather",
+    "enabled": True,
+    "position": {"row": 0, "col": 0, "width": 2, "height": 2},
+    "refresh_interval": 600,
+    "config": {"location": "Prague"},
+}
+
+
+@pytest.fixture(autouse=True)
+def registered_widgets():
+    """Register widget classes as the application lifespan would."""
+    register_all_widgets()
+    yield
+    widget_registry.reset()
+
+
+@pytest.mark.asyncio
+async def test_create_and_list_widgets(client: AsyncClient):
+    """Test creating a widget and listing it."""
+    response = await client.post("/api/widgets/", json=WEATHER_WIDGET)
+    assert response.status_code == 201
+    created = response.json()
+    assert created["type"] == "weather"
+    assert created["config"]["location"] == "Prague"
+
+    response = await client.get("/api/widgets/")
+    assert response.status_code == 200
+    assert response.json() == [created]
+
+
+@pytest.mark.asyncio
+async def test_update_widget(client: AsyncClient):
+    """Test updating a widget's position and configuration."""
+    widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+
+    response = await client.put(
+        f"/api/widgets/{widget_id}",
+        json={
+            "position": {"row": 1, "col": 2, "width": 3, "height": 1},
+            "config": {"location": "Brno"},
+        },
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["position"] == {"row": 1, "col": 2, "width": 3, "height": 1}
+    assert data["config"]["location"] == "Brno"
+    assert data["refresh_interval"] == 600
+
+
+@pytest.mark.asyncio
+async def test_update_widget_invalid_config(client: AsyncClient):
+    """Test updating a widget with an invalid configuration is rejected."""
+    widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+
+    response = await client.put(f"/api/widgets/{widget_id}", json={"config": {"location": ""}})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_update_missing_widget(client: AsyncClient):
+    """Test updating an unknown widget returns 404."""
+    response = await client.put("/api/widgets/missing", json={"enabled": False})
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_delete_widget(client: AsyncClient):
+    """Test deleting a widget removes it from the list and the registry."""
+    widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+    assert widget_registry.get_widget(widget_id) is not None
+
+    response = await client.delete(f"/api/widgets/{widget_id}")
+    assert response.status_code == 204
+    assert widget_registry.get_widget(widget_id) is None
+    assert response.content == b""
+    assert "content-type" not in response.headers
+
+    response = await client.delete(f"/api/widgets/{widget_id}")
+    assert response.status_code == 404
+
+    assert (await client.get("/api/widgets/")).json() == []
+
+
+class InMemoryCache:
+    """Minimal stand-in for the Redis cache service."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+        return True
+
+    async def delete_many(self, keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.mark.asyncio
+async def test_list_widgets_cache_invalidated_on_write(client: AsyncClient):
+    """Test that the cached widget list is dropped when a widget is created."""
+    from app.main import app
+    from app.services.cache import get_cache_service
+
+    cache = InMemoryCache()
+    app.dependency_overrides[get_cache_service] = lambda: cache
+    try:
+        response = await client.get("/api/widgets/")
+        assert response.json() == []
+        assert len(cache.store) == 1
+
+        created = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()
+        assert cache.store == {}
+
+        response = await client.get("/api/widgets/")
+        assert [widget["id"] for widget in response.json()] == [created["id"]]
+    finally:
+        del app.dependency_overrides[get_cache_service]
+
+
+@pytest.mark.asyncio
+async def test_reload_widget_config_large_set(client: AsyncClient, db_session, test_user):
+    """Test reloading more widgets than the off-loop instance building threshold."""
+    from app.constants import WIDGET_RELOAD_OFFLOAD_THRESHOLD
+    from app.models.widget import Widget
+
+    count = WIDGET_RELOAD_OFFLOAD_THRESHOLD + 10
+    db_session.add_all(
+        Widget(
+            user_id=test_user.id,
+            widget_id=f"weather-{i}",
+            widget_type="weather",
+            config={"location": "Prague"},
+        )
+        for i in range(count)
+    )
+    await db_session.commit()
+
+    response = await client.post("/api/widgets/reload-config")
+    assert response.status_code == 200
+    assert response.json()["widget_count"] == count
+    assert widget_registry.get_widget("weather-0") is not None
+
+
+@pytest.mark.asyncio
+async def test_update_widget_without_config(client: AsyncClient):
+    """Test an update that does not touch the config keeps it unchanged."""
+    widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+
+    response = await client.put(f"/api/widgets/{widget_id}", json={"enabled": False})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["enabled"] is False
+    assert data["config"]["location"] == "Prague"
+
+    response = await client.put(f"/api/widgets/{widget_id}", json={})
+    assert response.status_code == 200
+    assert response.json()["enabled"] is False
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/widgets/{widget_id}/data", "/api/widgets/{widget_id}/refresh"]
+)
+def test_widget_data_endpoints_do_not_take_db_session(path):
+    """Test endpoints awaiting upstream HTTP do not pin a pooled DB connection."""
+    from app.main import app
+    from app.services.database import get_db
+
+    route = next(route for route in app.routes if getattr(route, "path", None) == path)
+
+    assert get_db not in [dependency.call for dependency in route.dependant.dependencies]
+
+
+@pytest.mark.asyncio
+async def test_auth_dependency_releases_connection(db_session, test_user, monkeypatch):
+    """Test the user lookup transaction is ended before the endpoint runs."""
+    from fastapi.security import HTTPAuthorizationCredentials
+
+    from app.api.dependencies import get_current_user
+    from app.services.auth_service import auth_service
+
+    async def verify_token(token):
+        return {"sub": str(test_user.id)}
+
+    monkeypatch.setattr(auth_service, "verify_token", verify_token)
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="token")
+
+    user = await get_current_user(credentials=credentials, db=db_session)
+
+    assert user.id == test_user.id
+    assert not db_session.in_transaction()
+
+
+@pytest.mark.asyncio
+async def test_update_widget_clears_previous_data_cache(client: AsyncClient):
+    """Test updating a widget drops data cached under its previous config."""
+    from app.main import app
+    from app.services.cache import get_cache_service
+
+    cache = InMemoryCache()
+    app.dependency_overrides[get_cache_service] = lambda: cache
+    try:
+        widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+        old_key = widget_registry.get_widget(widget_id).get_cache_key()
+        cache.store[old_key] = {"temperature": 20}
+
+        response = await client.put(
+            f"/api/widgets/{widget_id}", json={"config": {"location": "Brno"}}
+        )
+        assert response.status_code == 200
+        assert old_key not in cache.store
+    finally:
+        del app.dependency_overrides[get_cache_service]
+
+
+@pytest.mark.asyncio
+async def test_list_widgets_etag(client: AsyncClient):
+    """Test conditional GET on the widget list returns 304 until a widget changes."""
+    from app.main import app
+    from app.services.cache import get_cache_service
+
+    cache = InMemoryCache()
+    app.dependency_overrides[get_cache_service] = lambda: cache
+    try:
+        etag = (await client.get("/api/widgets/")).headers["etag"]
+
+        # Served from cache using the stored ETag
+        response = await client.get("/api/widgets/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        await client.post("/api/widgets/", json=WEATHER_WIDGET)
+
+        response = await client.get("/api/widgets/", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+    finally:
+        del app.dependency_overrides[get_cache_service]
+
+
+@pytest.mark.asyncio
+async def test_widget_data_etag(client: AsyncClient):
+    """Test conditional GET on cached widget data returns 304."""
+    from app.main import app
+    from app.services.cache import get_cache_service
+
+    cache = InMemoryCache()
+    app.dependency_overrides[get_cache_service] = lambda: cache
+    try:
+        widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+        cache.store[widget_registry.get_widget(widget_id).get_cache_key()] = {"temperature": 20}
+
+        response = await client.get(f"/api/widgets/{widget_id}/data")
+        assert response.json() == {"temperature": 20}
+        etag = response.headers["etag"]
+
+        response = await client.get(
+            f"/api/widgets/{widget_id}/data", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+    finally:
+        del app.dependency_overrides[get_cache_service]
+
+
+@pytest.mark.asyncio
+async def test_widget_config_stored_as_json_object(client: AsyncClient, db_session):
+    """Test widget config is stored as a JSON object, not a JSON-encoded string."""
+    from sqlalchemy import text
+
+    widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+
+    result = await db_session.execute(
+        text(
+            "SELECT json_type(config), json_extract(config, '$.location') FROM widgets"
+            " WHERE widget_id = :widget_id"
+        ),
+        {"widget_id": widget_id},
+    )
+    assert result.one() == ("object", "Prague")
+
+
+@pytest.mark.asyncio
+async def test_delete_habit_widget_removes_orphaned_habit(client: AsyncClient, db_session):
+    """Test deleting the last widget of a habit also deletes the habit."""
+    from sqlalchemy import select
+
+    from app.models.habit import Habit
+
+    response = await client.post(
+        "/api/widgets/",
+        json={
+            "type": "habit_tracking",
+            "position": {"row": 0, "col": 0, "width": 2, "height": 2},
+            "refresh_interval": 300,
+            "config": {},
+            "create_habit": {"name": "Read", "description": "Read every day"},
+        },
+    )
+    assert response.status_code == 201
+    widget_id = response.json()["id"]
+    assert (await db_session.execute(select(Habit))).scalars().all()
+
+    response = await client.delete(f"/api/widgets/{widget_id}")
+    assert response.status_code == 204
+    assert (await db_session.execute(select(Habit))).scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_refresh_widget_overwrites_cached_data(client: AsyncClient, monkeypatch):
+    """Test refresh replaces cached data, and keeps it when the fetch fails."""
+    from app.main import app
+    from app.services.cache import get_cache_service
+
+    cache = InMemoryCache()
+    app.dependency_overrides[get_cache_service] = lambda: cache
+    try:
+        widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+        widget = widget_registry.get_widget(widget_id)
+        cache.store[widget.get_cache_key()] = {"temperature": 20}
+
+        async def fetched():
+            return {"temperature": 25}
+
+        monkeypatch.setattr(widget, "get_data", fetched)
+        response = await client.post(f"/api/widgets/{widget_id}/refresh")
+        assert response.json() == {"temperature": 25}
+        assert cache.store[widget.get_cache_key()] == {"temperature": 25}
+
+        async def failed():
+            return {"error": "upstream unavailable"}
+
+        monkeypatch.setattr(widget, "get_data", failed)
+        response = await client.post(f"/api/widgets/{widget_id}/refresh")
+        assert response.json() == {"error": "upstream unavailable"}
+        assert cache.store[widget.get_cache_key()] == {"temperature": 25}
+    finally:
+        del app.dependency_overrides[get_cache_service]
+
+
+@pytest.mark.asyncio
+async def test_enabled_widget_queries_use_partial_index(db_session):
+    """Test loading enabled widgets is served by the partial index on SQLite."""
+    from sqlalchemy import select, text
+
+    from app.models.widget import Widget
+
+    async def query_plan(statement):
+        compiled = statement.compile(
+            dialect=db_session.bind.dialect, compile_kwargs={"literal_binds": True}
+        )
+        result = await db_session.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+        return " ".join(row[-1] for row in result)
+
+    # Loading all enabled widgets has no other usable index
+    plan = await query_plan(select(Widget).where(Widget.enabled.is_(True)))
+    assert "ix_widgets_enabled_user" in plan
+
+    # Without statistics SQLite may pick either user_id index for a single user
+    plan = await query_plan(select(Widget).where(Widget.enabled.is_(True), Widget.user_id == 1))
+    assert "USING INDEX" in plan
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_invalidate_before_and_after_write(client: AsyncClient):
+    """Test widget writes clear cached entries both before the write and after commit."""
+    from app.main import app
+    from app.services.cache import get_cache_service
+
+    class RecordingCache(InMemoryCache):
+        def __init__(self):
+            super().__init__()
+            self.invalidations = []
+
+        async def delete_many(self, keys):
+            keys = list(keys)
+            self.invalidations.append(keys)
+            await super().delete_many(keys)
+
+    cache = RecordingCache()
+    app.dependency_overrides[get_cache_service] = lambda: cache
+    try:
+        widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+
+        await client.put(f"/api/widgets/{widget_id}", json={"enabled": False})
+        assert len(cache.invalidations) == 2
+        assert cache.invalidations[0] == cache.invalidations[1]
+
+        await client.delete(f"/api/widgets/{widget_id}")
+        assert len(cache.invalidations) == 4
+    finally:
+        del app.dependency_overrides[get_cache_service]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_force_refresh_fetches_once(client: AsyncClient, monkeypatch):
+    """Test concurrent force refreshes of one widget share a single upstream fetch."""
+    widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+    widget = widget_registry.get_widget(widget_id)
+    calls = 0
+
+    async def fetched():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"temperature": 25}
+
+    monkeypatch.setattr(widget, "get_data", fetched)
+    responses = await asyncio.gather(
+        *(
+            client.get(f"/api/widgets/{widget_id}/data", params={"force_refresh": True})
+            for _ in range(5)
+        )
+    )
+
+    assert calls == 1
+    assert [response.json() for response in responses] == [{"temperature": 25}] * 5
+
+
+@pytest.mark.asyncio
+async def test_other_users_write_keeps_widget_data_cached(
+    client: AsyncClient, db_session, test_user
+):
+    """Test a write to another user's widget fails without dropping that widget's cached data."""
+    from app.api.dependencies import require_auth
+    from app.main import app
+    from app.models.user import User
+    from app.services.cache import get_cache_service
+
+    other_user = User(email="other@example.com", google_id="other_google_id", name="Other")
+    db_session.add(other_user)
+    await db_session.commit()
+
+    cache = InMemoryCache()
+    app.dependency_overrides[get_cache_service] = lambda: cache
+    try:
+        widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+        data_key = widget_registry.get_widget(widget_id).get_cache_key()
+        cache.store[data_key] = {"temperature": 20}
+
+        app.dependency_overrides[require_auth] = lambda: other_user
+        response = await client.put(f"/api/widgets/{widget_id}", json={"enabled": False})
+        assert response.status_code == 404
+        response = await client.delete(f"/api/widgets/{widget_id}")
+        assert response.status_code == 404
+        assert cache.store[data_key] == {"temperature": 20}
+
+        app.dependency_overrides[require_auth] = lambda: test_user
+        response = await client.delete(f"/api/widgets/{widget_id}")
+        assert response.status_code == 204
+        assert data_key not in cache.store
+    finally:
+        del app.dependency_overrides[get_cache_service]
+
+
+@pytest.mark.asyncio
+async def test_reload_widget_config_keeps_other_users_widgets(
+    client: AsyncClient, db_session, test_user
+):
+    """Test reloading drops and re-caches only the current user's widgets."""
+    from app.main import app
+    from app.models.user import User
+    from app.models.widget import Widget
+    from app.services.cache import get_cache_service
+
+    other_user = User(email="other@example.com", google_id="other_google_id", name="Other")
+    db_session.add(other_user)
+    await db_session.commit()
+    db_session.add(
+        Widget(
+            user_id=other_user.id,
+            widget_id="other-weather",
+            widget_type="weather",
+            config={"location": "Brno"},
+        )
+    )
+    await db_session.commit()
+    widget_registry.create_widget(
+        "other-weather", "weather", {"location": "Brno", "user_id": other_user.id}
+    )
+
+    cache = InMemoryCache()
+    app.dependency_overrides[get_cache_service] = lambda: cache
+    try:
+        widget_id = (await client.post("/api/widgets/", json=WEATHER_WIDGET)).json()["id"]
+        data_key = widget_registry.get_widget(widget_id).get_cache_key()
+        other_key = widget_registry.get_widget("other-weather").get_cache_key()
+        cache.store[data_key] = {"temperature": 20}
+        cache.store[other_key] = {"temperature": 10}
+
+        response = await client.post("/api/widgets/reload-config")
+        assert response.status_code == 200
+        assert response.json()["widget_count"] == 1
+        assert data_key not in cache.store
+        assert cache.store[other_key] == {"temperature": 10}
+        assert widget_registry.get_widget(widget_id) is not None
+        assert widget_registry.get_widget("other-weather") is not None
+    finally:
+        del app.dependency_overrides[get_cache_service]
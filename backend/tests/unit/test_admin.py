@@ -2,6 +2,7 @@
 
 import pytest
 from datetime import datetime, timezone
+import time
 
 from app.constants import ADMIN_EMAIL
 from app.models.user import User, UserResponse, UserRole, UserUpdate
@@ -396,7 +397,7 @@ class TestSystemStatusModels:
         time2 = get_startup_time()
         assert time1 == time2
         assert isinstance(time1, float)
-        assert time1 > 0
+        assert 0 < time1 <= time.monotonic()
 
 
 class TestCacheServiceHealthCheck:
@@ -0,0 +1,175 @@
+"""Tests for the cache service's process-local widget data layer."""
+
+import fnmatch
+
+import orjson
+import pytest
+
+from app.constants import CACHE_INVALIDATION_CHANNEL
+from app.services.cache import CacheService
+
+
+class FakePipeline:
+    """Records pipelined commands and applies them to a FakeRedis."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, args in self.commands]
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for redis.asyncio.Redis."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.published = []
+        self.get_calls = 0
+
+    async def get(self, key):
+        self.get_calls += 1
+        return self.store.get(key)
+
+    async def set(self, key, value):
+        self.store[key] = value
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    async def pttl(self, key):
+        if key not in self.store:
+            return -2
+        return self.ttls[key] * 1000 if key in self.ttls else -1
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+    async def unlink(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, orjson.loads(message)))
+
+    async def scan_iter(self, match=None, count=None):
+        for key in list(self.store):
+            if match is None or fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def cache():
+    service = CacheService()
+    service._enabled = True
+    service._redis = FakeRedis()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_widget_data_served_from_local_cache(cache):
+    """Test widget data hits the local cache without a Redis round-trip."""
+    await cache.set("widget:weather:w1:abc", {"temperature": 20}, ttl=600)
+
+    assert await cache.get("widget:weather:w1:abc") == {"temperature": 20}
+    assert cache._redis.get_calls == 0
+    assert cache._redis.published == [
+        (
+            CACHE_INVALIDATION_CHANNEL,
+            {"origin": cache._instance_id, "keys": ["widget:weather:w1:abc"]},
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_other_keys_bypass_local_cache(cache):
+    """Test non widget data keys always read from Redis and publish nothing."""
+    await cache.set("widgets:list:1", {"ts": 1, "body": []})
+
+    assert await cache.get("widgets:list:1") == {"ts": 1, "body": []}
+    assert cache._redis.get_calls == 1
+    assert cache._redis.published == []
+
+
+@pytest.mark.asyncio
+async def test_delete_evicts_local_cache(cache):
+    """Test deleting a widget data key evicts it locally and publishes it."""
+    await cache.set("widget:weather:w1:abc", {"temperature": 20}, ttl=600)
+    await cache.delete_many(["widgets:list:1", "widget:weather:w1:abc"])
+
+    assert await cache.get("widget:weather:w1:abc") is None
+    assert cache._redis.published[-1][1]["keys"] == ["widget:weather:w1:abc"]
+
+
+@pytest.mark.asyncio
+async def test_invalidation_from_other_worker_evicts_local_cache(cache):
+    """Test keys published by another worker are evicted, but own messages are ignored."""
+    await cache.set("widget:weather:w1:abc", {"temperature": 20}, ttl=600)
+
+    cache._handle_invalidation(
+        orjson.dumps({"origin": cache._instance_id, "keys": ["widget:weather:w1:abc"]})
+    )
+    assert "widget:weather:w1:abc" in cache._local
+
+    cache._handle_invalidation(orjson.dumps({"origin": "other", "keys": ["widget:weather:w1:abc"]}))
+    assert "widget:weather:w1:abc" not in cache._local
+
+
+@pytest.mark.asyncio
+async def test_delete_pattern_unlinks_matching_keys(cache):
+    """Test pattern deletes drop matching keys everywhere and leave other keys alone."""
+    await cache.set("widget:weather:w1:abc", {"temperature": 20}, ttl=600)
+    await cache.set("widget:market:w2:def", {"stocks": []}, ttl=600)
+    await cache.set("widgets:list:v2:1", {"ts": 1})
+
+    assert await cache.delete_pattern("widget:*") == 2
+
+    assert set(cache._redis.store) == {"widgets:list:v2:1"}
+    assert cache._local == {}
+    assert sorted(cache._redis.published[-1][1]["keys"]) == [
+        "widget:market:w2:def",
+        "widget:weather:w1:abc",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_local_cache_not_filled_when_invalidated_during_read(cache):
+    """Test a value read from Redis is not cached locally if the key was invalidated meanwhile."""
+    key = "widget:weather:w1:abc"
+    cache._redis.store[key] = orjson.dumps({"temperature": 20})
+    redis_get = cache._redis.get
+
+    async def get_racing_invalidation(requested_key):
+        value = await redis_get(requested_key)
+        cache._handle_invalidation(orjson.dumps({"origin": "other", "keys": [key]}))
+        return value
+
+    cache._redis.get = get_racing_invalidation
+    assert await cache.get(key) == {"temperature": 20}
+    assert key not in cache._local
+
+    cache._redis.get = redis_get
+    assert await cache.get(key) == {"temperature": 20}
+    assert key in cache._local
+
+
+@pytest.mark.asyncio
+async def test_local_cache_ttl_capped_at_redis_ttl(cache):
+    """Test a value read from Redis is cached locally no longer than the key has left."""
+    import time
+
+    key = "widget:weather:w1:abc"
+    cache._redis.store[key] = orjson.dumps({"temperature": 20})
+    cache._redis.ttls[key] = 2
+
+    assert await cache.get(key) == {"temperature": 20}
+    assert cache._local[key][0] <= time.monotonic() + 2
@@ -1,11 +1,14 @@
 """Tests for security-related configuration validation."""
 
 import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from app.config import Settings
+from app.config import Settings, get_settings, settings
 
 
 def test_secret_key_requires_minimum_length():
@@ -93,3 +96,29 @@ def test_cors_default_origins_when_not_set():
         # Restore environment
         if env_backup is not None:
             os.environ["CORS_ORIGINS"] = env_backup
+
+
+def test_get_settings_returns_shared_instance():
+    """Test the settings accessor parses the environment once and reuses the result."""
+    assert get_settings() is get_settings()
+    assert get_settings() is settings
+
+
+def test_settings_resolved_lazily_on_first_access():
+    """Test importing app.config does not parse the environment until settings is accessed."""
+    code = (
+        "import app.config as config\n"
+        "assert config.get_settings.cache_info().currsize == 0\n"
+        "from app.config import settings\n"
+        "assert config.get_settings.cache_info().currsize == 1\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parents[2])
+
+
+def test_cors_origin_regex_blank_is_unset():
+    """A blank CORS_ORIGIN_REGEX, as in the .env examples, should not allow any origin."""
+    key = "a-secure-secret-key-with-sufficient-length-123456"
+    with patch.dict(os.environ, {"CORS_ORIGIN_REGEX": " "}, clear=False):
+        assert Settings(SECRET_KEY=key).CORS_ORIGIN_REGEX is None
+    with patch.dict(os.environ, {"CORS_ORIGIN_REGEX": r"https://localhost:\d+"}, clear=False):
+        assert Settings(SECRET_KEY=key).CORS_ORIGIN_REGEX == r"https://localhost:\d+"
@@ -0,0 +1,175 @@
+"""Tests for database engine configuration helpers."""
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app import migrations
+from app.config import settings
+from app.migrations import run_migrations
+from app.services.database import get_engine_connect_args, get_engine_pool_args, set_sqlite_pragmas
+
+
+def test_connect_args_per_driver():
+    """Test the statement cache argument matches the driver."""
+    assert get_engine_connect_args("sqlite+aiosqlite:///data/home.db", 100) == {
+        "cached_statements": 100
+    }
+    assert get_engine_connect_args("postgresql+asyncpg://db/home", 100) == {
+        "prepared_statement_cache_size": 100,
+        "statement_cache_size": 100,
+    }
+    assert get_engine_connect_args("mysql+aiomysql://db/home", 100) == {}
+
+
+def test_pool_args_for_file_database():
+    """Test queue pool sizing is applied to file and server databases."""
+    args = get_engine_pool_args("sqlite+aiosqlite:////data/home.db")
+
+    assert args["pool_size"] == settings.DATABASE_POOL_SIZE
+    assert args["max_overflow"] == settings.DATABASE_MAX_OVERFLOW
+    assert args["pool_pre_ping"] is True
+    assert args["poolclass"] is AsyncAdaptedQueuePool
+    assert "poolclass" not in get_engine_pool_args("postgresql+asyncpg://db/home")
+
+
+def test_pool_args_skipped_for_memory_database():
+    """Test in-memory SQLite gets no queue pool arguments."""
+    assert get_engine_pool_args("sqlite+aiosqlite:///:memory:") == {}
+    assert get_engine_pool_args("sqlite+aiosqlite://") == {}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_pragmas_applied_on_connect(tmp_path):
+    """Test new SQLite connections run in WAL mode with relaxed fsync and a larger cache."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'home.db'}")
+    event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+    try:
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            # NORMAL
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1
+            # MEMORY
+            assert (await conn.execute(text("PRAGMA temp_store"))).scalar() == 2
+            assert (await conn.execute(text("PRAGMA cache_size"))).scalar() == -64000
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_startup_migrations_run_on_fresh_schema(test_db):
+    """Test every startup migration succeeds on a freshly created schema, and is idempotent."""
+    assert await run_migrations(test_db) is True
+    assert await run_migrations(test_db) is True
+
+
+@pytest.mark.asyncio
+async def test_startup_migrations_skip_ddl_when_schema_is_current(test_db):
+    """Test migrations check the schema snapshot and run no DDL or writes when up to date."""
+    assert await run_migrations(test_db) is True
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.strip().upper())
+
+    event.listen(test_db.sync_engine, "before_cursor_execute", record_statement)
+    try:
+        assert await run_migrations(test_db) is True
+    finally:
+        event.remove(test_db.sync_engine, "before_cursor_execute", record_statement)
+
+    assert not [s for s in statements if s.startswith(("ALTER TABLE", "CREATE TABLE", "UPDATE"))]
+
+
+@pytest.mark.asyncio
+async def test_startup_migrations_share_one_connection_on_sqlite(test_db):
+    """Test all SQLite migrations run on a single pooled connection."""
+    checkouts = []
+
+    def record_checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.append(connection_record)
+
+    event.listen(test_db.sync_engine, "checkout", record_checkout)
+    try:
+        assert await run_migrations(test_db) is True
+    finally:
+        event.remove(test_db.sync_engine, "checkout", record_checkout)
+
+    assert len(checkouts) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_migration_stops_later_phases(test_db, monkeypatch):
+    """Test a failing migration is reported and the phases depending on it are skipped."""
+    calls = []
+
+    async def succeeds(conn, schema):
+        calls.append("succeeds")
+
+    async def fails(conn, schema):
+        calls.append("fails")
+        raise RuntimeError("boom")
+
+    async def dependent(conn, schema):
+        calls.append("dependent")
+
+    monkeypatch.setattr(migrations, "MIGRATION_PHASES", ((fails, succeeds), (dependent,)))
+
+    assert await run_migrations(test_db) is False
+    assert calls == ["fails", "succeeds"]
+
+
+@pytest.mark.asyncio
+async def test_add_user_id_migration_assigns_first_user(tmp_path):
+    """Test user_id columns and indexes are added to legacy tables, defaulting to the first user."""
+    from app.migrations import add_user_id_to_tables
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'home.db'}")
+    try:
+        async with engine.connect() as conn:
+            async with conn.begin():
+                await conn.exec_driver_sql("CREATE TABLE users (id INTEGER PRIMARY KEY)")
+                await conn.exec_driver_sql("INSERT INTO users (id) VALUES (7)")
+                for table in ("bookmarks", "widgets", "sections", "preferences"):
+                    await conn.exec_driver_sql(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY)")
+                await conn.exec_driver_sql("INSERT INTO bookmarks (id) VALUES (1)")
+
+            await add_user_id_to_tables.run_migration(conn, {"bookmarks": {"id"}})
+
+            result = await conn.exec_driver_sql("SELECT user_id FROM bookmarks")
+            assert result.scalar() == 7
+            result = await conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'ix_%'"
+            )
+            assert sorted(row[0] for row in result) == [
+                "ix_bookmarks_user_id",
+                "ix_preferences_user_id",
+                "ix_sections_user_id",
+                "ix_widgets_user_id",
+            ]
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_convert_widget_config_resets_invalid_configs(tmp_path):
+    """Test widget configs that are not JSON objects are reset to an empty object."""
+    from app.migrations import convert_widget_config_to_json
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'home.db'}")
+    try:
+        async with engine.connect() as conn:
+            async with conn.begin():
+                await conn.exec_driver_sql("CREATE TABLE widgets (id INTEGER, config TEXT)")
+                await conn.exec_driver_sql(
+                    "INSERT INTO widgets VALUES (1, '{\"a\": 1}'), (2, 'oops'), (3, '[1]')"
+                )
+
+            await convert_widget_config_to_json.run_migration(conn, {"widgets": {"config"}})
+
+            result = await conn.exec_driver_sql("SELECT config FROM widgets ORDER BY id")
+            assert [row[0] for row in result] == ['{"a": 1}', "{}", "{}"]
+    finally:
+        await engine.dispose()
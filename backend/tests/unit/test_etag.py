@@ -0,0 +1,52 @@
+"""Tests for HTTP ETag utilities."""
+
+from starlette.requests import Request
+
+from app.utils.etag import compute_etag, compute_etag_bytes, is_not_modified
+
+
+def _request(if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "headers": headers})
+
+
+def test_compute_etag_is_weak_and_stable():
+    """Test ETags are weak and independent of dict key order."""
+    etag = compute_etag({"a": 1, "b": [1, 2]})
+    assert etag.startswith('W/"')
+    assert etag == compute_etag({"b": [1, 2], "a": 1})
+    assert etag != compute_etag({"a": 2, "b": [1, 2]})
+
+
+def test_is_not_modified_matches():
+    """Test matching, weak-comparison and wildcard If-None-Match values."""
+    etag = compute_etag([1, 2, 3])
+    assert is_not_modified(_request(etag), etag)
+    assert is_not_modified(_request(etag.removeprefix("W/")), etag)
+    assert is_not_modified(_request(f'"other", {etag}'), etag)
+    assert is_not_modified(_request("*"), etag)
+
+
+def test_is_not_modified_mismatch():
+    """Test missing or different If-None-Match values do not match."""
+    etag = compute_etag([1, 2, 3])
+    assert not is_not_modified(_request(), etag)
+    assert not is_not_modified(_request('W/"other"'), etag)
+
+
+def test_compute_etag_handles_non_json_values():
+    """Test payloads with datetimes and non-string keys still hash deterministically."""
+    from datetime import datetime
+
+    payload = {"updated": datetime(2024, 1, 1), 1: "one"}
+    assert compute_etag(payload) == compute_etag(dict(reversed(payload.items())))
+
+
+def test_compute_etag_bytes_matches_payload():
+    """Test ETags of encoded bodies are weak and change with the bytes."""
+    etag = compute_etag_bytes(b"[1,2,3]")
+    assert etag.startswith('W/"')
+    assert etag == compute_etag_bytes(b"[1,2,3]")
+    assert etag != compute_etag_bytes(b"[1,2,4]")
@@ -1,10 +1,27 @@
 """Tests for logging configuration module."""
 
+import io
+import json
 import logging
 import os
+import queue
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
-from app.logging_config import setup_logging
+import pytest
+
+from app.logging_config import (
+    CustomJsonFormatter,
+    _BatchingQueueListener,
+    _BatchingStreamHandler,
+    _RecordQueueHandler,
+    finish_request_log,
+    log_event,
+    setup_logging,
+    start_request_log,
+    stop_logging,
+)
 
 
 class TestSetupLoggingThirdPartyLogLevels:
@@ -64,6 +81,11 @@ class TestSetupLoggingThirdPartyLogLevels:
         assert logging.getLogger("sqlalchemy.engine").level == logging.DEBUG
         assert logging.getLogger("apscheduler").level == logging.ERROR
 
+    def test_setup_logging_rejects_positional_arguments(self):
+        """Test the log levels can only be passed by keyword."""
+        with pytest.raises(TypeError):
+            setup_logging("DEBUG")
+
     def test_invalid_log_level_falls_back_to_default(self):
         """Test that invalid log level falls back to default."""
         # Invalid log level should fall back to default (WARNING for uvicorn.access)
@@ -116,3 +138,175 @@ class TestSettingsThirdPartyLogLevels:
             assert settings.UVICORN_ERROR_LOG_LEVEL == "WARNING"
             assert settings.SQLALCHEMY_ENGINE_LOG_LEVEL == "ERROR"
             assert settings.APSCHEDULER_LOG_LEVEL == "CRITICAL"
+
+
+class TestRequestLogAccumulator:
+    """Tests for per-request log field accumulation."""
+
+    def test_fields_accumulate_within_request(self):
+        """Test log_event fields are returned when the request finishes."""
+        token = start_request_log()
+        log_event(widget_id="w1", cache_hit=False)
+        log_event(widget_type="weather")
+        fields = finish_request_log(token)
+        assert fields == {"widget_id": "w1", "cache_hit": False, "widget_type": "weather"}
+
+    def test_fields_reset_after_request(self):
+        """Test fields do not leak into the next request."""
+        token = start_request_log()
+        log_event(widget_id="w1")
+        finish_request_log(token)
+
+        token = start_request_log()
+        assert finish_request_log(token) == {}
+
+    def test_request_log_initial_fields(self):
+        """Test fields bound when the request starts are returned with the recorded ones."""
+        token = start_request_log(method="GET", path="/api/widgets/")
+        log_event(widget_id="w1")
+        fields = finish_request_log(token)
+        assert fields == {"method": "GET", "path": "/api/widgets/", "widget_id": "w1"}
+
+    def test_log_event_outside_request_is_noop(self):
+        """Test log_event without an active request does not raise."""
+        log_event(widget_id="w1")
+
+
+class TestCustomJsonFormatter:
+    """Tests for JSON log record serialization."""
+
+    def test_formats_non_json_values(self):
+        """Test values orjson cannot encode natively fall back to str."""
+        formatter = CustomJsonFormatter("%(message)s")
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", None, None)
+        record.path = Path("/tmp/x")
+        output = json.loads(formatter.format(record))
+        assert output["message"] == "hello"
+        assert output["path"] == "/tmp/x"
+        assert output["level"] == "INFO"
+
+    def test_extra_fields_and_exception(self):
+        """Test extras are copied, private attributes skipped, and tracebacks rendered once."""
+        formatter = CustomJsonFormatter("%(message)s")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed", None, exc_info)
+        record.widget_id = "w1"
+        record._private = "hidden"
+
+        with patch.object(formatter, "formatException", wraps=formatter.formatException) as fmt:
+            output = json.loads(formatter.format(record))
+
+        assert fmt.call_count == 1
+        assert output["widget_id"] == "w1"
+        assert "_private" not in output
+        assert "ValueError: boom" in output["exception"]
+        assert output["exception"] == output["exc_info"]
+
+    def test_timestamp_is_utc_with_microseconds(self):
+        """Test the timestamp is RFC 3339 UTC with a real microsecond component."""
+        formatter = CustomJsonFormatter("%(message)s")
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "hello", None, None)
+        record.created = 1700000000.123456
+        output = json.loads(formatter.format(record))
+        assert output["timestamp"] == "2023-11-14T22:13:20.123456Z"
+
+
+class TestQueuedLogging:
+    """Tests for writing log records from the background listener."""
+
+    def test_setup_replaces_and_closes_existing_handlers(self):
+        """Test repeated setup leaves one queue handler and closes the handlers it replaces."""
+        stale = logging.StreamHandler(io.StringIO())
+        logging.getLogger().addHandler(stale)
+        with patch.object(stale, "close") as close:
+            setup_logging()
+        close.assert_called_once()
+        handlers = logging.getLogger().handlers
+        assert [type(handler) for handler in handlers] == [_RecordQueueHandler]
+
+    def test_records_written_by_listener(self):
+        """Test records are enqueued and written as JSON, keeping extras and tracebacks."""
+        output = io.StringIO()
+        try:
+            with patch("sys.stdout", new=output):
+                setup_logging()
+            root_logger = logging.getLogger()
+            assert [type(handler) for handler in root_logger.handlers] == [_RecordQueueHandler]
+
+            logger = logging.getLogger("test.queue")
+            logger.info("hello %s", "world", extra={"widget_id": "w1"})
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.error("failed", exc_info=True)
+            stop_logging()
+        finally:
+            setup_logging()
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        hello = next(record for record in records if record["message"] == "hello world")
+        assert hello["widget_id"] == "w1"
+        failed = next(record for record in records if record["message"] == "failed")
+        assert "ValueError: boom" in failed["exception"]
+
+    def test_records_after_stop_written_directly(self):
+        """Test stopping the listener removes the queue handler, so later records still appear."""
+        output = io.StringIO()
+        try:
+            with patch("sys.stdout", new=output):
+                setup_logging()
+            stop_logging()
+            root_logger = logging.getLogger()
+            assert [type(handler) for handler in root_logger.handlers] == [logging.StreamHandler]
+
+            logging.getLogger("test.queue").warning("after stop")
+        finally:
+            setup_logging()
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert any(record["message"] == "after stop" for record in records)
+
+    def test_listener_flushes_once_queue_is_empty(self):
+        """Test buffered records are only flushed after the listener drains the queue."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8")
+        handler = _BatchingStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log_queue = queue.SimpleQueue()
+        listener = _BatchingQueueListener(log_queue, handler)
+
+        def record(message):
+            return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+        log_queue.put(record("second"))
+        listener.handle(record("first"))
+        assert raw.getvalue() == b""
+
+        listener.handle(log_queue.get())
+        assert raw.getvalue() == b"first\nsecond\n"
+
+    def test_listener_waits_flush_interval_before_flushing(self):
+        """Test a flush interval defers the flush until no record arrives within it."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8")
+        handler = _BatchingStreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log_queue = queue.SimpleQueue()
+        listener = _BatchingQueueListener(log_queue, handler, flush_interval=0.01)
+
+        def record(message):
+            return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+        listener.handle(record("first"))
+        assert raw.getvalue() == b""
+
+        log_queue.put(record("second"))
+        listener.handle(listener.dequeue(True))
+        assert raw.getvalue() == b""
+
+        with pytest.raises(queue.Empty):
+            listener.dequeue(False)
+        assert raw.getvalue() == b"first\nsecond\n"
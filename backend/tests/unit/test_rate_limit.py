@@ -0,0 +1,70 @@
+"""Tests for rate limiting."""
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.services.rate_limit import TokenBucketLimiter, token_bucket_limit
+
+
+class TestTokenBucketLimiter:
+    """Test TokenBucketLimiter behaviour."""
+
+    def test_allows_burst_then_limits(self):
+        """Test requests up to the burst size are allowed, then rejected."""
+        limiter = TokenBucketLimiter("3/minute")
+        assert [limiter.hit("client", now=0.0) for _ in range(4)] == [True, True, True, False]
+
+    def test_refills_over_time(self):
+        """Test tokens are refilled at the configured rate."""
+        limiter = TokenBucketLimiter("60/minute")
+        for _ in range(60):
+            assert limiter.hit("client", now=0.0)
+        assert not limiter.hit("client", now=0.5)
+        assert limiter.hit("client", now=1.0)
+
+    def test_keys_are_independent(self):
+        """Test each key has its own bucket."""
+        limiter = TokenBucketLimiter("1/minute")
+        assert limiter.hit("a", now=0.0)
+        assert not limiter.hit("a", now=0.0)
+        assert limiter.hit("b", now=0.0)
+
+    def test_idle_buckets_are_evicted(self):
+        """Test buckets idle for a full window are dropped."""
+        limiter = TokenBucketLimiter("1/minute")
+        limiter._last_eviction = 0.0
+        limiter.hit("a", now=0.0)
+        limiter.hit("b", now=120.0)
+        assert "a" not in limiter._buckets
+        assert "b" in limiter._buckets
+
+    def test_retry_after(self):
+        """Test retry_after reports seconds until the next token."""
+        limiter = TokenBucketLimiter("1/minute")
+        limiter.hit("client", now=0.0)
+        assert limiter.retry_after("client") == 60
+        assert limiter.retry_after("unknown") == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_dependency_raises_429():
+    """Test the dependency raises HTTP 429 once the bucket is empty."""
+    dependency = token_bucket_limit("1/minute")
+    request = Request({"type": "http", "headers": [], "client": ("10.0.0.1", 1234), "path": "/"})
+
+    await dependency(request)
+    with pytest.raises(HTTPException) as exc_info:
+        await dependency(request)
+
+    assert exc_info.value.status_code == 429
+    assert "Retry-After" in exc_info.value.headers
+
+
+def test_shared_limiter_uses_sliding_window_counter():
+    """Test the shared limiter cannot be burst across a fixed window boundary."""
+    from limits.strategies import SlidingWindowCounterRateLimiter
+
+    from app.services.rate_limit import limiter
+
+    assert isinstance(limiter._limiter, SlidingWindowCounterRateLimiter)
@@ -90,3 +90,40 @@ async def test_permissions_policy_restricts_features(client: AsyncClient):
     assert "geolocation=()" in permissions_policy
     assert "microphone=()" in permissions_policy
     assert "camera=()" in permissions_policy
+
+
+@pytest.mark.asyncio
+async def test_security_headers_on_rejected_request(client: AsyncClient):
+    """Verify security headers are also sent on 413 responses, each exactly once."""
+    response = await client.post("/api/widgets/", content=b"x" * (1024 * 1024 + 1))
+    assert response.status_code == 413
+    assert response.headers.get_list("X-Frame-Options") == ["SAMEORIGIN"]
+    assert response.headers.get_list("X-Content-Type-Options") == ["nosniff"]
+
+
+@pytest.mark.asyncio
+async def test_security_headers_replace_endpoint_values():
+    """Verify security headers set by an endpoint are replaced, not duplicated."""
+    from app.main import RequestMiddleware
+
+    async def endpoint(scope, receive, send):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"x-frame-options", b"DENY"), (b"content-type", b"text/plain")],
+            }
+        )
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "headers": [], "query_string": b""}
+    await RequestMiddleware(endpoint)(scope, None, send)
+
+    headers = messages[0]["headers"]
+    assert [value for name, value in headers if name == b"x-frame-options"] == [b"SAMEORIGIN"]
+    assert (b"content-type", b"text/plain") in headers
@@ -0,0 +1,67 @@
+"""Unit tests for single-flight call coalescing."""
+
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    """Test that concurrent calls for one key run the function once."""
+    flight = SingleFlight()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    results = await asyncio.gather(*(flight.do("widget:a", fetch) for _ in range(5)))
+
+    assert calls == 1
+    assert results == [{"value": 1}] * 5
+    assert flight._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_different_keys_run_independently():
+    """Test that calls for different keys are not coalesced."""
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0)
+        return key
+
+    results = await asyncio.gather(
+        flight.do("a", lambda: fetch("a")), flight.do("b", lambda: fetch("b"))
+    )
+
+    assert results == ["a", "b"]
+    assert sorted(calls) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_exception_propagates_to_all_waiters():
+    """Test that a failed call raises in every waiter and is not remembered."""
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        *(flight.do("k", fail) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight._inflight == {}
+
+    async def succeed():
+        return "ok"
+
+    assert await flight.do("k", succeed) == "ok"
@@ -2,6 +2,7 @@
 
 import pytest
 
+from app.services.widget_registry import WidgetRegistry
 from app.widgets.exchange_rate_widget import ExchangeRateWidget
 from app.widgets.weather_widget import WeatherWidget
 
@@ -67,6 +68,18 @@ def test_widget_cache_key_consistency():
     assert widget1.get_cache_key() == widget2.get_cache_key()
 
 
+def test_widget_cache_key_stable_after_config_normalization():
+    """Test the cache key does not change when validation normalizes the config."""
+    from app.widgets.market_widget import MarketWidget
+
+    widget = MarketWidget(widget_id="market-1", config={"stocks": ["AAPL", " "]})
+    cache_key = widget.get_cache_key()
+
+    assert widget.validate_config()
+    assert widget.config["stocks"] == ["AAPL"]
+    assert widget.get_cache_key() == cache_key
+
+
 def test_widget_enabled_flag():
     """Test widget enabled/disabled flag."""
     widget = WeatherWidget(
@@ -76,3 +89,50 @@ def test_widget_enabled_flag():
 
     widget.enabled = True
     assert widget.enabled
+
+
+def test_registry_widget_types():
+    """Test registry exposes registered widget types for listing and lookup."""
+    registry = WidgetRegistry()
+    assert registry.list_widget_types() == ()
+    assert not registry.has_widget_type("weather")
+
+    registry.register(WeatherWidget)
+    registry.register(ExchangeRateWidget)
+
+    assert registry.list_widget_types() == ("weather", "exchange_rate")
+    assert registry.has_widget_type("weather")
+    assert not registry.has_widget_type("news")
+
+
+def test_registry_bulk_load():
+    """Test bulk loading builds instance configs from widget rows and skips unknown types."""
+    from types import SimpleNamespace
+
+    def row(widget_id, widget_type):
+        return SimpleNamespace(
+            widget_id=widget_id,
+            widget_type=widget_type,
+            user_id=7,
+            enabled=True,
+            position_row=1,
+            position_col=2,
+            position_width=3,
+            position_height=4,
+            refresh_interval=600,
+            config={"location": "Prague"},
+        )
+
+    registry = WidgetRegistry()
+    registry.register(WeatherWidget)
+
+    assert registry.bulk_load([row("w1", "weather"), row("n1", "news")]) == 1
+    widget = registry.get_widget("w1")
+    assert widget.config == {
+        "location": "Prague",
+        "enabled": True,
+        "refresh_interval": 600,
+        "user_id": 7,
+        "position": {"row": 1, "col": 2, "width": 3, "height": 4},
+    }
+    assert registry.get_widget("n1") is None